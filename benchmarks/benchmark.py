@@ -0,0 +1,332 @@
+"""Benchmark suite for LinkedList operations and headless GUI frame time.
+
+Usage (from the project root):
+    python -m benchmarks.benchmark --output bench.json
+    python -m benchmarks.benchmark --sizes 1000 10000 --compare bench.json
+
+Every benchmark reports seconds per operation (the best of --repeat runs).
+The GUI benchmarks run under SDL's dummy video driver, so no display is needed.
+With --compare, results are checked against a stored baseline file and the
+exit code is 1 if any benchmark got slower by more than --threshold.
+
+Startup is measured with `python -X importtime` in a fresh interpreter: the
+cumulative import time of each entry point module (main.py for the CLI,
+gui_main.py for pygame), reported as startup.<module>.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import types
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from core.linked_list import LinkedList
+
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_BUDGETS = {'main': 0.15} # seconds of import time allowed per entry point, checked by tests/test_startup.py
+
+
+def make_questions(n: int):
+    """Returns n (question, answer, is_correct) tuples, alternating correct and wrong."""
+    return [(f"Question {i}?", f"Answer {i}", i % 2 == 0) for i in range(n)]
+
+
+def best_of(repeat: int, setup, run) -> float:
+    """Returns the fastest of repeat timings of run(setup())."""
+    best = float('inf')
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# --- LinkedList benchmarks: each returns seconds per operation ---
+
+def bench_add_question(n: int, repeat: int) -> float:
+    questions = make_questions(n)
+    def run(linked_list):
+        for question, answer, is_correct in questions:
+            linked_list.add_question(question, answer, is_correct)
+    return best_of(repeat, LinkedList, run) / n
+
+
+def bench_delete_current_node(n: int, repeat: int) -> float:
+    """Deletes every other node while walking the list, so both head and middle deletes are timed."""
+    questions = make_questions(n)
+    def setup():
+        linked_list = LinkedList()
+        linked_list.extend(questions)
+        return linked_list
+    def run(linked_list):
+        while linked_list.current:
+            linked_list.delete_current_node()
+            linked_list.move_right()
+    return best_of(repeat, setup, run) / (n // 2)
+
+
+def bench_move_right(n: int, repeat: int) -> float:
+    questions = make_questions(n)
+    def setup():
+        linked_list = LinkedList()
+        linked_list.extend(questions)
+        return linked_list
+    def run(linked_list):
+        while linked_list.current:
+            linked_list.move_right()
+    return best_of(repeat, setup, run) / n
+
+
+def bench_playthrough(n: int, repeat: int) -> float:
+    """A full game by a perfect player: confirm correct answers, delete wrong ones."""
+    questions = make_questions(n)
+    def setup():
+        linked_list = LinkedList()
+        linked_list.extend(questions)
+        return linked_list
+    def run(linked_list):
+        while linked_list.current:
+            if linked_list.current.is_correct:
+                linked_list.move_right()
+            else:
+                linked_list.delete_current_node()
+    return best_of(repeat, setup, run) / n
+
+
+def bench_concurrent_walk(n: int, repeat: int, readers: int) -> float:
+    """Reader threads each walk a ConcurrentLinkedList while a player deletes every other node.
+
+    Only the readers are timed, from the moment they start until the last one has
+    finished its walk; the player runs alongside them but is timed on its own by
+    bench_concurrent_delete. Returns seconds per node visited over all readers,
+    i.e. 1 / (aggregate reader nodes per second).
+    """
+    import threading
+    from core.concurrent_list import ConcurrentLinkedList
+    questions = make_questions(n)
+    best = float('inf')
+    for _ in range(repeat):
+        linked_list = ConcurrentLinkedList()
+        linked_list.extend(questions)
+        start_line = threading.Barrier(readers + 2) # readers, player and this thread start together
+        walks = [] # (nodes visited, finish time) per reader
+        def walk():
+            start_line.wait()
+            visited = 0
+            for _ in linked_list:
+                visited += 1
+            walks.append((visited, time.perf_counter()))
+        def play():
+            start_line.wait()
+            cursor = linked_list.cursor()
+            while cursor.current is not None:
+                cursor.delete_current_node()
+                cursor.move_right()
+        threads = [threading.Thread(target=walk) for _ in range(readers)] + [threading.Thread(target=play)]
+        for thread in threads:
+            thread.start()
+        start_line.wait()
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        visited = sum(count for count, _ in walks)
+        best = min(best, (max(finished for _, finished in walks) - start) / visited)
+    return best
+
+
+def bench_concurrent_delete(n: int, repeat: int) -> float:
+    """One player deletes every other node of a ConcurrentLinkedList, with no readers (seconds per delete)."""
+    from core.concurrent_list import ConcurrentLinkedList
+    questions = make_questions(n)
+    def setup():
+        linked_list = ConcurrentLinkedList()
+        linked_list.extend(questions)
+        return linked_list.cursor()
+    def run(cursor):
+        while cursor.current is not None:
+            cursor.delete_current_node()
+            cursor.move_right()
+    return best_of(repeat, setup, run) / (n // 2)
+
+
+# --- GUI benchmarks: each returns seconds per frame ---
+
+def make_gui(n: int):
+    """Builds a TriviaGameGUI on the dummy driver with n questions and the view scrolled to the middle."""
+    from ui.gui import TriviaGameGUI
+    gui = TriviaGameGUI()
+    gui.linked_list.clear()
+    gui.linked_list.extend(make_questions(n))
+    gui.scroll_offset = (n // 2) * (gui.NODE_WIDTH + gui.ARROW_LENGTH)
+    gui.scroll_view(0)
+    gui.feedback_message = "Skipped to next question."
+    gui.feedback_icon = "⏭️"
+    gui.feedback_timer = 10 ** 9 # keep the feedback visible for the whole run
+    return gui
+
+
+def bench_gui_method(n: int, repeat: int, method: str, frames: int = 200) -> float:
+    gui = make_gui(n)
+    draw = getattr(gui, method)
+    def run(_):
+        for _ in range(frames):
+            draw()
+    return best_of(repeat, lambda: None, run) / frames
+
+
+def bench_run_game(n: int, repeat: int, frames: int = 200) -> float:
+    """Times run_game iterations by queueing one 'next' keypress per frame followed by QUIT."""
+    import pygame
+    from pygame.locals import KEYDOWN, K_2, QUIT
+    best = float('inf')
+    for _ in range(repeat):
+        gui = make_gui(n)
+        gui.clock = types.SimpleNamespace(tick=lambda framerate=0: 0) # measure work, not the 60 FPS cap
+        gui.linked_list.current = gui.linked_list.node_at(n // 2)
+        for _ in range(frames):
+            pygame.event.post(pygame.event.Event(KEYDOWN, key=K_2, mod=0, unicode='2', scancode=0))
+        pygame.event.post(pygame.event.Event(QUIT))
+        # run_game drains the whole queue in one iteration, so feed it one event per iteration instead
+        pending = pygame.event.get()
+        original_get = pygame.event.get
+        pygame.event.get = lambda *args, **kwargs: [pending.pop(0)] if pending else []
+        start = time.perf_counter()
+        try:
+            gui.run_game()
+        except SystemExit:
+            pass
+        finally:
+            pygame.event.get = original_get
+        best = min(best, time.perf_counter() - start)
+    return best / frames
+
+
+# --- Startup benchmarks: each returns seconds of import time ---
+
+def import_time(module: str) -> float:
+    """Imports module in a fresh interpreter with -X importtime and returns its cumulative import time.
+
+    Args:
+        - module (str): Module name, importable from the project root (e.g. "main").
+    Returns:
+        - float: Seconds spent importing module and everything it pulled in.
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                             cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+    for line in process.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1e6
+    raise ValueError(f"-X importtime did not report {module}")
+
+
+def bench_import_time(module: str, repeat: int) -> float:
+    return min(import_time(module) for _ in range(repeat))
+
+
+LINKED_LIST_BENCHMARKS = {
+    'linked_list.add_question': bench_add_question,
+    'linked_list.delete_current_node': bench_delete_current_node,
+    'linked_list.move_right': bench_move_right,
+    'linked_list.playthrough': bench_playthrough,
+}
+
+CONCURRENT_BENCHMARKS = {
+    'concurrent.delete_current_node': bench_concurrent_delete,
+    'concurrent.walk_1_reader': lambda n, repeat: bench_concurrent_walk(n, repeat, 1),
+    'concurrent.walk_4_readers': lambda n, repeat: bench_concurrent_walk(n, repeat, 4),
+    'concurrent.walk_8_readers': lambda n, repeat: bench_concurrent_walk(n, repeat, 8),
+}
+
+GUI_BENCHMARKS = {
+    'gui.draw_list': lambda n, repeat: bench_gui_method(n, repeat, 'draw_list'),
+    'gui.draw_header_footer': lambda n, repeat: bench_gui_method(n, repeat, 'draw_header_footer'),
+    'gui.draw_frame': lambda n, repeat: bench_gui_method(n, repeat, 'draw_frame'),
+    'gui.run_game': bench_run_game,
+}
+
+
+def run_benchmarks(sizes, repeat: int = 3, gui: bool = True, log=print) -> dict:
+    """Runs every benchmark at every size.
+
+    Returns:
+        - dict: {"meta": {...}, "results": {"<benchmark>[<size>]": seconds per op}}
+    """
+    benchmarks = dict(LINKED_LIST_BENCHMARKS)
+    benchmarks.update(CONCURRENT_BENCHMARKS)
+    if gui:
+        benchmarks.update(GUI_BENCHMARKS)
+    results = {}
+    for module in (['main', 'gui_main'] if gui else ['main']):
+        key = f"startup.{module}"
+        results[key] = bench_import_time(module, repeat)
+        log(f"{key:45} {results[key] * 1e3:12.3f} ms")
+    for name, bench in benchmarks.items():
+        for n in sizes:
+            key = f"{name}[{n}]"
+            results[key] = bench(n, repeat)
+            if name.startswith('concurrent.walk'):
+                log(f"{key:45} {results[key] * 1e6:12.3f} us/op ({1 / results[key] / 1e6:.2f} M reader nodes/s)")
+            else:
+                log(f"{key:45} {results[key] * 1e6:12.3f} us/op")
+    meta = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+    }
+    return {'meta': meta, 'results': results}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Lists the benchmarks that are more than threshold (e.g. 0.2 = 20%) slower than the baseline.
+
+    Returns:
+        - list: (name, baseline seconds, new seconds) for each regression.
+    """
+    regressions = []
+    for name, seconds in results['results'].items():
+        old = baseline['results'].get(name)
+        if old is not None and seconds > old * (1 + threshold):
+            regressions.append((name, old, seconds))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark LinkedList operations and GUI frame time.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="list sizes to benchmark")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per benchmark, the fastest is kept")
+    parser.add_argument('--no-gui', action='store_true', help="skip the pygame benchmarks")
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--compare', help="baseline JSON file to check for regressions")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed slowdown vs baseline (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.repeat, gui=not args.no_gui)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        for name, old, new in regressions:
+            print(f"REGRESSION {name}: {old * 1e6:.3f} -> {new * 1e6:.3f} us/op ({new / old - 1:+.0%})")
+        if regressions:
+            return 1
+        print("No regressions.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
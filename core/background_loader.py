@@ -0,0 +1,109 @@
+import queue
+import threading
+
+from core.linked_list import LinkedList
+from core.node import Node
+
+_DONE = object() # Queue sentinel: the producer finished (successfully or not)
+
+
+class BackgroundLoader:
+    """
+    Builds a question list on a background thread and hands it over in batches.
+
+    The worker thread runs produce() (which does the file reading and parsing)
+    and links the records it yields into small private LinkedList chains, which
+    it puts on a queue. The consumer calls poll() from its own thread to splice
+    whatever batches have arrived onto its list with LinkedList.concat. So the
+    consumer's list is only ever touched by the consumer, and every node it can
+    reach is already fully linked: it is never seen half-built.
+
+    Batches start small (first_batch records) so the first question shows up
+    almost immediately, then double up to max_batch to keep the queue short.
+    """
+    def __init__(self, produce, node_class=Node, first_batch: int = 64, max_batch: int = 4096) -> None:
+        """
+        Args:
+            - produce (callable): Called on the worker thread; returns an iterable of
+              (question, answer, is_correct) tuples.
+            - node_class (type): Node class of the batches (that of the target list).
+            - first_batch (int): Records in the first batch.
+            - max_batch (int): Largest batch size.
+        """
+        self.produce = produce
+        self.node_class = node_class
+        self.first_batch = first_batch
+        self.max_batch = max_batch
+        self.batches = queue.Queue()
+        self.error = None # Exception raised by produce, if any (available once done)
+        self.done = False # True once poll has consumed every batch
+        self.thread = threading.Thread(target=self._run, name="question-loader", daemon=True)
+
+    def start(self) -> 'BackgroundLoader':
+        self.thread.start()
+        return self
+
+    def _run(self) -> None:
+        """Worker thread: links produced records into batches and queues them."""
+        batch_size = self.first_batch
+        batch = []
+        try:
+            for record in self.produce():
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    self.batches.put(self._link(batch))
+                    batch = []
+                    batch_size = min(batch_size * 2, self.max_batch)
+            if batch:
+                self.batches.put(self._link(batch))
+        except Exception as error: # handed to the consumer, which decides how to report it
+            self.error = error
+        finally:
+            self.batches.put(_DONE)
+
+    def _link(self, records: list) -> LinkedList:
+        chain = LinkedList()
+        chain.node_class = self.node_class
+        chain.extend(records)
+        return chain
+
+    def poll(self, linked_list: LinkedList, max_batches: int = None) -> int:
+        """Splices the batches that have arrived onto the end of linked_list (never blocks).
+
+        If linked_list's current pointer had run off the end, it moves on to the
+        first newly added node.
+
+        Args:
+            - linked_list (LinkedList): The list being filled.
+            - max_batches (int): Splice at most this many batches (None = all queued).
+        Returns:
+            - int: Number of nodes added.
+        """
+        added = 0
+        polled = 0
+        while not self.done and (max_batches is None or polled < max_batches):
+            try:
+                chain = self.batches.get_nowait()
+            except queue.Empty:
+                break
+            polled += 1
+            if chain is _DONE:
+                self.done = True
+                break
+            old_tail = linked_list.tail
+            ran_off_end = old_tail is not None and linked_list.current is None
+            added += len(chain)
+            linked_list.concat(chain)
+            if ran_off_end:
+                linked_list.previous = old_tail
+                linked_list.current = old_tail.next
+        return added
+
+    def wait(self, linked_list: LinkedList) -> int:
+        """Blocks until the producer finishes, splicing every batch onto linked_list.
+
+        Returns:
+            - int: Number of nodes added.
+        """
+        self.thread.join()
+        return self.poll(linked_list)
@@ -0,0 +1,76 @@
+import numpy as np
+
+from core.game import DELETE, NEXT, CONFIRM, ACTION_TOKENS
+
+# Action codes used in action matrices; PAD fills the rows of shorter sessions
+DELETE_CODE = 0
+NEXT_CODE = 1
+CONFIRM_CODE = 2
+PAD = -1
+ACTION_CODES = {DELETE: DELETE_CODE, NEXT: NEXT_CODE, CONFIRM: CONFIRM_CODE}
+
+
+def correct_flags(linked_list) -> np.ndarray:
+    """Loads the is_correct flags of a list into a bool array, in list order (walks the list once)."""
+    flags = []
+    node = linked_list.head
+    while node is not None:
+        flags.append(node.is_correct)
+        node = node.next
+    return np.array(flags, dtype=bool)
+
+
+def encode_sessions(sessions) -> np.ndarray:
+    """Packs recorded sessions into an action matrix.
+
+    Args:
+        - sessions (iterable): One sequence of action tokens per session (see core.game.ACTION_TOKENS).
+    Returns:
+        - np.ndarray: int8 matrix (sessions x longest session), padded with PAD.
+    Raises:
+        - ValueError: If an action token is not recognised.
+    """
+    sessions = [list(actions) for actions in sessions]
+    width = max((len(actions) for actions in sessions), default=0)
+    matrix = np.full((len(sessions), width), PAD, dtype=np.int8)
+    for row, actions in enumerate(sessions):
+        try:
+            matrix[row, :len(actions)] = [ACTION_CODES[ACTION_TOKENS[token]] for token in actions]
+        except KeyError as error:
+            raise ValueError(f"Unknown action: {error.args[0]}")
+    return matrix
+
+
+def score_sessions(correct: np.ndarray, actions: np.ndarray) -> tuple:
+    """Scores many recorded games at once, with the rules of core.game.apply_action.
+
+    Every action (delete, next or confirm) leaves the question it acted on
+    behind the cursor, and nodes ahead of the cursor are never deleted, so the
+    k-th action of a game played from head always acts on the k-th question of
+    the bank. Actions past the end of the bank do nothing. That turns scoring
+    into element-wise comparisons of the action matrix with the flags.
+
+    Args:
+        - correct (np.ndarray): bool is_correct flags of the bank, in list order.
+        - actions (np.ndarray): Action matrix (sessions x steps) of action codes,
+          padded at the end of each row with PAD.
+    Returns:
+        - tuple: (scores, positions, deleted)
+            - scores: int64 array, final score per session
+            - positions: int64 array, bank index of each session's final current
+              question, or -1 if it reached the end (current is None)
+            - deleted: bool matrix (sessions x min(steps, bank size)); True where
+              the session deleted that question. Questions past it all survive.
+    """
+    correct = np.asarray(correct, dtype=bool)
+    actions = np.asarray(actions)
+    played = actions[:, :len(correct)]  # actions past the end of the bank are no-ops
+    flags = correct[:played.shape[1]]
+
+    deleted = played == DELETE_CODE
+    scored = (deleted & ~flags) | ((played == CONFIRM_CODE) & flags)
+    scores = scored.sum(axis=1, dtype=np.int64)
+
+    lengths = (actions != PAD).sum(axis=1, dtype=np.int64)
+    positions = np.where(lengths < len(correct), lengths, -1)
+    return scores, positions, deleted
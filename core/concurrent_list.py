@@ -0,0 +1,193 @@
+import threading
+
+from core.node import Node
+
+
+class ConcurrentNode(Node):
+    """
+    Node for ConcurrentLinkedList: a Node plus its own lock and a deleted mark.
+
+    deleted is set (under the node's lock) just before the node is unlinked, and
+    a deleted node keeps its next pointer, so a reader standing on it can still
+    walk on to the rest of the list.
+    """
+    def __init__(self, question: str, answer: str, is_correct: bool) -> None:
+        super().__init__(question, answer, is_correct)
+        self.lock = threading.Lock()
+        self.deleted = False
+
+
+class ConcurrentLinkedList:
+    """Thread-safe singly linked list of trivia questions, shared by several players.
+
+    - Reads take no locks: iteration and cursor moves just follow .next and skip
+      nodes marked deleted. Walks are weakly consistent: they see every node that
+      was live when they started and not deleted before they got there, and never
+      see a half-linked node, since a node is fully built before it is linked in.
+    - Writes lock only the nodes they change: deleting a node locks it and its
+      predecessor (always in list order, so two deletes cannot deadlock), checks
+      that neither was deleted and that they are still adjacent, then marks and
+      unlinks it. Appending locks only the tail node.
+    - Each player gets their own Cursor (current position), which can be played
+      with core.game.apply_action like a LinkedList.
+
+    A sentinel node sits before the first question so every real node has a
+    predecessor to lock.
+    """
+    node_class = ConcurrentNode
+
+    def __init__(self) -> None:
+        self.sentinel = self.node_class(None, None, None)
+        self.tail = self.sentinel
+        self.size = 0
+        self.size_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of live nodes."""
+        return self.size
+
+    def __iter__(self):
+        """Yields the live nodes from head to tail, without locking."""
+        node = self.sentinel.next
+        while node is not None:
+            if not node.deleted:
+                yield node
+            node = node.next
+
+    @property
+    def head(self):
+        """The first live node, or None if the list is empty."""
+        return self.sentinel.next
+
+    def is_empty(self) -> bool:
+        return self.sentinel.next is None
+
+    def add_question(self, question: str, answer: str, is_correct: bool) -> None:
+        """Appends a trivia question to the end of the list."""
+        new_node = self.node_class(question, answer, is_correct)
+        self._append_chain(new_node, new_node, 1)
+
+    def extend(self, questions) -> None:
+        """Appends a batch of (question, answer, is_correct) tuples, linked privately and spliced on at once."""
+        first = None
+        last = None
+        count = 0
+        for question, answer, is_correct in questions:
+            new_node = self.node_class(question, answer, is_correct)
+            if first is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+        if first is not None:
+            self._append_chain(first, last, count)
+
+    def _append_chain(self, first, last, count: int) -> None:
+        """Links the chain first..last after the current tail."""
+        while True:
+            tail = self.tail
+            with tail.lock:
+                # the tail may have been deleted or appended to while we waited for its lock
+                if tail.deleted or tail.next is not None:
+                    continue
+                tail.next = first
+                self.tail = last
+            break
+        with self.size_lock:
+            self.size += count
+
+    def cursor(self) -> 'Cursor':
+        """Returns a new player cursor starting at the first question."""
+        return Cursor(self)
+
+    def remove(self, node, predecessor=None) -> bool:
+        """Deletes node from the list.
+
+        Args:
+            - node (ConcurrentNode): The node to delete.
+            - predecessor (ConcurrentNode): Hint for the node before it; found by
+              walking from the head if missing or out of date.
+        Returns:
+            - bool: False if node had already been deleted (e.g. by another player).
+        """
+        while not node.deleted:
+            if predecessor is None or predecessor.deleted or predecessor.next is not node:
+                predecessor = self._find_predecessor(node)
+                if predecessor is None:
+                    return False # no longer reachable, so someone else deleted it
+            with predecessor.lock:
+                with node.lock:
+                    if predecessor.deleted or node.deleted or predecessor.next is not node:
+                        predecessor = None # something changed in between, look again
+                        continue
+                    node.deleted = True
+                    predecessor.next = node.next
+                    if self.tail is node:
+                        self.tail = predecessor
+            with self.size_lock:
+                self.size -= 1
+            return True
+        return False
+
+    def _find_predecessor(self, node):
+        """Returns the node linked before node, or None if node is not in the list."""
+        previous = self.sentinel
+        current = previous.next
+        while current is not None and current is not node:
+            previous = current
+            current = current.next
+        return previous if current is node else None
+
+
+class Cursor:
+    """
+    One player's position in a ConcurrentLinkedList.
+
+    Has the current/move_right/delete_current_node/is_empty interface of
+    LinkedList, so it can be played with core.game.apply_action or wrapped in a
+    TriviaSession. If another player deletes the node this cursor is on, the
+    cursor moves on to the next live node the next time current is read.
+    """
+    def __init__(self, linked_list: ConcurrentLinkedList) -> None:
+        self.linked_list = linked_list
+        self.previous = None # Last node this cursor moved past; the hint for deleting current
+        self._node = linked_list.head
+
+    @property
+    def current(self):
+        node = self._node
+        while node is not None and node.deleted:
+            node = node.next
+        self._node = node
+        return node
+
+    @current.setter
+    def current(self, node) -> None:
+        self._node = node
+        self.previous = None
+
+    def move_right(self) -> None:
+        """Moves this cursor to the next live question."""
+        node = self.current
+        if node is None:
+            self.previous = None
+            return
+        self.previous = node
+        self._node = node.next
+
+    def delete_current_node(self) -> bool:
+        """Deletes the current question and moves to the one after it.
+
+        Returns:
+            - bool: False if there was no current question or another player deleted it first.
+        """
+        node = self.current
+        if node is None:
+            return False
+        removed = self.linked_list.remove(node, self.previous)
+        self._node = node.next
+        return removed
+
+    def is_empty(self) -> bool:
+        return self.linked_list.is_empty()
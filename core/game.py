@@ -0,0 +1,136 @@
+from core.linked_list import LinkedList
+
+# --- Player actions ---
+DELETE = 'delete'
+NEXT = 'next'
+CONFIRM = 'confirm'
+ACTIONS = (DELETE, NEXT, CONFIRM)
+
+# Tokens accepted in replayed action streams: action names or the CLI menu numbers
+ACTION_TOKENS = {
+    DELETE: DELETE, '1': DELETE,
+    NEXT: NEXT, '2': NEXT,
+    CONFIRM: CONFIRM, '3': CONFIRM,
+}
+
+# --- Outcomes of an action ---
+CORRECT_DELETE = 'correct_delete'   # deleted a wrong answer (+1)
+WRONG_DELETE = 'wrong_delete'       # deleted a correct answer
+SKIPPED = 'skipped'                 # moved to the next question
+CORRECT_CONFIRM = 'correct_confirm' # confirmed a correct answer (+1)
+WRONG_CONFIRM = 'wrong_confirm'     # confirmed a wrong answer
+NO_QUESTION = 'no_question'         # there was no current question to act on
+
+POINTS = {
+    CORRECT_DELETE: 1,
+    WRONG_DELETE: 0,
+    SKIPPED: 0,
+    CORRECT_CONFIRM: 1,
+    WRONG_CONFIRM: 0,
+    NO_QUESTION: 0,
+}
+
+
+def apply_action(linked_list: LinkedList, action: str) -> str:
+    """Applies one player action to the linked list using the trivia game rules.
+
+    Rules:
+    - delete: +1 if the current answer is wrong; the node is removed either way
+    - next: move to the next question, no points
+    - confirm: +1 if the current answer is correct; move to the next question either way
+
+    This does no input or output, so the CLI, the GUI and the server all share it.
+
+    Args:
+        - linked_list (LinkedList): The list of trivia questions being played.
+        - action (str): One of DELETE, NEXT, CONFIRM.
+    Returns:
+        - str: The outcome; POINTS[outcome] is the score gained.
+    Raises:
+        - ValueError: If action is not a known action.
+    """
+    current = linked_list.current
+    if action == DELETE:
+        if current is None:
+            return NO_QUESTION
+        outcome = WRONG_DELETE if current.is_correct else CORRECT_DELETE
+        linked_list.delete_current_node()
+        return outcome
+    if action == NEXT:
+        linked_list.move_right()
+        return SKIPPED
+    if action == CONFIRM:
+        if current is None:
+            return NO_QUESTION
+        linked_list.move_right()
+        return CORRECT_CONFIRM if current.is_correct else WRONG_CONFIRM
+    raise ValueError(f"Unknown action: {action}")
+
+
+def replay(linked_list: LinkedList, actions, score: int = 0) -> tuple:
+    """Plays a stream of actions against the linked list without any output.
+
+    Follows exactly the rules of apply_action, but inlined into a single loop
+    so that millions of actions per second can be replayed.
+
+    Args:
+        - linked_list (LinkedList): The list to play on (modified in place).
+        - actions (iterable): Action tokens, see ACTION_TOKENS.
+        - score (int): Score to start from.
+    Returns:
+        - tuple: (final score, the surviving linked list)
+    Raises:
+        - ValueError: If an action token is not recognised.
+    """
+    tokens = ACTION_TOKENS
+    delete_current_node = linked_list.delete_current_node
+    move_right = linked_list.move_right
+    for token in actions:
+        action = tokens.get(token)
+        current = linked_list.current
+        if action is DELETE:
+            if current is None:
+                continue
+            if not current.is_correct:
+                score += 1
+            delete_current_node()
+        elif action is NEXT:
+            move_right()
+        elif action is CONFIRM:
+            if current is None:
+                continue
+            if current.is_correct:
+                score += 1
+            move_right()
+        else:
+            raise ValueError(f"Unknown action: {token}")
+    return score, linked_list
+
+
+def read_actions(file):
+    """Yields the whitespace-separated action tokens of an open text file (or stdin)."""
+    for line in file:
+        yield from line.split()
+
+
+class TriviaSession:
+    """
+    State of one trivia game (question list + score), independent of any UI.
+    """
+    def __init__(self, linked_list: LinkedList = None) -> None:
+        self.linked_list = linked_list if linked_list is not None else LinkedList()
+        self.score = 0
+
+    def apply(self, action: str) -> str:
+        """Plays one action and updates the score.
+
+        Returns:
+            - str: The outcome of the action (see apply_action).
+        """
+        outcome = apply_action(self.linked_list, action)
+        self.score += POINTS[outcome]
+        return outcome
+
+    def is_over(self) -> bool:
+        """The game is over once there is no current question."""
+        return self.linked_list.current is None
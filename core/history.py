@@ -0,0 +1,116 @@
+from collections import deque
+
+from core.game import apply_action, POINTS, DELETE, NO_QUESTION
+from core.linked_list import LinkedList
+
+
+class ActionHistory:
+    """
+    Undo/redo for the actions played on a LinkedList, as a log of inverse operations.
+
+    Nothing is copied: each entry only remembers the few pointers an action
+    changed (current and previous, plus for a delete the removed node, the node
+    before it and its PositionIndex slot) and the score before and after.
+    Undoing a delete just links the node back in after that node. That makes apply, undo and redo O(1) (O(log n) on an indexed list) and each
+    entry a fixed size; at most `depth` entries are kept, the oldest dropped first.
+
+    Undo/redo must be applied to the list in the state the log left it in
+    (appending more questions in between is fine), so call clear() whenever the
+    list is replaced or changed some other way.
+    """
+    def __init__(self, depth: int = 100) -> None:
+        """
+        Args:
+            - depth (int): Maximum number of actions that can be undone.
+        """
+        self.undo_log = deque(maxlen=depth)
+        self.redo_log = []
+
+    def can_undo(self) -> bool:
+        return bool(self.undo_log)
+
+    def can_redo(self) -> bool:
+        return bool(self.redo_log)
+
+    def last_action(self):
+        """The action that undo would take back, or None."""
+        return self.undo_log[-1][0] if self.undo_log else None
+
+    def clear(self) -> None:
+        self.undo_log.clear()
+        self.redo_log.clear()
+
+    def apply(self, linked_list: LinkedList, action: str, score: int) -> tuple:
+        """Plays action with apply_action and logs how to undo it.
+
+        Playing a new action discards whatever could have been redone.
+
+        Returns:
+            - tuple: (outcome, new score)
+        """
+        current = linked_list.current
+        previous = linked_list.previous
+        was_head = current is not None and current is linked_list.head
+        slot = getattr(current, 'slot', None)
+        outcome = apply_action(linked_list, action)
+        new_score = score + POINTS[outcome]
+        if outcome == NO_QUESTION:
+            return outcome, new_score # nothing changed, nothing to undo
+
+        if action == DELETE:
+            # delete_current_node leaves previous on the node before the deleted one
+            predecessor = None if was_head else linked_list.previous
+            entry = (action, current, previous, score, new_score, current, predecessor, slot)
+        else:
+            entry = (action, current, previous, score, new_score, linked_list.current, linked_list.previous, None)
+        self.undo_log.append(entry)
+        self.redo_log.clear()
+        return outcome, new_score
+
+    def undo(self, linked_list: LinkedList):
+        """Reverts the last logged action, restoring current and previous.
+
+        Returns:
+            - int: The score before that action, or None if there was nothing to undo.
+        """
+        if not self.undo_log:
+            return None
+        entry = self.undo_log.pop()
+        action, current, previous, score, _, node, predecessor, slot = entry
+        if action == DELETE:
+            # relink from the neighbours as they are now: nodes may have been appended since
+            if predecessor is None:
+                node.next = linked_list.head
+                linked_list.head = node
+            else:
+                node.next = predecessor.next
+                predecessor.next = node
+            if node.next is None:
+                linked_list.tail = node
+            linked_list.size += 1
+            if linked_list.index is not None:
+                linked_list.index.restore(node, slot)
+        linked_list.current = current
+        linked_list.previous = previous
+        self.redo_log.append(entry)
+        return score
+
+    def redo(self, linked_list: LinkedList):
+        """Plays the last undone action again.
+
+        Returns:
+            - int: The score after that action, or None if there was nothing to redo.
+        """
+        if not self.redo_log:
+            return None
+        entry = self.redo_log.pop()
+        action, _, _, _, new_score, node, predecessor, _ = entry
+        if action == DELETE:
+            linked_list.current = node
+            linked_list.previous = predecessor
+            linked_list.delete_current_node() # O(1): previous is the node before current
+        else:
+            linked_list.current = node
+            linked_list.previous = predecessor
+        self.undo_log.append(entry)
+        return new_score
@@ -0,0 +1,222 @@
+import base64
+import json
+import os
+import queue
+import threading
+import time
+import zlib
+
+from core.game import apply_action, ACTIONS, POINTS
+from core.linked_list import LinkedList
+
+_CLOSE = object() # Queue sentinel: flush and stop the writer thread
+_RESET = object() # Queue marker: start a new game, dropping the journal and snapshot
+
+
+class ActionJournal:
+    """
+    Crash-safe, event-sourced record of one game, kept next to the game in local files.
+
+    - path: the journal, one "<seq> <action>" line per action played
+    - path + ".snapshot": the latest snapshot (JSON) of the surviving questions,
+      the cursor and the score, written to a temporary file and os.replace-d in
+
+    record() and snapshot() only put work on a queue; a writer thread drains it
+    and group-commits everything that arrived within flush_interval with one
+    write, flush and fsync, so the game loop never waits on the disk. Writing a
+    snapshot truncates the journal, so resume() reads one snapshot plus at most
+    snapshot_every actions, however long the session has been running.
+
+    Questions are identified by their PositionIndex slot (their position in the
+    bank as loaded), so the list must be indexed and built from the bank in order.
+    """
+    def __init__(self, path: str, snapshot_every: int = 500, flush_interval: float = 0.05, fsync: bool = True) -> None:
+        """
+        Args:
+            - path (str): Journal file; the snapshot goes to path + ".snapshot".
+            - snapshot_every (int): Actions between snapshots.
+            - flush_interval (float): Seconds the writer collects actions before committing them.
+            - fsync (bool): fsync after every commit (off makes it only crash-safe, not power-loss-safe).
+        """
+        self.path = path
+        self.snapshot_path = path + ".snapshot"
+        self.snapshot_every = snapshot_every
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.seq = 0 # Number of actions in the game so far
+        self.pending = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="action-journal", daemon=True)
+
+    def start(self) -> 'ActionJournal':
+        self.thread.start()
+        return self
+
+    def has_saved_game(self) -> bool:
+        """True if there is a journal or snapshot left by an earlier run to resume."""
+        return os.path.exists(self.snapshot_path) or (os.path.exists(self.path) and os.path.getsize(self.path) > 0)
+
+    # --- Game thread side ---
+
+    def record(self, action: str, linked_list: LinkedList, score: int) -> None:
+        """Logs an action that has just been played on linked_list (taking a snapshot every snapshot_every actions)."""
+        self.seq += 1
+        self.pending.put(f"{self.seq} {action}\n")
+        if self.seq % self.snapshot_every == 0:
+            self.snapshot(linked_list, score)
+
+    def snapshot(self, linked_list: LinkedList, score: int) -> None:
+        """Queues a snapshot of linked_list, e.g. after an undo, which the journal cannot replay.
+
+        Only the index's live-slot bitmap is copied here (one bytearray copy, no
+        per-node work); the writer thread compresses it.
+        """
+        current = linked_list.current
+        cursor = current.slot if current is not None else 0
+        self.pending.put((self.seq, score, cursor, linked_list.index.alive[1:]))
+
+    def reset(self) -> None:
+        """Starts a new game: the saved journal and snapshot are dropped."""
+        self.seq = 0
+        self.pending.put(_RESET)
+
+    def close(self) -> None:
+        """Commits everything queued and stops the writer thread."""
+        self.pending.put(_CLOSE)
+        self.thread.join()
+
+    def resume(self, linked_list: LinkedList):
+        """Restores the saved game onto linked_list, freshly loaded from the same bank.
+
+        Applies the latest snapshot, then replays the journal's actions after it.
+        A game that had already ended (no current question left; e.g. the program
+        died before the end-of-game reset reached the disk) is dropped instead.
+
+        Returns:
+            - int: The restored score, or None if there is no saved game. For a game
+              that had ended, None is returned too, and linked_list (already played
+              to its end) has to be loaded again.
+        Raises:
+            - ValueError: If the saved game does not fit the loaded questions.
+        """
+        if not self.has_saved_game():
+            return None
+        score = 0
+        seq = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path) as file:
+                snapshot = json.load(file)
+            seq = snapshot['seq']
+            score = snapshot['score']
+            alive = zlib.decompress(base64.b64decode(snapshot['alive']))
+            restore_snapshot(linked_list, alive, snapshot['cursor'])
+        if os.path.exists(self.path):
+            with open(self.path) as file:
+                for line in file:
+                    parts = line.split()
+                    if len(parts) != 2 or parts[1] not in ACTIONS:
+                        break # a torn last line from a crash mid-write
+                    if int(parts[0]) <= seq:
+                        continue # already in the snapshot
+                    seq = int(parts[0])
+                    score += POINTS[apply_action(linked_list, parts[1])]
+        if linked_list.current is None:
+            self.reset()
+            return None
+        self.seq = seq
+        return score
+
+    # --- Writer thread ---
+
+    def _run(self) -> None:
+        journal = open(self.path, 'a')
+        running = True
+        while running:
+            batch = [self.pending.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not _CLOSE:
+                try:
+                    batch.append(self.pending.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            lines = []
+            for item in batch:
+                if item is _CLOSE:
+                    running = False
+                elif item is _RESET or isinstance(item, tuple):
+                    # whatever is queued before a snapshot or reset is covered by it
+                    lines = []
+                    if item is _RESET:
+                        if os.path.exists(self.snapshot_path):
+                            os.remove(self.snapshot_path)
+                    else:
+                        self._write_snapshot(*item)
+                    journal.close()
+                    journal = open(self.path, 'w')
+                else:
+                    lines.append(item)
+            if lines:
+                journal.write(''.join(lines))
+            journal.flush()
+            if self.fsync:
+                os.fsync(journal.fileno())
+        journal.close()
+
+    def _write_snapshot(self, seq: int, score: int, cursor: int, alive: bytearray) -> None:
+        snapshot = {
+            'seq': seq,
+            'score': score,
+            'cursor': cursor,
+            'alive': base64.b64encode(zlib.compress(alive)).decode('ascii'),
+        }
+        temporary = self.snapshot_path + ".tmp"
+        with open(temporary, 'w') as file:
+            json.dump(snapshot, file)
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+        os.replace(temporary, self.snapshot_path)
+
+
+def restore_snapshot(linked_list: LinkedList, alive: bytes, cursor: int) -> None:
+    """Drops the questions a snapshot marks as deleted and puts current back, in O(n).
+
+    Args:
+        - linked_list (LinkedList): Indexed list freshly loaded from the bank (no deletions yet).
+        - alive (bytes): 1/0 per slot, in slot order; slots past its end are kept
+          (they had not been loaded yet when the snapshot was taken).
+        - cursor (int): Slot of the current question, 0 for none.
+    Raises:
+        - ValueError: If the snapshot has more slots than the list.
+    """
+    index = linked_list.index
+    if len(alive) > len(index.nodes) - 1:
+        raise ValueError("Saved game does not match the question bank.")
+    last = None
+    for slot, keep in enumerate(alive, 1):
+        node = index.nodes[slot]
+        if keep:
+            if last is None:
+                linked_list.head = node
+            else:
+                last.next = node
+            last = node
+        else:
+            index.nodes[slot] = None
+            node.slot = None
+            linked_list.size -= 1
+    if len(alive) < len(index.nodes) - 1:
+        following = index.nodes[len(alive) + 1]
+    else:
+        following = None
+    if last is None:
+        linked_list.head = following
+    else:
+        last.next = following
+    if following is None:
+        linked_list.tail = last
+    index.rebuild()
+
+    linked_list.current = index.nodes[cursor] if cursor else None
+    position = linked_list.position_of(linked_list.current) if linked_list.current is not None else 0
+    linked_list.previous = linked_list.node_at(position - 1) if position > 0 else None
@@ -1,17 +1,36 @@
-from core.node import Node
+from contextlib import contextmanager
+
+from core.node import Node, CompactNode
+from core.operation_stats import OperationStats
+from core.position_index import PositionIndex
 
 
 class LinkedList:
     """Manages a singly linked list of nodes of trivia questions.
 
     Responsibilities:
-    - Maintains reference to the first node (head)
-    - tracks current node during traversal
+    - Maintains reference to the first node (head) and the last node (tail)
+    - tracks current node during traversal, plus the node before it (previous)
+      so that deleting the current node does not have to rescan from head
+    - keeps a live count of nodes so len() is O(1)
+    - optionally (indexed=True) keeps a PositionIndex so position_of/node_at are O(log n)
+    - optionally counts calls and .next hops per operation (see counting/stats)
     - supports operations like add/delete/move etc.
     """
-    def __init__(self) -> None:
+    node_class = Node
+
+    def __init__(self, indexed: bool = False) -> None:
         self.head = None
         self.current = None
+        self.previous = None
+        self.tail = None
+        self.size = 0
+        self.index = PositionIndex() if indexed else None
+        self.op_stats = None
+
+    def __len__(self) -> int:
+        """Returns the number of nodes in the linked list."""
+        return self.size
 
     def add_question(self, question: str, answer: str, is_correct: bool) -> None:
         """Adds new trivia question to the end of the linked list.
@@ -21,50 +40,268 @@ class LinkedList:
             - answer (str): The answer to the trivia question.
             - is_correct (bool): Whether the answer is correct.
         """
-        new_node = Node(question, answer, is_correct)
+        new_node = self.node_class(question, answer, is_correct)
 
         if self.head is None:
             self.head = new_node
             self.current = self.head
         else:
-            current = self.head
-            while current.next is not None:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
+        self.size += 1
+        if self.index is not None:
+            self.index.append(new_node)
+        if self.op_stats is not None:
+            self.op_stats.record('add_question', 0)
+
+    def extend(self, questions) -> None:
+        """Adds a batch of trivia questions to the end of the linked list.
+
+        The batch is linked in a single pass and spliced onto the tail once.
+
+        Args:
+            - questions (iterable): (question, answer, is_correct) tuples.
+        """
+        first = None
+        last = None
+        count = 0
+        for question, answer, is_correct in questions:
+            new_node = self.node_class(question, answer, is_correct)
+            if first is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+
+        if first is None:
+            if self.op_stats is not None:
+                self.op_stats.record('extend', 0)
+            return
 
-    def delete_current_node(self) -> None:
-        """Deletes the current node in the linked list."""
         if self.head is None:
+            self.head = first
+            self.current = self.head
+        else:
+            self.tail.next = first
+        self.tail = last
+        self.size += count
+        hops = 0
+        if self.index is not None:
+            hops = self.index.extend(first)
+        if self.op_stats is not None:
+            self.op_stats.record('extend', hops)
+
+    def concat(self, other: 'LinkedList') -> None:
+        """Moves every node of other onto the end of this list, leaving other empty.
+
+        The chains are joined by relinking tail to other's head, so this is O(1)
+        (O(k log n) for the k moved nodes when this list is indexed).
+
+        Args:
+            - other (LinkedList): The list to splice on; it must not be indexed.
+        """
+        if other.head is None:
+            return
+        if self.head is None:
+            self.head = other.head
+            self.current = self.head
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
+        self.size += other.size
+        if self.index is not None:
+            self.index.extend(other.head)
+        other.clear()
+
+    def copy(self, indexed: bool = None) -> 'LinkedList':
+        """Returns a new LinkedList holding the same questions in the same order, in O(n).
+
+        The copy gets fresh nodes of the same node_class (the question and answer
+        strings are shared, not duplicated) and starts with current at its head.
+        Deleting from one list never affects the other.
+
+        Args:
+            - indexed (bool): Whether the copy keeps a PositionIndex; None = same as this list.
+        """
+        clone = LinkedList(indexed=self.index is not None if indexed is None else indexed)
+        clone.node_class = self.node_class
+        clone.extend(self._records())
+        return clone
+
+    def _records(self):
+        """Yields (question, answer, is_correct) for every node, head to tail."""
+        node = self.head
+        while node is not None:
+            yield node.question, node.answer, node.is_correct
+            node = node.next
+
+    def clear(self) -> None:
+        """Removes every node from the linked list."""
+        self.head = None
+        self.current = None
+        self.previous = None
+        self.tail = None
+        self.size = 0
+        if self.index is not None:
+            self.index.clear()
+
+    def delete_current_node(self) -> None:
+        """Deletes the current node in the linked list.
+
+        Runs in O(1) when current was reached through move_right/delete_current_node,
+        since previous then already points at the node before current. If current
+        was assigned directly, previous is stale and the node before current is
+        found by scanning from head once.
+        """
+        if self.head is None or self.current is None:
+            if self.op_stats is not None:
+                self.op_stats.record('delete_current_node', 0)
             return
 
         # case 1: delete head node
         if self.current == self.head:
+            if self.index is not None:
+                self.index.remove(self.current)
             self.head = self.head.next
             self.current = self.head
+            self.previous = None
+            if self.head is None:
+                self.tail = None
+            self.size -= 1
+            if self.op_stats is not None:
+                self.op_stats.record('delete_current_node', 1)
             return
 
         # case 2: delete middle or last node
-        prev = self.head
-        while prev.next != self.current:
-            prev = prev.next
-            if prev is None:
-                return
+        prev = self.previous
+        hops = 1 # current.next, to relink past current
+        if prev is None or prev.next is not self.current:
+            prev = self.head
+            while prev.next != self.current:
+                prev = prev.next
+                hops += 1
+                if prev is None:
+                    if self.op_stats is not None:
+                        self.op_stats.record('delete_current_node', hops)
+                    return
+            self.previous = prev
+        if self.index is not None:
+            self.index.remove(self.current)
         prev.next = self.current.next
         if prev.next is not None:
             self.current = prev.next
         else:
+            self.tail = prev
             self.current = None
+        self.size -= 1
+        if self.op_stats is not None:
+            self.op_stats.record('delete_current_node', hops)
 
     def move_right(self) -> None:
         """Move the current pointer to the right."""
+        if self.op_stats is not None:
+            self.op_stats.record('move_right', 0 if self.current is None else 1)
         if self.current is None or self.current.next is None:
             self.current = None
+            self.previous = None
         else:
+            self.previous = self.current
             self.current = self.current.next
 
+    def position_of(self, node) -> int:
+        """Returns the 0-based position of node in the list.
+
+        O(log n) on an indexed list, otherwise walks from head.
+
+        Raises:
+            - ValueError: If node is not in the list.
+        """
+        if self.index is not None:
+            if self.op_stats is not None:
+                self.op_stats.record('position_of', 0)
+            if getattr(node, 'slot', None) is None:
+                raise ValueError("node is not in the list")
+            return self.index.position_of(node)
+        position = 0
+        current = self.head
+        while current is not None:
+            if current is node:
+                if self.op_stats is not None:
+                    self.op_stats.record('position_of', position)
+                return position
+            position += 1
+            current = current.next
+        if self.op_stats is not None:
+            self.op_stats.record('position_of', position)
+        raise ValueError("node is not in the list")
+
+    def node_at(self, position: int):
+        """Returns the node at 0-based position.
+
+        O(log n) on an indexed list, otherwise walks from head.
+
+        Raises:
+            - IndexError: If position is outside the list.
+        """
+        if position < 0 or position >= self.size:
+            raise IndexError("position out of range")
+        if self.index is not None:
+            if self.op_stats is not None:
+                self.op_stats.record('node_at', 0)
+            return self.index.node_at(position)
+        current = self.head
+        for _ in range(position):
+            current = current.next
+        if self.op_stats is not None:
+            self.op_stats.record('node_at', position)
+        return current
+
+    def start_counting(self) -> OperationStats:
+        """Starts counting calls and .next hops per operation, replacing any running counts."""
+        self.op_stats = OperationStats()
+        return self.op_stats
+
+    def stop_counting(self) -> None:
+        """Stops counting operations (the OperationStats already handed out keep their counts)."""
+        self.op_stats = None
+
+    @contextmanager
+    def counting(self):
+        """Context manager that counts operations only inside the with block.
+
+        Example:
+            - with linked_list.counting() as stats:
+                  linked_list.move_right()
+              stats.as_dict() -> {'move_right': {'calls': 1, 'hops': 1, 'max_hops': 1}}
+        """
+        outer = self.op_stats
+        stats = self.start_counting()
+        try:
+            yield stats
+        finally:
+            self.op_stats = outer
+
+    def stats(self) -> dict:
+        """Returns the counts recorded so far, or {} when not counting."""
+        if self.op_stats is None:
+            return {}
+        return self.op_stats.as_dict()
+
     def is_empty(self) -> bool:
         """check if the linked list is empty"""
+        if self.op_stats is not None:
+            self.op_stats.record('is_empty', 0)
         if self.head is None:
             return True
         else:
-            return False
\ No newline at end of file
+            return False
+
+
+class CompactLinkedList(LinkedList):
+    """LinkedList that stores its questions in CompactNode (__slots__) nodes.
+
+    Navigation is identical to LinkedList (head/current/next), it only trades
+    the per-node __dict__ for slots to cut memory on large question banks.
+    """
+    node_class = CompactNode
@@ -0,0 +1,31 @@
+class OperationStats:
+    """Counts LinkedList operations and the .next hops each one made.
+
+    For every operation name it keeps:
+    - calls: how many times the operation ran
+    - hops: total number of .next links followed
+    - max_hops: the most hops a single call needed (an O(n) walk shows up here)
+    """
+    def __init__(self) -> None:
+        self.operations = {}
+
+    def record(self, operation: str, hops: int) -> None:
+        """Records one call of operation that followed hops .next links."""
+        counts = self.operations.get(operation)
+        if counts is None:
+            counts = self.operations[operation] = {'calls': 0, 'hops': 0, 'max_hops': 0}
+        counts['calls'] += 1
+        counts['hops'] += hops
+        if hops > counts['max_hops']:
+            counts['max_hops'] = hops
+
+    def as_dict(self) -> dict:
+        """Returns a copy of the counts: {operation: {'calls', 'hops', 'max_hops'}}."""
+        return {operation: dict(counts) for operation, counts in self.operations.items()}
+
+    def hops_per_call(self, operation: str) -> float:
+        """Returns the average hops per call of operation (0.0 if it never ran)."""
+        counts = self.operations.get(operation)
+        if not counts:
+            return 0.0
+        return counts['hops'] / counts['calls']
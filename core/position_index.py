@@ -0,0 +1,138 @@
+class PositionIndex:
+    """Order-maintaining index over the nodes of a LinkedList.
+
+    Every node gets a slot number in the order it was appended, and a Fenwick
+    (binary indexed) tree counts which slots are still in the list. Since nodes
+    are only ever appended at the tail or removed, slot order is list order, so:
+    - position_of(node) is the number of live slots up to node's slot
+    - node_at(position) is the slot where that count is reached
+    Both, as well as append and remove, take O(log n).
+
+    The slot number is stored on the node itself as node.slot.
+
+    alive mirrors nodes as one byte per slot (1 while the slot is in the list), so
+    a copy of which questions survive is a single bytearray copy.
+    """
+    def __init__(self) -> None:
+        self.tree = [0]     # 1-based Fenwick tree, tree[0] unused
+        self.nodes = [None] # slot -> node (None once removed)
+        self.alive = bytearray(1) # slot -> 1 if live, 0 once removed (alive[0] unused)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _prefix(self, slot: int) -> int:
+        """Number of live slots in 1..slot."""
+        total = 0
+        while slot > 0:
+            total += self.tree[slot]
+            slot -= slot & -slot
+        return total
+
+    def append(self, node) -> None:
+        """Adds node as the new last position."""
+        slot = len(self.tree)
+        # tree[slot] covers slots (slot - lowbit, slot]; the new slot itself counts 1
+        self.tree.append(1 + self._prefix(slot - 1) - self._prefix(slot - (slot & -slot)))
+        self.nodes.append(node)
+        self.alive.append(1)
+        node.slot = slot
+        self.count += 1
+
+    def extend(self, node) -> int:
+        """Appends node and every node after it (following .next), in order.
+
+        While no slot has been removed every slot counts 1, so tree[slot] is just
+        the width of the range it covers (slot & -slot) and each append is O(1);
+        otherwise this falls back to append.
+
+        Returns:
+            - int: The number of nodes appended.
+        """
+        added = 0
+        if self.count == len(self.tree) - 1:
+            tree = self.tree
+            nodes = self.nodes
+            slot = len(tree)
+            while node is not None:
+                tree.append(slot & -slot)
+                nodes.append(node)
+                node.slot = slot
+                node = node.next
+                slot += 1
+                added += 1
+            self.alive += b'\x01' * added
+            self.count += added
+        else:
+            while node is not None:
+                self.append(node)
+                node = node.next
+                added += 1
+        return added
+
+    def remove(self, node) -> None:
+        """Removes node from the index; nodes after it move up one position."""
+        slot = node.slot
+        self.nodes[slot] = None
+        self.alive[slot] = 0
+        node.slot = None
+        while slot < len(self.tree):
+            self.tree[slot] -= 1
+            slot += slot & -slot
+        self.count -= 1
+
+    def restore(self, node, slot: int) -> None:
+        """Puts a removed node back into the slot it had (used to undo a remove).
+
+        Slot order is list order, so this is only valid if node is relinked at the
+        same place in the list that it was removed from.
+        """
+        self.nodes[slot] = node
+        self.alive[slot] = 1
+        node.slot = slot
+        while slot < len(self.tree):
+            self.tree[slot] += 1
+            slot += slot & -slot
+        self.count += 1
+
+    def rebuild(self) -> None:
+        """Recomputes the tree from nodes in O(n), after slots were emptied directly in nodes."""
+        self.alive = bytearray(node is not None for node in self.nodes)
+        tree = [0] + list(self.alive[1:])
+        self.count = sum(tree)
+        for slot in range(1, len(tree)):
+            parent = slot + (slot & -slot)
+            if parent < len(tree):
+                tree[parent] += tree[slot]
+        self.tree = tree
+
+    def position_of(self, node) -> int:
+        """Returns the 0-based position of node in the list."""
+        return self._prefix(node.slot) - 1
+
+    def node_at(self, position: int):
+        """Returns the node at 0-based position.
+
+        Raises:
+            - IndexError: If position is outside the list.
+        """
+        if position < 0 or position >= self.count:
+            raise IndexError("position out of range")
+        remaining = position + 1
+        slot = 0
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            next_slot = slot + step
+            if next_slot < len(self.tree) and self.tree[next_slot] < remaining:
+                slot = next_slot
+                remaining -= self.tree[next_slot]
+            step >>= 1
+        return self.nodes[slot + 1]
+
+    def clear(self) -> None:
+        """Removes every node from the index."""
+        self.tree = [0]
+        self.nodes = [None]
+        self.alive = bytearray(1)
+        self.count = 0
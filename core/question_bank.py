@@ -0,0 +1,174 @@
+import mmap
+import struct
+import sys
+
+from core.linked_list import LinkedList
+from core.node import CompactNode
+from core.question_loader import iter_questions
+
+# Binary question bank layout (all integers little-endian):
+#   header  : magic, version, question count, offset of the record table
+#   heap    : UTF-8 question and answer text, each answer stored right after its question
+#   records : one fixed-width entry per question, in list order
+#             (heap offset of question, question length, answer length, is_correct)
+MAGIC = b'TQB1'
+VERSION = 1
+HEADER = struct.Struct('<4sIQQ')
+RECORD = struct.Struct('<QIIB')
+
+
+def convert_questions(json_path: str, bank_path: str) -> int:
+    """Converts a JSON / NDJSON question file into the binary question bank format.
+
+    The input is streamed, so only the record table (17 bytes per question) is
+    held in memory while converting.
+
+    Args:
+        - json_path (str): Source file in the data/questions.json format.
+        - bank_path (str): Where to write the binary bank.
+    Returns:
+        - int: Number of questions written.
+    Raises:
+        - ValueError: If a trivia item is missing question/answer/isCorrect.
+    """
+    records = bytearray()
+    count = 0
+    with open(json_path) as source, open(bank_path, 'wb') as bank:
+        bank.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+        offset = HEADER.size
+        for trivia in iter_questions(source):
+            if not isinstance(trivia, dict) or not all(k in trivia for k in ('question', 'answer', 'isCorrect')):
+                raise ValueError(f"Invalid trivia item: {trivia}")
+            question = trivia['question'].encode('utf-8')
+            answer = trivia['answer'].encode('utf-8')
+            bank.write(question)
+            bank.write(answer)
+            records += RECORD.pack(offset, len(question), len(answer), bool(trivia['isCorrect']))
+            offset += len(question) + len(answer)
+            count += 1
+        bank.write(records)
+        bank.seek(0)
+        bank.write(HEADER.pack(MAGIC, VERSION, count, offset))
+    return count
+
+
+def is_question_bank(path: str) -> bool:
+    """True if path is a binary question bank (starts with the bank magic) rather than JSON."""
+    with open(path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+class LazyNode:
+    """
+    Node of a MappedLinkedList whose successor is only read from the bank when asked for.
+
+    Has the same question / answer / is_correct / next attributes as Node; next is
+    materialised from the memory-mapped file on first access, so nodes exist only
+    for the part of the list that traversal has actually reached.
+    """
+    __slots__ = ('question', 'answer', 'is_correct', '_next', '_bank', '_index')
+
+    def __init__(self, bank, index: int, question: str, answer: str, is_correct: bool) -> None:
+        self.question = question
+        self.answer = answer
+        self.is_correct = is_correct
+        self._bank = bank
+        self._index = index
+        self._next = bank  # the bank itself marks "not loaded yet"
+
+    @property
+    def next(self):
+        if self._next is self._bank:
+            self._next = self._bank.record_node(self._index + 1)
+        return self._next
+
+    @next.setter
+    def next(self, node) -> None:
+        self._next = node
+
+
+class MappedLinkedList(LinkedList):
+    """LinkedList over a binary question bank read through mmap.
+
+    Opening the bank only reads the header plus the first and last records, so
+    startup does not depend on bank size. Further nodes are created as traversal
+    reaches them; appended questions become ordinary CompactNode nodes.
+
+    The bank stays mapped until close(); use the list as a context manager to
+    release the mapping and file handle when done.
+    """
+    node_class = CompactNode
+
+    def __init__(self, bank_path: str) -> None:
+        super().__init__()
+        self.file = open(bank_path, 'rb')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # mmap refuses empty files
+            self.file.close()
+            raise ValueError(f"{bank_path} is not a question bank")
+        if len(self.map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{bank_path} is not a question bank")
+        magic, version, self.count, self.table_offset = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{bank_path} is not a version {VERSION} question bank")
+
+        # the last record's node is built up front so tail is real; record_node hands out this same object
+        self.last_node = None
+        if self.count > 0:
+            self.last_node = self._load(self.count - 1)
+            self.head = self.last_node if self.count == 1 else self._load(0)
+            self.current = self.head
+            self.tail = self.last_node
+        self.size = self.count
+
+    def __enter__(self) -> 'MappedLinkedList':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _record(self, index: int) -> tuple:
+        """Reads record index from the bank as a (question, answer, is_correct) tuple."""
+        offset, question_len, answer_len, is_correct = RECORD.unpack_from(
+            self.map, self.table_offset + index * RECORD.size)
+        answer_offset = offset + question_len
+        question = self.map[offset:answer_offset].decode('utf-8')
+        answer = self.map[answer_offset:answer_offset + answer_len].decode('utf-8')
+        return question, answer, bool(is_correct)
+
+    def _load(self, index: int) -> LazyNode:
+        """Reads record index from the bank and builds its node."""
+        return LazyNode(self, index, *self._record(index))
+
+    def records(self):
+        """Yields every record in the bank, in order, as (question, answer, is_correct) tuples.
+
+        Reads straight from the record table, without building (or keeping) nodes,
+        so a bank can be copied into another list in one pass.
+        """
+        for index in range(self.count):
+            yield self._record(index)
+
+    def record_node(self, index: int):
+        """Returns the node for record index, or None past the last record."""
+        if index >= self.count:
+            return None
+        if index == self.count - 1:
+            return self.last_node
+        return self._load(index)
+
+    def close(self) -> None:
+        """Unmaps and closes the bank file."""
+        self.map.close()
+        self.file.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("usage: python -m core.question_bank <questions.json> <bank file>")
+        sys.exit(1)
+    written = convert_questions(sys.argv[1], sys.argv[2])
+    print(f"Wrote {written} questions to {sys.argv[2]}")
@@ -0,0 +1,117 @@
+import json
+import re
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def iter_questions(file, chunk_size: int = CHUNK_SIZE):
+    """Yields trivia records from an open question file one at a time.
+
+    The whole document is never parsed into memory at once. The format is picked
+    from the first non-whitespace character:
+    - '[' -> a top-level JSON array of records, parsed incrementally
+    - anything else -> NDJSON, one JSON record per line
+
+    Args:
+        - file (text file): Open question file (e.g. data/questions.json).
+        - chunk_size (int): Number of characters read per chunk.
+    Raises:
+        - json.JSONDecodeError: If the file is not valid JSON / NDJSON.
+    """
+    buffer = file.read(chunk_size)
+    start = 0
+    while True:
+        start = _WHITESPACE.match(buffer, start).end()
+        if start < len(buffer):
+            break
+        buffer = file.read(chunk_size)
+        start = 0
+        if not buffer:
+            return
+
+    if buffer[start] == '[':
+        yield from _iter_json_array(file, buffer, start + 1, chunk_size)
+    else:
+        yield from _iter_ndjson(file, buffer[start:], chunk_size)
+
+
+def _iter_json_array(file, buffer: str, pos: int, chunk_size: int):
+    """Yields each element of a JSON array whose opening '[' ends just before pos."""
+    decoder = json.JSONDecoder()
+    eof = False
+    expect_value = True  # True right after '[' or ','
+    empty = True
+
+    while True:
+        # skip whitespace, pulling in more text if the buffer runs out
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer):
+            if eof:
+                raise json.JSONDecodeError("Unterminated JSON array", buffer, pos)
+            chunk = file.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+
+        char = buffer[pos]
+        if char == ']' and (empty or not expect_value):
+            _check_trailing(file, buffer, pos + 1, chunk_size)
+            return
+        if not expect_value:
+            if char != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            pos += 1
+            expect_value = True
+            continue
+
+        try:
+            record, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            end = None
+        # a value that ends exactly at the end of the buffer might continue in the next chunk
+        if end is None or (end == len(buffer) and not eof):
+            chunk = file.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+
+        yield record
+        pos = end
+        expect_value = False
+        empty = False
+
+
+def _check_trailing(file, buffer: str, pos: int, chunk_size: int) -> None:
+    """Checks that nothing but whitespace follows the closing ']' at pos - 1, as json.load would.
+
+    Raises:
+        - json.JSONDecodeError: On any other trailing text ("Extra data").
+    """
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos < len(buffer):
+            raise json.JSONDecodeError("Extra data", buffer, pos)
+        buffer = file.read(chunk_size)
+        pos = 0
+        if not buffer:
+            return
+
+
+def _iter_ndjson(file, buffer: str, chunk_size: int):
+    """Yields one JSON record per non-blank line, starting from an already read buffer."""
+    while True:
+        chunk = file.read(chunk_size)
+        buffer += chunk
+        lines = buffer.split('\n')
+        buffer = lines.pop() if chunk else ''
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+        if not chunk:
+            return
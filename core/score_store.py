@@ -0,0 +1,165 @@
+import queue
+import sqlite3
+import threading
+import time
+
+_CLOSE = object() # Queue sentinel: commit what is queued and stop the writer thread
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS games ("
+    " id INTEGER PRIMARY KEY,"
+    " player TEXT NOT NULL,"
+    " score INTEGER NOT NULL,"
+    " questions_left INTEGER NOT NULL,"
+    " finished_at REAL NOT NULL)",
+    # top-k reads the first k entries of this index instead of sorting the table
+    "CREATE INDEX IF NOT EXISTS games_by_score ON games (score DESC, finished_at)",
+    # a player's history is one range of this index, newest first
+    "CREATE INDEX IF NOT EXISTS games_by_player ON games (player, finished_at DESC)",
+)
+
+
+class ScoreStore:
+    """
+    Finished games in a local SQLite database, written behind the game loop.
+
+    record() only puts the game on a queue. A writer thread (with its own
+    connection) batches whatever has queued up, up to batch_size rows or
+    flush_interval seconds, into one executemany transaction, then re-runs the
+    top-k query and keeps the result in memory. leaderboard() returns that
+    cached result, so a UI can draw it every frame without touching the disk;
+    on_update is called (from the writer thread) whenever it changes.
+
+    top_scores() and player_history() query the database directly, each served
+    by an index, so they stay fast as the table grows to millions of rows. The
+    database runs in WAL mode, so these reads do not block the writer.
+
+    If a batch fails to commit (e.g. the disk is full), its games are dropped, the
+    writer carries on, and the error is raised by the next flush() or close().
+    """
+    def __init__(self, path: str, leaderboard_size: int = 10, batch_size: int = 500,
+                 flush_interval: float = 0.5, on_update=None) -> None:
+        """
+        Args:
+            - path (str): SQLite database file (created if missing).
+            - leaderboard_size (int): Rows kept in the cached leaderboard.
+            - batch_size (int): Most games inserted per transaction.
+            - flush_interval (float): Seconds the writer collects games before committing them.
+            - on_update (callable): Called with no arguments after the cached leaderboard is refreshed.
+        """
+        self.path = path
+        self.leaderboard_size = leaderboard_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_update = on_update
+        self.pending = queue.Queue()
+        self.reader = None # Connection for queries, opened by the first thread that queries
+        self.error = None # Exception from the writer's last failed batch, raised by flush/close
+        with sqlite3.connect(path) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            for statement in SCHEMA:
+                connection.execute(statement)
+            self.cached_leaderboard = self._top_scores(connection, leaderboard_size)
+        connection.close()
+        self.thread = threading.Thread(target=self._run, name="score-store", daemon=True)
+
+    def start(self) -> 'ScoreStore':
+        self.thread.start()
+        return self
+
+    def record(self, player: str, score: int, questions_left: int) -> None:
+        """Queues a finished game to be saved; returns immediately.
+
+        Args:
+            - player (str): Player name.
+            - score (int): Final score.
+            - questions_left (int): Questions still in the list when the game ended.
+        """
+        self.pending.put((player, score, questions_left, time.time()))
+
+    def leaderboard(self) -> list:
+        """The cached top scores as (player, score, finished_at) tuples, best first (no disk access)."""
+        return self.cached_leaderboard
+
+    def flush(self) -> None:
+        """Blocks until every game recorded so far has been written.
+
+        Raises:
+            - Exception: What the writer raised, if a batch failed to commit.
+        """
+        self.pending.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Commits everything queued and stops the writer thread.
+
+        Raises:
+            - Exception: What the writer raised, if a batch failed to commit.
+        """
+        self.pending.put(_CLOSE)
+        self.thread.join()
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    def top_scores(self, k: int = 10) -> list:
+        """Returns the k best games as (player, score, finished_at) tuples, best first (ties: earliest first)."""
+        return self._top_scores(self._reader(), k)
+
+    def player_history(self, player: str, limit: int = 20) -> list:
+        """Returns player's last `limit` games as (score, questions_left, finished_at) tuples, newest first."""
+        return self._reader().execute(
+            "SELECT score, questions_left, finished_at FROM games WHERE player = ? ORDER BY finished_at DESC LIMIT ?",
+            (player, limit)).fetchall()
+
+    def _reader(self) -> sqlite3.Connection:
+        if self.reader is None:
+            self.reader = sqlite3.connect(self.path)
+        return self.reader
+
+    @staticmethod
+    def _top_scores(connection: sqlite3.Connection, k: int) -> list:
+        return connection.execute(
+            "SELECT player, score, finished_at FROM games ORDER BY score DESC, finished_at LIMIT ?", (k,)).fetchall()
+
+    # --- Writer thread ---
+
+    def _run(self) -> None:
+        connection = None
+        running = True
+        while running:
+            batch = [self.pending.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not _CLOSE and len(batch) < self.batch_size:
+                try:
+                    batch.append(self.pending.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            if batch[-1] is _CLOSE:
+                running = False
+                batch.pop()
+            try:
+                if batch:
+                    if connection is None:
+                        connection = sqlite3.connect(self.path)
+                        connection.execute("PRAGMA synchronous=NORMAL") # WAL + NORMAL: durable across crashes of this process
+                    with connection:
+                        connection.executemany(
+                            "INSERT INTO games (player, score, questions_left, finished_at) VALUES (?, ?, ?, ?)", batch)
+                    self.cached_leaderboard = self._top_scores(connection, self.leaderboard_size)
+                    if self.on_update is not None:
+                        self.on_update()
+            except Exception as error: # handed to the game thread by flush/close
+                self.error = error
+            finally:
+                # always, so flush() cannot wait forever on a batch that failed
+                for _ in range(len(batch) + (not running)):
+                    self.pending.task_done()
+        if connection is not None:
+            connection.close()
@@ -0,0 +1,117 @@
+import glob
+import io
+import json
+import os
+
+from core.linked_list import LinkedList
+from core.question_loader import iter_questions
+
+SHARD_EXTENSIONS = ('.json', '.ndjson', '.jsonl')
+
+
+def shard_paths(source: str) -> list:
+    """Returns the question files named by source, in a deterministic (sorted) order.
+
+    Args:
+        - source (str): A directory (every .json/.ndjson/.jsonl file in it),
+          a glob pattern such as "banks/*.json", or a single file.
+    Raises:
+        - FileNotFoundError: If source matches no files.
+    """
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in os.listdir(source) if name.endswith(SHARD_EXTENSIONS)]
+    elif glob.has_magic(source):
+        paths = glob.glob(source)
+    else:
+        paths = [source] if os.path.exists(source) else []
+    if not paths:
+        raise FileNotFoundError(f"No question files found for {source}")
+    return sorted(paths)
+
+
+def is_valid_trivia(trivia) -> bool:
+    """True if trivia has a str question, a str answer and a bool isCorrect."""
+    return (isinstance(trivia, dict)
+            and isinstance(trivia.get('question'), str)
+            and isinstance(trivia.get('answer'), str)
+            and isinstance(trivia.get('isCorrect'), bool))
+
+
+def parse_shard(path: str) -> tuple:
+    """Parses and validates one shard file (runs in a worker process).
+
+    Returns:
+        - tuple: (list of (question, answer, is_correct) tuples, list of skipped invalid items as text)
+    Raises:
+        - ValueError: If the shard is not valid JSON / NDJSON.
+    """
+    records = []
+    invalid = []
+    try:
+        with open(path) as file:
+            text = file.read()
+        # a shard is small enough to parse whole, and json.loads is much faster than streaming
+        items = json.loads(text) if text.lstrip().startswith('[') else iter_questions(io.StringIO(text))
+        for trivia in items:
+            if is_valid_trivia(trivia):
+                records.append((trivia['question'], trivia['answer'], trivia['isCorrect']))
+            else:
+                invalid.append(repr(trivia))
+    except json.JSONDecodeError as error:
+        raise ValueError(f"{path}: {error}")
+    return records, invalid
+
+
+def iter_shards(source: str, max_workers: int = None):
+    """Yields (path, records, invalid) for each shard named by source, in shard order.
+
+    Shards are parsed and validated by parse_shard in a process pool, and each
+    result is yielded as soon as it (and every shard before it) is ready.
+
+    Args:
+        - source (str): Directory, glob pattern or file (see shard_paths).
+        - max_workers (int): Worker processes (default: one per CPU).
+    """
+    paths = shard_paths(source)
+
+    if len(paths) == 1 or max_workers == 1:
+        for path in paths:
+            records, invalid = parse_shard(path)
+            yield path, records, invalid
+    else:
+        # imported here: concurrent.futures pulls in multiprocessing, which the single-file path never needs
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        # never fork: this can run on the GUI's loader thread while other threads (SDL, journal
+        # and score writers) hold locks, and a forked child would inherit those locks held
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(start_method)) as pool:
+            for path, (records, invalid) in zip(paths, pool.map(parse_shard, paths)):
+                yield path, records, invalid
+
+
+def load_shards(source: str, linked_list: LinkedList = None, max_workers: int = None) -> LinkedList:
+    """Loads every shard named by source into one linked list, parsing shards in parallel.
+
+    Shards are parsed and validated in a process pool (see iter_shards); the
+    parent links each shard's records into its own chain as results arrive and
+    splices that chain onto the result with LinkedList.concat in O(1). Invalid
+    trivia items are skipped with a warning, like TriviaGameGUI.load_questions.
+
+    Args:
+        - source (str): Directory, glob pattern or file (see shard_paths).
+        - linked_list (LinkedList): List to append to; a new LinkedList if None.
+        - max_workers (int): Worker processes (default: one per CPU).
+    Returns:
+        - LinkedList: The list holding every shard's questions, in shard order.
+    """
+    if linked_list is None:
+        linked_list = LinkedList()
+    for path, records, invalid in iter_shards(source, max_workers):
+        for item in invalid:
+            print(f"Warning: Skipping invalid trivia item in {path}: {item}")
+        shard = LinkedList()
+        shard.node_class = linked_list.node_class
+        shard.extend(records)
+        linked_list.concat(shard)
+    return linked_list
@@ -0,0 +1,210 @@
+from core.question_loader import iter_questions
+
+
+class SharedBank:
+    """Read-only question bank shared by many game sessions.
+
+    Questions, answers and correctness are stored once as parallel tuples/bytes.
+    Sessions never copy them; each one plays through a BankView, which only keeps
+    a cursor and a bitset of the questions it deleted.
+    """
+    def __init__(self, questions) -> None:
+        """
+        Args:
+            - questions (iterable): (question, answer, is_correct) tuples.
+        """
+        questions_list = []
+        answers = []
+        correct = bytearray()
+        for question, answer, is_correct in questions:
+            questions_list.append(question)
+            answers.append(answer)
+            correct.append(1 if is_correct else 0)
+        self.questions = tuple(questions_list)
+        self.answers = tuple(answers)
+        self.correct = bytes(correct)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'SharedBank':
+        """Loads a JSON / NDJSON question file, skipping invalid trivia items."""
+        with open(path) as file:
+            return cls(
+                (trivia['question'], trivia['answer'], trivia['isCorrect'])
+                for trivia in iter_questions(file)
+                if isinstance(trivia, dict) and all(k in trivia for k in ('question', 'answer', 'isCorrect'))
+            )
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+
+class BankNode:
+    """
+    A question of a SharedBank as seen through one BankView.
+
+    Has the same question / answer / is_correct / next attributes as Node, read
+    from the shared bank on access. Two BankNodes are equal when they are the
+    same question of the same view.
+    """
+    __slots__ = ('view', 'index')
+
+    def __init__(self, view: 'BankView', index: int) -> None:
+        self.view = view
+        self.index = index
+
+    @property
+    def question(self) -> str:
+        return self.view.bank.questions[self.index]
+
+    @property
+    def answer(self) -> str:
+        return self.view.bank.answers[self.index]
+
+    @property
+    def is_correct(self) -> bool:
+        return self.view.bank.correct[self.index] == 1
+
+    @property
+    def next(self):
+        return self.view.node(self.view.next_alive(self.index + 1))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, BankNode) and other.view is self.view and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.view), self.index))
+
+
+class BankView:
+    """One session's view of a SharedBank, navigated like a LinkedList.
+
+    Supports head / current / tail / next navigation, move_right,
+    delete_current_node, is_empty, len(), position_of and node_at. Deleting only
+    sets a bit, so per-session memory is the cursor plus a bitset that grows to
+    (highest deleted position / 8) bytes; the bank itself is never copied.
+    """
+    def __init__(self, bank: SharedBank) -> None:
+        self.bank = bank
+        self.deleted = bytearray()  # bit i set -> question i deleted from this view
+        self.deleted_count = 0
+        self.head_index = 0 if len(bank) else None
+        self.tail_index = len(bank) - 1 if len(bank) else None
+        self.cursor = self.head_index
+
+    # --- LinkedList-compatible navigation ---
+
+    @property
+    def head(self):
+        return self.node(self.head_index)
+
+    @property
+    def tail(self):
+        return self.node(self.tail_index)
+
+    @property
+    def current(self):
+        return self.node(self.cursor)
+
+    @current.setter
+    def current(self, node) -> None:
+        if node is not None and (node.view is not self or self.is_deleted(node.index)):
+            raise ValueError("node is not in this view")
+        self.cursor = None if node is None else node.index
+
+    def __len__(self) -> int:
+        return len(self.bank) - self.deleted_count
+
+    def is_empty(self) -> bool:
+        """check if every question has been deleted from this view"""
+        return self.head_index is None
+
+    def move_right(self) -> None:
+        """Move the current pointer to the next question that is still in the view."""
+        if self.cursor is not None:
+            self.cursor = self.next_alive(self.cursor + 1)
+
+    def delete_current_node(self) -> None:
+        """Deletes the current question from this view and moves to the next one."""
+        index = self.cursor
+        if index is None:
+            return
+        byte = index >> 3
+        if byte >= len(self.deleted):
+            self.deleted.extend(bytes(byte + 1 - len(self.deleted)))
+        self.deleted[byte] |= 1 << (index & 7)
+        self.deleted_count += 1
+
+        if index == self.head_index:
+            self.head_index = self.next_alive(index + 1)
+        if index == self.tail_index:
+            self.tail_index = self.previous_alive(index - 1)
+        self.cursor = self.next_alive(index + 1)
+
+    def position_of(self, node) -> int:
+        """Returns the 0-based position of node among the questions left in the view.
+
+        Raises:
+            - ValueError: If node is not in this view.
+        """
+        if node.view is not self or self.is_deleted(node.index):
+            raise ValueError("node is not in this view")
+        return node.index - self.deleted_before(node.index)
+
+    def node_at(self, position: int):
+        """Returns the node at 0-based position among the questions left in the view.
+
+        Raises:
+            - IndexError: If position is outside the view.
+        """
+        if position < 0 or position >= len(self):
+            raise IndexError("position out of range")
+        # smallest index with index - deleted_before(index) == position; deleted_before only grows
+        index = position
+        while True:
+            candidate = position + self.deleted_before(index)
+            if candidate == index:
+                break
+            index = candidate
+        return self.node(self.next_alive(index))
+
+    # --- Bitset helpers ---
+
+    def node(self, index):
+        """Returns the BankNode for bank index, or None for None."""
+        return None if index is None else BankNode(self, index)
+
+    def is_deleted(self, index: int) -> bool:
+        byte = index >> 3
+        return byte < len(self.deleted) and (self.deleted[byte] >> (index & 7)) & 1 == 1
+
+    def next_alive(self, index: int):
+        """Returns the first index >= index that is not deleted, or None."""
+        size = len(self.bank)
+        deleted = self.deleted
+        while index < size:
+            byte = index >> 3
+            if byte >= len(deleted):
+                return index
+            if deleted[byte] == 0xFF and index & 7 == 0:
+                index += 8 # whole byte deleted
+                continue
+            if not (deleted[byte] >> (index & 7)) & 1:
+                return index
+            index += 1
+        return None
+
+    def previous_alive(self, index: int):
+        """Returns the last index <= index that is not deleted, or None."""
+        while index >= 0:
+            if not self.is_deleted(index):
+                return index
+            index -= 1
+        return None
+
+    def deleted_before(self, index: int) -> int:
+        """Number of deleted questions with bank index < index."""
+        full_bytes = min(index >> 3, len(self.deleted))
+        count = int.from_bytes(self.deleted[:full_bytes], 'little').bit_count()
+        if full_bytes < len(self.deleted) and index & 7:
+            count += (self.deleted[full_bytes] & ((1 << (index & 7)) - 1)).bit_count()
+        return count
@@ -0,0 +1,32 @@
+import argparse
+
+from ui.gui import TriviaGameGUI
+from ui.frame_profiler import FrameProfiler
+
+# GUI entry point (python gui_main.py). The CLI lives in main.py and never imports pygame;
+# here pygame is unavoidable, but the question bank is only read once the window is up.
+
+def main():
+    parser = argparse.ArgumentParser(description="Trivia Trek pygame game.")
+    parser.add_argument('--questions', default=None,
+                        help="question file, binary question bank (.tqb), or a directory / glob of shard files loaded in parallel")
+    parser.add_argument('--profile', action='store_true',
+                        help="enable the frame profiler (F3 toggles its overlay, trace.json is written on quit)")
+    parser.add_argument('--journal', metavar='FILE',
+                        help="journal every action to FILE, and resume the unfinished game saved there")
+    parser.add_argument('--scores', metavar='FILE',
+                        help="save finished games to the SQLite database FILE and show its leaderboard on game over")
+    parser.add_argument('--player', default="Player", help="name to save your scores under")
+    args = parser.parse_args()
+
+    if args.profile:
+        game_gui = TriviaGameGUI(profiler=FrameProfiler(), trace_path="trace.json",
+                                 questions_path=args.questions, defer_load=True, journal_path=args.journal,
+                                 scores_path=args.scores, player=args.player)
+    else:
+        game_gui = TriviaGameGUI(questions_path=args.questions, defer_load=True, journal_path=args.journal,
+                                 scores_path=args.scores, player=args.player)
+    game_gui.run_game()
+
+if __name__ == "__main__":
+    main()
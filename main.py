@@ -1,13 +1,44 @@
-from core.linked_list import *
-from ui.cli import *
+import argparse
+import sys
+
+from core.game import read_actions
+from ui.cli import TriviaGame
+
+# CLI entry point. It deliberately imports nothing from ui.gui, so pygame (and numpy)
+# are never loaded here; the pygame front end starts from gui_main.py instead.
 
 def main():
-    game = TriviaGame()
+    parser = argparse.ArgumentParser(description="Trivia Trek CLI game.")
+    parser.add_argument('--questions', default="data/questions.json",
+                        help="question file, binary question bank (.tqb), or a directory / glob of shard files loaded in parallel")
+    parser.add_argument('--replay', metavar='FILE',
+                        help="play the actions in FILE ('-' for stdin) without prompts and print the final score")
+    parser.add_argument('--journal', metavar='FILE',
+                        help="journal every action to FILE, and resume the unfinished game saved there")
+    parser.add_argument('--scores', metavar='FILE',
+                        help="save finished games to the SQLite database FILE and show its leaderboard")
+    parser.add_argument('--player', default="Player", help="name to save your scores under")
+    args = parser.parse_args()
+
+    if args.replay:
+        game = TriviaGame()
+    else:
+        game = TriviaGame(journal_path=args.journal, scores_path=args.scores, player=args.player)
+
+    if args.replay:
+        if args.replay == '-':
+            score = game.play_actions(read_actions(sys.stdin), args.questions)
+        else:
+            with open(args.replay) as file:
+                score = game.play_actions(read_actions(file), args.questions)
+        print(f"Final Score: {score}")
+        print(f"Questions left: {len(game.linked_list)}")
+        return
 
     game.linked_list.current = game.linked_list.head  # Start at first question
 
     # Start game
-    game.cli_game_loop()
+    game.cli_game_loop(args.questions)
 
 if __name__ == "__main__":
     main()
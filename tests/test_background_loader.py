@@ -0,0 +1,54 @@
+import threading
+from core.background_loader import BackgroundLoader
+from core.linked_list import LinkedList
+
+def records(n):
+    return [("q" + str(i), "a" + str(i), i % 2 == 0) for i in range(n)]
+
+def test_background_loader_delivers_everything_in_order():
+    """test that batches arrive in order with growing sizes and a fully linked list"""
+    linked_list = LinkedList(indexed=True)
+    loader = BackgroundLoader(lambda: records(1000), first_batch=8, max_batch=64).start()
+    added = loader.wait(linked_list)
+
+    assert loader.done is True and loader.error is None, "loader should finish cleanly"
+    assert added == 1000 and len(linked_list) == 1000, "every record should be spliced in"
+    assert linked_list.current is linked_list.head, "current should start at the first question"
+    assert linked_list.tail.question == "q999", "tail should be the last record"
+    assert linked_list.node_at(500).question == "q500", "spliced nodes should be indexed in order"
+
+def test_background_loader_progressive_polls():
+    """test that poll only adds complete batches and resumes a current that ran off the end"""
+    release = threading.Event()
+    def produce():
+        yield from records(4)
+        release.wait(5)
+        yield from records(6)[4:]
+
+    linked_list = LinkedList()
+    loader = BackgroundLoader(produce, first_batch=4).start()
+    while not linked_list.head:
+        loader.poll(linked_list)
+    assert len(linked_list) == 4, "only the first batch has been produced"
+    for _ in range(4):
+        linked_list.move_right()
+    assert linked_list.current is None, "player ran past the loaded questions"
+
+    release.set()
+    loader.wait(linked_list)
+    assert len(linked_list) == 6, "the rest should arrive after the producer resumes"
+    assert linked_list.current.question == "q4", "current should move on to the first new question"
+    linked_list.delete_current_node()
+    assert linked_list.node_at(4).question == "q5", "previous should link past the deleted node"
+
+def test_background_loader_reports_errors():
+    """test that an exception in the producer is handed to the consumer"""
+    def produce():
+        yield ("q", "a", True)
+        raise ValueError("bad bank")
+
+    linked_list = LinkedList()
+    loader = BackgroundLoader(produce).start()
+    loader.wait(linked_list)
+    assert loader.done is True, "loader should finish"
+    assert isinstance(loader.error, ValueError), "the producer's error should be kept"
@@ -0,0 +1,47 @@
+import random
+import numpy as np
+import pytest
+from core.linked_list import LinkedList
+from core.game import replay
+from core.batch_scoring import correct_flags, encode_sessions, score_sessions, PAD
+
+BANK = [("q" + str(i), "a", i % 3 != 1) for i in range(12)]
+
+def make_list():
+    linked_list = LinkedList()
+    linked_list.extend(BANK)
+    return linked_list
+
+def test_score_sessions_matches_replay():
+    """test that vectorised scores and final list states match replaying each session"""
+    rng = random.Random(11)
+    sessions = [[rng.choice(["delete", "next", "confirm", "1", "3"]) for _ in range(rng.randrange(0, 20))]
+                for _ in range(200)]
+    correct = correct_flags(make_list())
+    scores, positions, deleted = score_sessions(correct, encode_sessions(sessions))
+
+    for row, actions in enumerate(sessions):
+        score, linked_list = replay(make_list(), actions)
+        assert scores[row] == score, "score should match replay"
+        surviving = [question for i, (question, _, _) in enumerate(BANK)
+                     if i >= deleted.shape[1] or not deleted[row, i]]
+        questions = []
+        node = linked_list.head
+        while node:
+            questions.append(node.question)
+            node = node.next
+        assert questions == surviving, "surviving questions should match replay"
+        if linked_list.current is None:
+            assert positions[row] == -1, "sessions that reached the end should report -1"
+        else:
+            assert BANK[positions[row]][0] == linked_list.current.question, "final current should match"
+
+def test_encode_sessions_pads_rows():
+    matrix = encode_sessions([["1", "next"], []])
+    assert matrix.tolist() == [[0, 1], [PAD, PAD]], "short rows should be padded"
+    with pytest.raises(ValueError):
+        encode_sessions([["jump"]])
+
+def test_score_sessions_empty_bank():
+    scores, positions, deleted = score_sessions(np.array([], dtype=bool), encode_sessions([["delete", "confirm"]]))
+    assert scores.tolist() == [0] and positions.tolist() == [-1], "nothing to score on an empty bank"
@@ -0,0 +1,16 @@
+from benchmarks.benchmark import run_benchmarks, compare
+
+def test_run_benchmarks_reports_every_size():
+    """test that a small run times every LinkedList benchmark at every size"""
+    results = run_benchmarks([10, 20], repeat=1, gui=False, log=lambda line: None)
+    assert "linked_list.add_question[10]" in results["results"], "add_question should be timed"
+    assert "linked_list.playthrough[20]" in results["results"], "playthrough should be timed"
+    assert "concurrent.delete_current_node[20]" in results["results"], "the player should be timed on its own"
+    assert all(seconds > 0 for seconds in results["results"].values()), "timings should be positive"
+    assert "python" in results["meta"], "meta should record the python version"
+
+def test_compare_flags_regressions():
+    """test that compare only flags benchmarks slower than the threshold allows"""
+    baseline = {"results": {"a[10]": 1.0, "b[10]": 1.0, "c[10]": 1.0}}
+    results = {"results": {"a[10]": 1.1, "b[10]": 1.5, "d[10]": 9.0}}
+    assert compare(results, baseline, 0.2) == [("b[10]", 1.0, 1.5)], "only b should regress"
@@ -0,0 +1,125 @@
+import random
+import threading
+import time
+from core.concurrent_list import ConcurrentLinkedList, ConcurrentNode
+from core.game import apply_action, DELETE, CORRECT_DELETE
+
+def make_list(n):
+    linked_list = ConcurrentLinkedList()
+    linked_list.extend((str(i), "a" + str(i), i % 2 == 0) for i in range(n))
+    return linked_list
+
+class YieldingNode(ConcurrentNode):
+    """ConcurrentNode that lets other threads run on every .next access, to shake out races.
+
+    CPython only switches threads every few milliseconds, which would leave the
+    gaps between reading and relinking .next almost impossible to hit.
+    """
+    @property
+    def next(self):
+        time.sleep(0)
+        return self._next
+
+    @next.setter
+    def next(self, node):
+        time.sleep(0)
+        self._next = node
+
+class YieldingList(ConcurrentLinkedList):
+    node_class = YieldingNode
+
+def linked_nodes(linked_list, limit):
+    """Follows .next from the sentinel, giving up after limit nodes (a cycle would never end)."""
+    nodes = []
+    node = linked_list.sentinel.next
+    while node is not None and len(nodes) <= limit:
+        nodes.append(node)
+        node = node.next
+    return nodes
+
+def test_cursors_are_independent():
+    """test that each player has their own position and sees the others' deletes"""
+    linked_list = make_list(4)
+    alice = linked_list.cursor()
+    bob = linked_list.cursor()
+
+    alice.move_right()
+    assert apply_action(alice, DELETE) == CORRECT_DELETE, "node 1 has a wrong answer"
+    assert alice.current.question == "2", "alice moves on to node 2"
+    assert bob.current.question == "0", "bob stays on node 0"
+    bob.move_right()
+    assert bob.current.question == "2", "bob skips the node alice deleted"
+    assert [node.question for node in linked_list] == ["0", "2", "3"], "node 1 should be gone"
+    assert len(linked_list) == 3, "size should drop by one"
+
+def test_delete_of_already_deleted_node_is_a_no_op():
+    """test that two players deleting the same node only remove it once"""
+    linked_list = make_list(3)
+    alice = linked_list.cursor()
+    bob = linked_list.cursor()
+    node = alice.current
+    assert alice.delete_current_node() is True, "first delete removes the node"
+    assert linked_list.remove(node) is False, "second delete finds it already gone"
+    assert len(linked_list) == 2 and bob.current.question == "1", "bob moves past the deleted head"
+
+def test_tail_delete_then_append():
+    """test that appends land after the new tail when the old tail was deleted"""
+    linked_list = make_list(2)
+    cursor = linked_list.cursor()
+    cursor.move_right()
+    cursor.delete_current_node()
+    linked_list.add_question("2", "a2", True)
+    assert [node.question for node in linked_list] == ["0", "2"], "append should follow the surviving node"
+    assert linked_list.tail.question == "2", "tail should be the appended node"
+
+def test_concurrent_players_and_readers_stress():
+    """test that many players deleting and moving while readers walk never corrupt the list"""
+    size = 400
+    linked_list = YieldingList()
+    linked_list.extend((str(i), "a", True) for i in range(size))
+    removed = []
+    errors = []
+    stop = threading.Event()
+    start = threading.Barrier(8 + 4 + 1)
+
+    def player(seed):
+        rng = random.Random(seed)
+        cursor = linked_list.cursor()
+        deleted = 0
+        start.wait()
+        while cursor.current is not None:
+            if rng.random() < 0.3:
+                deleted += cursor.delete_current_node()
+            else:
+                cursor.move_right()
+        removed.append(deleted)
+
+    def reader():
+        start.wait()
+        while not stop.is_set():
+            seen = [int(node.question) for node in linked_list]
+            if seen != sorted(set(seen)):
+                errors.append(seen)
+
+    def appender():
+        start.wait()
+        for i in range(size, size + 100):
+            linked_list.add_question(str(i), "a", True)
+
+    readers = [threading.Thread(target=reader, daemon=True) for _ in range(4)]
+    writers = [threading.Thread(target=player, args=(seed,), daemon=True) for seed in range(8)]
+    writers.append(threading.Thread(target=appender, daemon=True))
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join(20)
+    stop.set()
+    for thread in readers:
+        thread.join(20)
+
+    assert not any(thread.is_alive() for thread in readers + writers), "no thread should get stuck"
+    assert not errors, "readers should always see the nodes in order, each once"
+    nodes = linked_nodes(linked_list, size + 100)
+    assert not any(node.deleted for node in nodes), "no deleted node should stay linked"
+    assert len(nodes) == len(linked_list) == size + 100 - sum(removed), "size should match the deletes that succeeded"
+    assert linked_list.tail is nodes[-1], "tail should be the last linked node"
@@ -0,0 +1,50 @@
+import json
+from ui.frame_profiler import FrameProfiler
+
+class FakeGUI:
+    """Stands in for TriviaGameGUI: one no-op method per profiled phase."""
+    calls = 0
+
+    def handle_input(self, events=None):
+        self.calls += 1
+        return True
+
+for _name in FrameProfiler.PHASES:
+    if not hasattr(FakeGUI, _name):
+        setattr(FakeGUI, _name, lambda self, *args, **kwargs: None)
+
+def test_attach_times_phases_per_frame():
+    """test that attached phases are timed and rolled into per-frame samples"""
+    gui = FakeGUI()
+    profiler = FrameProfiler(window=5)
+    profiler.attach(gui)
+    profiler.attach(gui)  # re-attaching (as a restart does) must not double-wrap
+
+    for _ in range(8):
+        profiler.start_frame()
+        assert gui.handle_input([]) is True, "wrapped method should return the original result"
+        gui.draw_list()
+        profiler.end_frame()
+
+    assert gui.calls == 8, "original method should run once per call"
+    assert len(profiler.samples["handle_input"]) == 5, "samples should be capped at the window size"
+    assert "draw_buttons" not in profiler.samples, "phases that never ran should have no samples"
+    assert list(profiler.summary())[0] == "frame", "summary should list the whole frame first"
+    assert len(profiler.trace) == 8 * 3, "each call and each frame should leave a trace event"
+
+def test_percentiles_nearest_rank():
+    """test rolling percentiles over the window"""
+    profiler = FrameProfiler(window=100)
+    profiler.samples["frame"] = list(range(1, 101))
+    assert profiler.percentiles("frame") == (50, 95, 99), "nearest-rank percentiles of 1..100"
+    assert profiler.percentiles("missing") == (0.0, 0.0, 0.0), "unknown phase should report zeros"
+
+def test_dump_trace(tmp_path):
+    """test that the trace is written in Chrome trace event format"""
+    profiler = FrameProfiler()
+    profiler.start_frame()
+    profiler.end_frame()
+    path = tmp_path / "trace.json"
+    profiler.dump_trace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    assert events[0]["name"] == "frame" and events[0]["ph"] == "X", "frame should be a complete event"
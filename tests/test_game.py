@@ -0,0 +1,68 @@
+import io
+import random
+import pytest
+from core.linked_list import LinkedList
+from core.game import (apply_action, replay, read_actions, TriviaSession, POINTS, DELETE, NEXT, CONFIRM, NO_QUESTION,
+                       CORRECT_DELETE, WRONG_DELETE, SKIPPED, CORRECT_CONFIRM, WRONG_CONFIRM)
+
+def make_list():
+    linked_list = LinkedList()
+    linked_list.extend([("q1", "a1", True), ("q2", "a2", False), ("q3", "a3", True), ("q4", "a4", False)])
+    return linked_list
+
+def test_apply_action_rules():
+    """test the outcome, points and list changes of every action"""
+    linked_list = make_list()
+    assert apply_action(linked_list, DELETE) == WRONG_DELETE, "deleting a correct answer scores nothing"
+    assert linked_list.head.question == "q2", "q1 should be removed anyway"
+    assert apply_action(linked_list, DELETE) == CORRECT_DELETE, "deleting a wrong answer scores"
+    assert apply_action(linked_list, CONFIRM) == CORRECT_CONFIRM, "confirming a correct answer scores"
+    assert linked_list.current.question == "q4", "confirm should move right"
+    assert apply_action(linked_list, CONFIRM) == WRONG_CONFIRM, "confirming a wrong answer scores nothing"
+    assert linked_list.current is None, "confirm moves right even when wrong"
+    assert apply_action(linked_list, DELETE) == NO_QUESTION, "nothing to delete at the end"
+    assert apply_action(linked_list, CONFIRM) == NO_QUESTION, "nothing to confirm at the end"
+    assert apply_action(linked_list, NEXT) == SKIPPED, "next always skips"
+    assert [POINTS[o] for o in (CORRECT_DELETE, CORRECT_CONFIRM, WRONG_DELETE, WRONG_CONFIRM, SKIPPED)] == [1, 1, 0, 0, 0]
+
+def test_apply_action_rejects_unknown_action():
+    with pytest.raises(ValueError):
+        apply_action(make_list(), "jump")
+
+def test_trivia_session_keeps_score():
+    """test that a session adds up points and reports when it is over"""
+    session = TriviaSession(make_list())
+    for action in (NEXT, DELETE, CONFIRM, DELETE):
+        session.apply(action)
+    assert session.score == 3, "q2 delete, q3 confirm and q4 delete should score"
+    assert session.is_over() is True, "session should be over after the last question"
+
+def test_replay_matches_apply_action():
+    """test that replay scores and edits the list exactly like apply_action"""
+    rng = random.Random(5)
+    tokens = ["delete", "next", "confirm", "1", "2", "3"]
+    for _ in range(30):
+        actions = [rng.choice(tokens) for _ in range(rng.randrange(1, 20))]
+        expected = TriviaSession(make_list())
+        for token in actions:
+            expected.apply({"1": DELETE, "2": NEXT, "3": CONFIRM}.get(token, token))
+        score, linked_list = replay(make_list(), actions)
+        assert score == expected.score, "replay score should match apply_action"
+        questions = []
+        node = linked_list.head
+        while node:
+            questions.append(node.question)
+            node = node.next
+        expected_questions = []
+        node = expected.linked_list.head
+        while node:
+            expected_questions.append(node.question)
+            node = node.next
+        assert questions == expected_questions, "surviving list should match apply_action"
+
+def test_replay_rejects_unknown_token():
+    with pytest.raises(ValueError):
+        replay(make_list(), ["delete", "jump"])
+
+def test_read_actions_splits_whitespace():
+    assert list(read_actions(io.StringIO("1 2\n confirm\n\n"))) == ["1", "2", "confirm"]
@@ -0,0 +1,218 @@
+import os
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from ui.gui import TriviaGameGUI
+
+@pytest.fixture
+def questions_file(tmp_path):
+    path = tmp_path / "questions.json"
+    path.write_text('[{"question": "q1", "answer": "a1", "isCorrect": true},'
+                    ' {"question": "q2", "answer": "a2", "isCorrect": false}]')
+    return str(path)
+
+def test_reset_game_clones_loaded_bank(questions_file):
+    """test that restarting rebuilds the list from the loaded bank without reloading it"""
+    gui = TriviaGameGUI(questions_path=questions_file)
+    screen, font = gui.screen, gui.FONT_MEDIUM
+    gui.handle_action('confirm')
+    gui.handle_action('next')
+    assert gui.game_over is True, "moving past the last question should end the game"
+
+    os.remove(questions_file)  # a restart must not read the file again
+    gui.reset_game()
+    assert gui.game_over is False and gui.score == 0, "game state should be reset"
+    assert len(gui.linked_list) == 2, "every question should be back"
+    assert gui.linked_list.current.question == "q1", "play should restart at the first question"
+    assert gui.linked_list.node_at(1).question == "q2", "the new list should be indexed"
+    assert gui.screen is screen and gui.FONT_MEDIUM is font, "window and fonts should be reused"
+
+def test_background_load_fills_list_while_playing(questions_file):
+    """test that a deferred GUI loads its bank through the background loader"""
+    gui = TriviaGameGUI(questions_path=questions_file, defer_load=True)
+    assert gui.linked_list.is_empty() and gui.loader is None, "nothing should load before run_game"
+
+    gui.start_background_load()
+    gui.loader.thread.join()
+    gui.poll_background_load()
+    assert gui.loader is None, "loading should be finished"
+    assert len(gui.linked_list) == 2, "every question should be in the list"
+    assert gui.linked_list.current.question == "q1", "play should start at the first question"
+    assert len(gui.question_template) == 2, "a template for restarts should be built alongside"
+
+def test_undo_and_redo_from_game_over(questions_file):
+    """test that undo reopens a finished game and takes back deletes with their points"""
+    gui = TriviaGameGUI(questions_path=questions_file)
+    gui.handle_action('confirm')
+    gui.handle_action('next')
+    assert gui.score == 1 and gui.game_over is True, "moving past q2 should end the game"
+
+    gui.undo_action()
+    assert gui.game_over is False, "undo should reopen the game"
+    assert gui.linked_list.current.question == "q2", "current should be back on q2"
+
+    gui.handle_action('delete')
+    assert gui.score == 2 and len(gui.linked_list) == 1, "deleting the wrong answer scores"
+    gui.undo_action()
+    assert gui.score == 1 and len(gui.linked_list) == 2, "the delete and its point should be taken back"
+    assert gui.linked_list.current.question == "q2", "current should be back on the deleted question"
+    gui.redo_action()
+    assert gui.score == 2 and len(gui.linked_list) == 1, "redo should replay the delete"
+
+def test_journal_resumes_after_crash(questions_file, tmp_path):
+    """test that a new GUI picks up where a journaled one stopped"""
+    journal_path = str(tmp_path / "game.journal")
+    gui = TriviaGameGUI(questions_path=questions_file, journal_path=journal_path)
+    gui.handle_action('delete')
+    gui.journal.close()  # what the writer had committed when the kiosk went down
+
+    resumed = TriviaGameGUI(questions_path=questions_file, journal_path=journal_path)
+    assert resumed.score == 0, "the score should be restored"
+    assert [resumed.linked_list.head.question, len(resumed.linked_list)] == ["q2", 1], "the deleted question stays deleted"
+    assert resumed.linked_list.current.question == "q2", "current should be back on q2"
+    resumed.reset_game()
+    resumed.journal.close()
+    assert resumed.journal.has_saved_game() is False, "restarting should drop the saved game"
+
+def test_finished_game_is_not_resumed(questions_file, tmp_path):
+    """test that finishing a game drops it from the journal, and undo from game over saves it again"""
+    journal_path = str(tmp_path / "game.journal")
+    gui = TriviaGameGUI(questions_path=questions_file, journal_path=journal_path)
+    gui.handle_action('confirm')
+    gui.handle_action('next')
+    assert gui.game_over is True, "moving past q2 should end the game"
+    gui.journal.close()
+    assert gui.journal.has_saved_game() is False, "a finished game should leave nothing to resume"
+
+    gui = TriviaGameGUI(questions_path=questions_file, journal_path=journal_path)
+    gui.handle_action('confirm')
+    gui.handle_action('next')
+    gui.undo_action()
+    gui.journal.close()
+    resumed = TriviaGameGUI(questions_path=questions_file, journal_path=journal_path)
+    assert resumed.game_over is False and resumed.score == 1, "the reopened game should be resumed"
+    assert resumed.linked_list.current.question == "q2", "current should be back on q2"
+    resumed.journal.close()
+
+def test_finished_game_is_saved_when_left(questions_file, tmp_path):
+    """test that a finished game is saved once, with its final score, when it is restarted"""
+    gui = TriviaGameGUI(questions_path=questions_file, scores_path=str(tmp_path / "scores.db"), player="ann")
+    gui.handle_action('delete')  # q1 was right: no point
+    gui.handle_action('next')
+    assert gui.game_over is True and gui.score == 0, "moving past q2 should end the game"
+    gui.undo_action()
+    gui.handle_action('delete')  # q2 was wrong: +1, and the list is empty
+    assert gui.game_over is True and gui.score == 1, "emptying the list should end the game again"
+    gui.scores.flush()
+    assert gui.scores.leaderboard() == [], "nothing should be saved before the game is left"
+    gui.draw_game_over()
+
+    gui.reset_game()
+    gui.scores.flush()
+    assert [row[:2] for row in gui.scores.leaderboard()] == [("ann", 1)], "the final score should be saved once"
+    gui.reset_game()  # leaving an unfinished game saves nothing
+    gui.scores.flush()
+    assert len(gui.scores.top_scores()) == 1, "only the finished game should be saved"
+    gui.scores.close()
+
+def test_gui_loads_binary_bank(questions_file, tmp_path):
+    """test that the GUI reads a binary question bank through its record table"""
+    from core.question_bank import convert_questions
+    bank_path = str(tmp_path / "questions.tqb")
+    convert_questions(questions_file, bank_path)
+    gui = TriviaGameGUI(questions_path=bank_path)
+    assert gui.linked_list.head.question == "q1" and len(gui.linked_list) == 2, "the bank should load in order"
+    assert gui.linked_list.node_at(1).question == "q2", "the GUI list should stay indexed"
+
+def test_load_error_clears_undo_history(tmp_path):
+    """test that a bank failing partway through a background load leaves nothing to undo"""
+    items = ',\n'.join('{"question": "q%d", "answer": "a", "isCorrect": false}' % i for i in range(100))
+    path = tmp_path / "questions.json"
+    path.write_text('[' + items + ',\n{"question": ')  # cut off mid-item
+    gui = TriviaGameGUI(questions_path=str(path), defer_load=True)
+    gui.start_background_load()
+    while gui.linked_list.is_empty():
+        gui.loader.poll(gui.linked_list, max_batches=1)
+    gui.handle_action('delete')
+    gui.loader.thread.join()
+    gui.poll_background_load()
+    assert gui.linked_list.is_empty(), "a failed load should leave the list empty"
+    gui.undo_action()
+    assert gui.score == 1 and gui.linked_list.is_empty(), "undo should have nothing to take back"
+
+def draw_every_node(gui):
+    """Reference for draw_list: walks the whole list from head, leaving culling to draw_node."""
+    step = gui.NODE_WIDTH + gui.ARROW_LENGTH
+    x = 100
+    current = gui.linked_list.head
+    while current:
+        adjusted_x = gui.draw_node(current, x, gui.NODE_Y_POSITION)
+        if current.next:
+            gui.draw_arrow(adjusted_x, gui.NODE_Y_POSITION, x + step - gui.scroll_offset, gui.NODE_Y_POSITION)
+        x += step
+        current = current.next
+
+def test_draw_list_matches_full_walk():
+    """test that the culled draw_list draws exactly what a walk over every node draws"""
+    import pygame
+    gui = TriviaGameGUI(questions_path=None, defer_load=True)
+    gui.linked_list.extend((f"Question {i}?", f"Answer {i}", i % 2 == 0) for i in range(30))
+    gui.linked_list.current = gui.linked_list.node_at(12)
+    gui.scroll_offset = 10 ** 9
+    gui.scroll_view(0)  # clamps to the largest offset, where the last node is in view
+    max_scroll = gui.scroll_offset
+    for offset in list(range(0, max_scroll, 97)) + [max_scroll]:
+        gui.scroll_offset = offset
+        gui.screen.fill((0, 0, 0))
+        gui.draw_list()
+        culled = pygame.image.tobytes(gui.screen, "RGB")
+        gui.screen.fill((0, 0, 0))
+        draw_every_node(gui)
+        assert culled == pygame.image.tobytes(gui.screen, "RGB"), f"draw_list should match a full walk at offset {offset}"
+
+def test_background_gradient_is_cached_until_resize(questions_file):
+    """test that the gradient is rendered once and rebuilt only when the window size changes"""
+    import pygame
+    gui = TriviaGameGUI(questions_path=questions_file)
+    gui.draw_gradient_background()
+    background = gui.background_surface
+    gui.draw_gradient_background()
+    assert gui.background_surface is background, "an unchanged window should reuse the cached gradient"
+
+    gui.screen = pygame.display.set_mode((640, 480))
+    gui.draw_gradient_background()
+    assert gui.background_surface is not background, "a resize should rebuild the gradient"
+    assert gui.background_surface.get_size() == (640, 480), "the new gradient should fill the new window"
+
+def test_render_text_reuses_cached_lines(questions_file):
+    """test that a repeated render_text call is served from the LRU cache"""
+    gui = TriviaGameGUI(questions_path=questions_file)
+    gui.text_cache.clear()
+    lines = gui.render_text("What is the capital of France?", gui.FONT_MEDIUM, gui.WHITE, max_width=120)
+    assert len(lines) > 1, "the text should wrap onto several lines"
+    again = gui.render_text("What is the capital of France?", gui.FONT_MEDIUM, gui.WHITE, max_width=120)
+    assert again is lines and len(gui.text_cache) == 1, "the second call should hit the cache"
+
+    gui.TEXT_CACHE_SIZE = 2
+    gui.render_text("other", gui.FONT_MEDIUM, gui.WHITE)
+    gui.render_text("What is the capital of France?", gui.FONT_MEDIUM, gui.WHITE, max_width=120)  # most recent again
+    gui.render_text("third", gui.FONT_MEDIUM, gui.WHITE)
+    assert ("other", gui.FONT_MEDIUM, gui.WHITE, None) not in gui.text_cache, "the least recently used entry should go"
+    assert len(gui.text_cache) == 2, "the cache should stay within its size"
+
+def test_idle_frame_does_no_draw_work(questions_file, monkeypatch):
+    """test that a frame with nothing dirty neither draws nor updates the display"""
+    import pygame
+    gui = TriviaGameGUI(questions_path=questions_file)
+    draws = []
+    monkeypatch.setattr(gui, "draw_frame", lambda: draws.append("draw_frame"))
+    monkeypatch.setattr(gui, "update_display", lambda rects: draws.append("update_display"))
+    woken = iter([pygame.event.Event(pygame.USEREVENT + 5), pygame.event.Event(pygame.QUIT)])
+    monkeypatch.setattr(pygame.event, "wait", lambda: next(woken))
+    monkeypatch.setattr(pygame.event, "get", lambda: [])
+    gui.dirty_rects = []
+    with pytest.raises(SystemExit):
+        gui.run_game()  # one idle wake-up, then quit
+    assert draws == [], "an idle frame should not draw anything"
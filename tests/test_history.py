@@ -0,0 +1,68 @@
+import random
+import pytest
+from core.game import DELETE, NEXT, CONFIRM, NO_QUESTION
+from core.history import ActionHistory
+from core.linked_list import LinkedList, CompactLinkedList
+
+def make_list(list_class=LinkedList, n=30, indexed=False):
+    linked_list = list_class(indexed=indexed)
+    linked_list.extend(("q" + str(i), "a" + str(i), i % 3 != 0) for i in range(n))
+    return linked_list
+
+def state(linked_list):
+    """Everything undo has to put back: the questions, current, tail, size and index."""
+    questions = []
+    node = linked_list.head
+    while node is not None:
+        questions.append(node.question)
+        node = node.next
+    current = linked_list.current.question if linked_list.current else None
+    positions = [linked_list.node_at(i).question for i in range(len(linked_list))] if linked_list.index else None
+    return questions, current, linked_list.tail.question if linked_list.tail else None, len(linked_list), positions
+
+@pytest.mark.parametrize("list_class, indexed", [(LinkedList, False), (LinkedList, True), (CompactLinkedList, True)])
+def test_undo_and_redo_retrace_random_games(list_class, indexed):
+    """test that undoing every action walks back through the exact same states, and redo forward again"""
+    rng = random.Random(3)
+    linked_list = make_list(list_class, indexed=indexed)
+    history = ActionHistory(depth=1000)
+    score = 0
+    states = [(state(linked_list), score)]
+    while linked_list.current is not None:
+        outcome, score = history.apply(linked_list, rng.choice([DELETE, DELETE, NEXT, CONFIRM]), score)
+        states.append((state(linked_list), score))
+
+    for expected in reversed(states[:-1]):
+        score = history.undo(linked_list)
+        assert (state(linked_list), score) == expected, "undo should restore the previous state and score"
+    assert history.undo(linked_list) is None, "nothing is left to undo"
+
+    for expected in states[1:]:
+        score = history.redo(linked_list)
+        assert (state(linked_list), score) == expected, "redo should replay the next state and score"
+    assert history.redo(linked_list) is None, "nothing is left to redo"
+
+def test_undo_then_new_action_drops_redo():
+    """test that playing after an undo discards the undone actions"""
+    linked_list = make_list()
+    history = ActionHistory()
+    _, score = history.apply(linked_list, CONFIRM, 0)
+    history.undo(linked_list)
+    history.apply(linked_list, NEXT, 0)
+    assert history.can_redo() is False, "the undone confirm cannot be redone any more"
+
+def test_history_depth_limit():
+    """test that only the last depth actions are kept and no-ops are not logged"""
+    linked_list = make_list(n=3)
+    history = ActionHistory(depth=2)
+    score = 0
+    for _ in range(3):
+        _, score = history.apply(linked_list, DELETE, score)
+    outcome, _ = history.apply(linked_list, DELETE, score)
+    assert outcome == NO_QUESTION and len(history.undo_log) == 2, "only two deletes should be kept"
+
+    history.undo(linked_list)
+    history.undo(linked_list)
+    assert history.can_undo() is False, "the oldest delete has been forgotten"
+    assert [linked_list.head.question, linked_list.current.question] == ["q1", "q1"], "two deletes are undone"
+    assert len(linked_list) == 2, "size should count the restored nodes"
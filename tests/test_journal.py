@@ -0,0 +1,99 @@
+import random
+import pytest
+from core.game import DELETE, NEXT, CONFIRM, POINTS, apply_action
+from core.journal import ActionJournal
+from core.linked_list import LinkedList
+
+QUESTIONS = [("q" + str(i), "a" + str(i), i % 3 != 0) for i in range(200)]
+
+def fresh_list(n=len(QUESTIONS)):
+    linked_list = LinkedList(indexed=True)
+    linked_list.extend(QUESTIONS[:n])
+    return linked_list
+
+def state(linked_list, score):
+    questions = []
+    node = linked_list.head
+    while node is not None:
+        questions.append(node.question)
+        node = node.next
+    current = linked_list.current.question if linked_list.current else None
+    return questions, current, linked_list.tail.question, len(linked_list), score
+
+def play(journal, linked_list, actions, score=0):
+    for action in actions:
+        score += POINTS[apply_action(linked_list, action)]
+        journal.record(action, linked_list, score)
+    return score
+
+@pytest.mark.parametrize("snapshot_every", [7, 1000])
+def test_resume_restores_the_game(tmp_path, snapshot_every):
+    """test that a new run resumes the exact list, current question and score"""
+    rng = random.Random(5)
+    path = str(tmp_path / "game.journal")
+    linked_list = fresh_list()
+    journal = ActionJournal(path, snapshot_every=snapshot_every, fsync=False).start()
+    score = play(journal, linked_list, [rng.choice([DELETE, NEXT, CONFIRM]) for _ in range(150)])
+    journal.close()
+    expected = state(linked_list, score)
+
+    resumed_list = fresh_list()
+    resumed = ActionJournal(path, snapshot_every=snapshot_every, fsync=False)
+    assert resumed.has_saved_game() is True, "the journal should be found"
+    score = resumed.resume(resumed_list)
+    assert state(resumed_list, score) == expected, "resume should rebuild the same game"
+    assert resumed.seq == 150, "numbering should carry on after the resumed actions"
+    with open(path) as file:
+        assert len(file.readlines()) < min(snapshot_every, 150) + 1, "snapshots should truncate the journal"
+
+    # play on after resuming, with the node pointers restored so deletes stay O(1)
+    resumed.start()
+    score = play(resumed, resumed_list, [DELETE, NEXT, DELETE], score)
+    resumed.close()
+    again = fresh_list()
+    assert state(again, ActionJournal(path).resume(again)) == state(resumed_list, score), "second resume should match"
+
+def test_snapshot_taken_while_loading(tmp_path):
+    """test that questions loaded after a snapshot are kept when resuming"""
+    path = str(tmp_path / "game.journal")
+    linked_list = fresh_list(10)
+    journal = ActionJournal(path, fsync=False).start()
+    score = play(journal, linked_list, [DELETE, CONFIRM])
+    journal.snapshot(linked_list, score)
+    linked_list.extend(QUESTIONS[10:])
+    score = play(journal, linked_list, [DELETE], score)
+    journal.close()
+
+    resumed_list = fresh_list()
+    score = ActionJournal(path).resume(resumed_list)
+    assert state(resumed_list, score) == state(linked_list, score), "unloaded slots count as not deleted"
+
+def test_reset_and_torn_lines(tmp_path):
+    """test that reset drops the saved game and a half-written last line is ignored"""
+    path = str(tmp_path / "game.journal")
+    journal = ActionJournal(path, fsync=False).start()
+    play(journal, fresh_list(), [DELETE, DELETE])
+    journal.reset()
+    journal.close()
+    assert ActionJournal(path).has_saved_game() is False, "reset should leave nothing to resume"
+
+    with open(path, 'w') as file:
+        file.write("1 delete\n2 next\n3 del")
+    linked_list = fresh_list()
+    journal = ActionJournal(path)
+    assert journal.resume(linked_list) == 1, "only the complete lines are replayed"
+    assert journal.seq == 2 and linked_list.current.question == "q2", "the torn action is dropped"
+
+def test_resume_drops_a_finished_game(tmp_path):
+    """test that a journal whose game had already ended is not resumed"""
+    path = str(tmp_path / "game.journal")
+    linked_list = fresh_list(3)
+    journal = ActionJournal(path, fsync=False).start()
+    play(journal, linked_list, [NEXT, NEXT, NEXT])  # crashed before the end-of-game reset
+    journal.close()
+
+    resumed_list = fresh_list(3)
+    journal = ActionJournal(path, fsync=False).start()
+    assert journal.resume(resumed_list) is None, "a finished game should not be resumed"
+    journal.close()
+    assert journal.has_saved_game() is False, "the finished game should be dropped"
@@ -1,5 +1,6 @@
 import pytest
-from core.linked_list import LinkedList
+from core.linked_list import LinkedList, CompactLinkedList
+from core.node import CompactNode
 
 def test_linked_list_initialization():
     """Test the initialization of the LinkedList class."""
@@ -83,4 +84,203 @@ def test_is_empty():
     linked_list = LinkedList()
     assert linked_list.is_empty() is True, "is_empty should be True"
     linked_list.add_question("q1", "a1", True)
-    assert linked_list.is_empty() is False, "is_empty should be False"
\ No newline at end of file
+    assert linked_list.is_empty() is False, "is_empty should be False"
+
+def test_tail_and_size_track_appends_and_deletes():
+    """test that tail and len() stay correct through add_question and delete_current_node"""
+    linked_list = LinkedList()
+    assert len(linked_list) == 0, "new list should have length 0"
+    assert linked_list.tail is None, "new list tail should be None"
+
+    linked_list.add_question("q1", "a1", True)
+    linked_list.add_question("q2", "a2", False)
+    linked_list.add_question("q3", "a3", True)
+    assert len(linked_list) == 3, "length should be 3 after three adds"
+    assert linked_list.tail.question == "q3", "tail should be the last added question"
+
+    # delete the tail, tail moves back to q2
+    linked_list.current = linked_list.tail
+    linked_list.delete_current_node()
+    assert len(linked_list) == 2, "length should be 2 after deleting the tail"
+    assert linked_list.tail.question == "q2", "tail should move back to q2"
+
+    # appending after deleting the tail links onto the new tail
+    linked_list.add_question("q4", "a4", True)
+    assert linked_list.head.next.next.question == "q4", "q4 should follow q2"
+    assert linked_list.tail.question == "q4", "tail should be q4"
+
+    # delete everything from the head
+    linked_list.current = linked_list.head
+    while not linked_list.is_empty():
+        linked_list.delete_current_node()
+    assert len(linked_list) == 0, "length should be 0 after deleting every node"
+    assert linked_list.tail is None, "tail should be None once the list is empty"
+
+def test_extend_links_batch():
+    """test that extend appends a whole batch in order and keeps tail and size in sync"""
+    linked_list = LinkedList()
+    linked_list.extend([])
+    assert linked_list.is_empty() is True, "extending with nothing should leave the list empty"
+
+    linked_list.add_question("q1", "a1", True)
+    linked_list.extend(("q" + str(i), "a" + str(i), i % 2 == 0) for i in range(2, 6))
+    assert len(linked_list) == 5, "length should be 5 after extending by four"
+    assert linked_list.current == linked_list.head, "current should stay at head"
+    assert linked_list.tail.question == "q5", "tail should be the last question of the batch"
+
+    questions = []
+    node = linked_list.head
+    while node:
+        questions.append(node.question)
+        node = node.next
+    assert questions == ["q1", "q2", "q3", "q4", "q5"], "batch should be linked in order"
+
+def test_delete_after_move_right_uses_previous():
+    """test that deleting middle and last nodes reached via move_right relinks correctly"""
+    linked_list = LinkedList()
+    linked_list.extend([("q1", "a1", True), ("q2", "a2", False), ("q3", "a3", True), ("q4", "a4", False)])
+
+    linked_list.move_right()
+    assert linked_list.previous.question == "q1", "previous should be q1 after moving right once"
+
+    # delete q2 (middle)
+    linked_list.delete_current_node()
+    assert linked_list.head.next.question == "q3", "q1 should link to q3 after deleting q2"
+    assert linked_list.current.question == "q3", "current should move to q3"
+    assert linked_list.previous.question == "q1", "previous should stay q1"
+
+    # delete q3 then q4 (last)
+    linked_list.delete_current_node()
+    linked_list.delete_current_node()
+    assert linked_list.current is None, "current should be None after deleting the last node"
+    assert linked_list.head.next is None, "only q1 should be left"
+    assert linked_list.tail == linked_list.head, "tail should be q1"
+    assert len(linked_list) == 1, "length should be 1"
+
+def test_delete_after_current_assigned_directly():
+    """test that a stale previous is ignored when current is set directly"""
+    linked_list = LinkedList()
+    linked_list.extend([("q1", "a1", True), ("q2", "a2", False), ("q3", "a3", True)])
+
+    linked_list.move_right()
+    linked_list.current = linked_list.tail  # previous (q1) is now stale
+    linked_list.delete_current_node()
+    assert linked_list.head.next.next is None, "q3 should be removed from the chain"
+    assert linked_list.tail.question == "q2", "tail should be q2"
+
+    linked_list.current = None
+    linked_list.delete_current_node()
+    assert len(linked_list) == 2, "deleting with no current node should do nothing"
+
+def test_compact_linked_list_navigation():
+    """test that CompactLinkedList builds compact nodes and navigates like LinkedList"""
+    linked_list = CompactLinkedList()
+    linked_list.add_question("q1", "a1", True)
+    linked_list.extend([("q2", "a2", False), ("q3", "a3", True)])
+    assert isinstance(linked_list.head, CompactNode), "nodes should be CompactNode"
+    assert isinstance(linked_list.tail, CompactNode), "extended nodes should be CompactNode"
+
+    linked_list.move_right()
+    linked_list.delete_current_node()
+    assert linked_list.current.question == "q3", "current should be q3 after deleting q2"
+    assert linked_list.head.next == linked_list.current, "q1 should link to q3"
+    assert len(linked_list) == 2, "length should be 2"
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_position_of_and_node_at(indexed):
+    """test that position_of/node_at follow the list through deletes, with and without the index"""
+    linked_list = LinkedList(indexed=indexed)
+    linked_list.add_question("q0", "a0", True)
+    linked_list.extend(("q" + str(i), "a" + str(i), True) for i in range(1, 6))
+
+    linked_list.move_right()
+    linked_list.move_right()
+    assert linked_list.position_of(linked_list.current) == 2, "current should be at position 2"
+    linked_list.delete_current_node()  # q2
+    assert linked_list.position_of(linked_list.current) == 2, "q3 should move up to position 2"
+    assert linked_list.node_at(2).question == "q3", "node_at(2) should be q3"
+    assert linked_list.node_at(4).question == "q5", "node_at(4) should be the tail"
+
+    linked_list.current = linked_list.head
+    linked_list.delete_current_node()  # q0
+    assert [linked_list.node_at(i).question for i in range(len(linked_list))] == ["q1", "q3", "q4", "q5"]
+
+    with pytest.raises(IndexError):
+        linked_list.node_at(4)
+    removed = linked_list.head
+    linked_list.delete_current_node()
+    with pytest.raises(ValueError):
+        linked_list.position_of(removed)
+
+def test_counting_records_calls_and_hops():
+    """test that counting() records calls and .next hops per operation, only inside the block"""
+    linked_list = LinkedList()
+    linked_list.add_question("q0", "a0", True)
+    assert linked_list.stats() == {}, "nothing should be counted outside counting()"
+
+    with linked_list.counting() as stats:
+        linked_list.extend(("q" + str(i), "a", True) for i in range(1, 5))
+        linked_list.is_empty()
+        linked_list.move_right()
+        linked_list.delete_current_node()  # uses previous: one hop
+        linked_list.current = linked_list.tail  # previous is stale: scan from head
+        linked_list.delete_current_node()
+        assert linked_list.stats()["is_empty"]["calls"] == 1, "stats() should report the running counts"
+
+    counts = stats.as_dict()
+    assert counts["move_right"] == {"calls": 1, "hops": 1, "max_hops": 1}, "move_right makes one hop"
+    assert counts["delete_current_node"]["calls"] == 2, "two deletes should be counted"
+    assert counts["delete_current_node"]["max_hops"] == 3, "the stale delete should show its scan"
+    assert stats.hops_per_call("delete_current_node") == 2, "average of 1 and 3 hops"
+    assert "add_question" not in counts, "calls before counting() should not be counted"
+
+    linked_list.move_right()
+    assert linked_list.stats() == {}, "counting should stop after the with block"
+
+def test_playthrough_has_no_linear_walks():
+    """test that a whole game of move_right/delete_current_node never walks the list"""
+    linked_list = LinkedList(indexed=True)
+    linked_list.extend(("q" + str(i), "a", i % 3 == 0) for i in range(1000))
+
+    with linked_list.counting() as stats:
+        while linked_list.current:
+            if linked_list.current.is_correct:
+                linked_list.move_right()
+            else:
+                linked_list.delete_current_node()
+            linked_list.position_of(linked_list.current) if linked_list.current else None
+
+    for operation, counts in stats.as_dict().items():
+        assert counts["max_hops"] <= 1, operation + " should not walk the list"
+
+def test_concat_splices_other_list():
+    """test that concat moves another list's nodes onto the end and empties it"""
+    linked_list = LinkedList(indexed=True)
+    other = LinkedList()
+    linked_list.concat(other)
+    assert linked_list.is_empty() is True, "concatenating an empty list changes nothing"
+
+    other.extend([("q1", "a1", True), ("q2", "a2", False)])
+    linked_list.concat(other)
+    assert linked_list.current.question == "q1", "current should start at the spliced head"
+    other.extend([("q3", "a3", True)])
+    linked_list.concat(other)
+
+    assert other.is_empty() is True and len(other) == 0, "other should be left empty"
+    assert len(linked_list) == 3, "length should be 3"
+    assert linked_list.tail.question == "q3", "tail should be the last spliced node"
+    assert linked_list.node_at(2).question == "q3", "indexed lists should index spliced nodes"
+
+def test_copy_is_independent():
+    """test that copy clones the questions into fresh nodes that can be changed separately"""
+    linked_list = CompactLinkedList()
+    linked_list.extend([("q1", "a1", True), ("q2", "a2", False), ("q3", "a3", True)])
+    linked_list.move_right()
+    clone = linked_list.copy(indexed=True)
+
+    assert isinstance(clone.head, CompactNode), "copy should keep the node class"
+    assert clone.current is clone.head, "copy should start at its head"
+    assert clone.node_at(2).question == "q3", "indexed copy should index every node"
+    clone.delete_current_node()
+    assert len(clone) == 2 and len(linked_list) == 3, "deleting from the copy should not touch the original"
+    assert linked_list.head.next.question == "q2", "original links should be unchanged"
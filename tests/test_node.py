@@ -1,5 +1,4 @@
-import pytest
-from core.node import Node
+from core.node import Node, CompactNode
 
 def test_node_creation():
     question = "what is my name?"
@@ -10,4 +9,13 @@ def test_node_creation():
     assert trivia_question_1.question == question, "question not set correctly"
     assert trivia_question_1.answer == answer, "answer not set correctly"
     assert trivia_question_1.is_correct == is_correct, "is_correct not set correctly"
-    assert trivia_question_1.next is None, "next should be none initially"
\ No newline at end of file
+    assert trivia_question_1.next is None, "next should be none initially"
+
+def test_compact_node_creation():
+    trivia_question_1 = CompactNode("what is 2 + 2?", "4", True)
+
+    assert trivia_question_1.question == "what is 2 + 2?", "question not set correctly"
+    assert trivia_question_1.answer == "4", "answer not set correctly"
+    assert trivia_question_1.is_correct is True, "is_correct not set correctly"
+    assert trivia_question_1.next is None, "next should be none initially"
+    assert not hasattr(trivia_question_1, "__dict__"), "compact node should not carry a __dict__"
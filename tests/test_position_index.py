@@ -0,0 +1,66 @@
+import random
+import pytest
+from core.node import Node
+from core.position_index import PositionIndex
+
+def test_position_index_append_and_lookup():
+    """test that appended nodes are found by position and position found by node"""
+    index = PositionIndex()
+    nodes = [Node("q" + str(i), "a", True) for i in range(10)]
+    for node in nodes:
+        index.append(node)
+    assert len(index) == 10, "index should hold 10 nodes"
+    for position, node in enumerate(nodes):
+        assert index.position_of(node) == position, "position_of should match append order"
+        assert index.node_at(position) is node, "node_at should match append order"
+
+def test_position_index_random_removals():
+    """test that lookups stay correct through removals and further appends"""
+    rng = random.Random(7)
+    index = PositionIndex()
+    expected = []
+    for i in range(300):
+        node = Node("q" + str(i), "a", True)
+        index.append(node)
+        expected.append(node)
+        if expected and rng.random() < 0.4:
+            victim = expected.pop(rng.randrange(len(expected)))
+            index.remove(victim)
+            assert victim.slot is None, "removed node should lose its slot"
+    assert len(index) == len(expected), "count should match surviving nodes"
+    for position, node in enumerate(expected):
+        assert index.position_of(node) == position, "position_of should skip removed nodes"
+        assert index.node_at(position) is node, "node_at should skip removed nodes"
+    assert index.alive == bytearray(node is not None for node in index.nodes), "alive should mirror the live slots"
+
+def test_position_index_extend_matches_append():
+    """test that extend indexes a chain of nodes, before and after removals"""
+    nodes = [Node("q" + str(i), "a", True) for i in range(40)]
+    for node, next_node in zip(nodes, nodes[1:]):
+        node.next = next_node
+    index = PositionIndex()
+    assert index.extend(nodes[0]) == 40, "extend should count the appended nodes"
+    index.remove(nodes[5])
+    more = [Node("m" + str(i), "a", True) for i in range(10)]
+    for node, next_node in zip(more, more[1:]):
+        node.next = next_node
+    index.extend(more[0])
+
+    index.restore(nodes[5], 6)
+    assert list(index.alive) == [0] + [1] * 50, "alive should track extend, remove and restore"
+    index.remove(nodes[5])
+    expected = nodes[:5] + nodes[6:] + more
+    for position, node in enumerate(expected):
+        assert index.position_of(node) == position, "position_of should follow list order"
+        assert index.node_at(position) is node, "node_at should follow list order"
+
+def test_position_index_out_of_range():
+    """test that node_at rejects positions outside the list"""
+    index = PositionIndex()
+    with pytest.raises(IndexError):
+        index.node_at(0)
+    index.append(Node("q", "a", True))
+    with pytest.raises(IndexError):
+        index.node_at(1)
+    with pytest.raises(IndexError):
+        index.node_at(-1)
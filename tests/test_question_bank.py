@@ -0,0 +1,91 @@
+import json
+import pytest
+from core.question_bank import convert_questions, MappedLinkedList, LazyNode
+
+RECORDS = [
+    {"question": "q1", "answer": "a1", "isCorrect": True},
+    {"question": "q2 – ünïcode", "answer": "a2", "isCorrect": False},
+    {"question": "q3", "answer": "", "isCorrect": True},
+    {"question": "q4", "answer": "a4", "isCorrect": False},
+]
+
+@pytest.fixture
+def bank_path(tmp_path):
+    json_path = tmp_path / "questions.json"
+    json_path.write_text(json.dumps(RECORDS), encoding="utf-8")
+    path = tmp_path / "questions.tqb"
+    assert convert_questions(str(json_path), str(path)) == len(RECORDS), "converter should report 4 questions"
+    return str(path)
+
+def collect(linked_list):
+    out = []
+    node = linked_list.head
+    while node:
+        out.append({"question": node.question, "answer": node.answer, "isCorrect": node.is_correct})
+        node = node.next
+    return out
+
+def test_mapped_list_round_trip(bank_path):
+    """test that a converted bank reads back in order with the same data"""
+    linked_list = MappedLinkedList(bank_path)
+    assert len(linked_list) == 4, "length should come from the bank header"
+    assert linked_list.current == linked_list.head, "current should start at head"
+    assert collect(linked_list) == RECORDS, "bank should read back the same questions"
+    assert linked_list.head.next.next.next is linked_list.tail, "traversal should reach the tail node object"
+    linked_list.close()
+
+def test_mapped_list_is_lazy(bank_path):
+    """test that nodes past head are only built when traversal reaches them"""
+    linked_list = MappedLinkedList(bank_path)
+    assert isinstance(linked_list.head, LazyNode), "head should be a lazy node"
+    assert linked_list.head._next is linked_list, "head's successor should not be loaded yet"
+    linked_list.move_right()
+    assert linked_list.current.question == "q2 – ünïcode", "move_right should load q2"
+    assert linked_list.current._next is linked_list, "q3 should not be loaded yet"
+    linked_list.close()
+
+def test_mapped_list_delete_and_append(bank_path):
+    """test that deleting and appending work like LinkedList"""
+    linked_list = MappedLinkedList(bank_path)
+    linked_list.move_right()
+    linked_list.delete_current_node()  # q2
+    linked_list.move_right()
+    linked_list.delete_current_node()  # q4, the tail
+    assert linked_list.tail.question == "q3", "tail should move back to q3"
+    linked_list.add_question("q5", "a5", True)
+    assert [r["question"] for r in collect(linked_list)] == ["q1", "q3", "q5"], "list should be q1, q3, q5"
+    assert len(linked_list) == 3, "length should be 3"
+    linked_list.close()
+
+def test_mapped_list_rejects_other_files(tmp_path):
+    """test that a file that is not a question bank raises ValueError"""
+    path = tmp_path / "questions.json"
+    path.write_text(json.dumps(RECORDS))
+    with pytest.raises(ValueError):
+        MappedLinkedList(str(path))
+
+def test_convert_rejects_invalid_items(tmp_path):
+    """test that the converter refuses trivia items without the required keys"""
+    json_path = tmp_path / "questions.json"
+    json_path.write_text(json.dumps([{"question": "q1"}]))
+    with pytest.raises(ValueError):
+        convert_questions(str(json_path), str(tmp_path / "questions.tqb"))
+
+def test_mapped_list_closes_as_context_manager(bank_path):
+    """test that leaving a with block unmaps the bank and closes its file"""
+    with MappedLinkedList(bank_path) as linked_list:
+        assert list(linked_list.records()) == [tuple(r.values()) for r in RECORDS], "records should read the table in order"
+    assert linked_list.map.closed and linked_list.file.closed, "the mapping and file should be released"
+
+@pytest.mark.parametrize("journaled", [False, True])
+def test_cli_loads_binary_bank(bank_path, tmp_path, journaled):
+    """test that the CLI recognises a binary bank by its magic and plays it"""
+    from ui.cli import TriviaGame
+    game = TriviaGame(journal_path=str(tmp_path / "game.journal") if journaled else None)
+    score = game.play_actions(['next', 'delete', 'next', 'delete'], bank_path)
+    assert isinstance(game.linked_list, MappedLinkedList) is not journaled, "only an unindexed game maps the bank"
+    assert score == 2 and len(game.linked_list) == 2, "q2 and q4 are wrong, so deleting them scores"
+    if journaled:
+        game.journal.close()
+    else:
+        game.linked_list.close()
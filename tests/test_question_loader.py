@@ -0,0 +1,41 @@
+import io
+import json
+import pytest
+from core.question_loader import iter_questions
+
+RECORDS = [
+    {"question": "q1", "answer": "a1", "isCorrect": True},
+    {"question": "q2 [with, brackets]", "answer": "a2 \"quoted\"", "isCorrect": False},
+    {"question": "q3", "answer": "a3", "isCorrect": True},
+]
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+def test_iter_questions_json_array(chunk_size):
+    """test that a top-level JSON array is parsed record by record across chunk boundaries"""
+    text = "\n  " + json.dumps(RECORDS, indent=4) + "\n"
+    assert list(iter_questions(io.StringIO(text), chunk_size)) == RECORDS, "records should match json.load"
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+def test_iter_questions_ndjson(chunk_size):
+    """test that NDJSON is read one record per line, skipping blank lines"""
+    text = "\n".join(json.dumps(record) for record in RECORDS) + "\n\n"
+    assert list(iter_questions(io.StringIO(text), chunk_size)) == RECORDS, "records should match the lines"
+
+def test_iter_questions_is_lazy():
+    """test that records are yielded before the rest of the file is read"""
+    text = json.dumps(RECORDS) + " this is not json"
+    records = iter_questions(io.StringIO(text), 8)
+    assert next(records) == RECORDS[0], "first record should be yielded straight away"
+
+def test_iter_questions_empty():
+    """test that empty files and empty arrays yield nothing"""
+    assert list(iter_questions(io.StringIO(""))) == [], "empty file yields nothing"
+    assert list(iter_questions(io.StringIO(" [ ] "))) == [], "empty array yields nothing"
+    assert list(iter_questions(io.StringIO("[1]   \n\n    "), 4)) == [1], "trailing whitespace is allowed"
+
+@pytest.mark.parametrize("text", ["[1,]", "[1 2]", "[{\"question\": ", "{\"question\": 1}\n{oops}",
+                                  "[1]]", "[1] garbage", "[1]\n\n      x"])
+def test_iter_questions_invalid(text):
+    """test that malformed input raises JSONDecodeError"""
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_questions(io.StringIO(text), 4))
@@ -0,0 +1,69 @@
+import sqlite3
+import threading
+import pytest
+from core.score_store import ScoreStore
+
+def test_scores_survive_a_restart(tmp_path):
+    """test that recorded games are committed on close and read back by a new store"""
+    path = str(tmp_path / "scores.db")
+    store = ScoreStore(path).start()
+    for player, score in [("ann", 3), ("bob", 7), ("ann", 5)]:
+        store.record(player, score, 1)
+    store.close()
+
+    reopened = ScoreStore(path).start()
+    assert [row[:2] for row in reopened.top_scores(2)] == [("bob", 7), ("ann", 5)], "top scores should be best first"
+    assert [row[0] for row in reopened.player_history("ann")] == [5, 3], "history should be newest first"
+    assert reopened.leaderboard() == reopened.top_scores(10), "the cached leaderboard should be loaded on open"
+    reopened.close()
+
+def test_record_batches_into_one_transaction(tmp_path):
+    """test that games recorded within flush_interval are inserted together and refresh the cache"""
+    updates = []
+    store = ScoreStore(str(tmp_path / "scores.db"), leaderboard_size=3, flush_interval=0.2,
+                       on_update=lambda: updates.append(threading.current_thread().name)).start()
+    for score in range(100):
+        store.record("ann", score, 0)
+    store.flush()
+    assert updates == ["score-store"], "100 quick games should be committed as one batch by the writer thread"
+    assert [row[1] for row in store.leaderboard()] == [99, 98, 97], "the cache should hold the new top scores"
+    store.close()
+
+def test_leaderboard_queries_use_indexes(tmp_path):
+    """test that top-k and player history are served by indexes, not full scans and sorts"""
+    path = str(tmp_path / "scores.db")
+    ScoreStore(path).start().close()
+    connection = sqlite3.connect(path)
+    top = connection.execute("EXPLAIN QUERY PLAN SELECT player, score, finished_at FROM games"
+                             " ORDER BY score DESC, finished_at LIMIT 10").fetchall()
+    history = connection.execute("EXPLAIN QUERY PLAN SELECT score, questions_left, finished_at FROM games"
+                                 " WHERE player = 'ann' ORDER BY finished_at DESC LIMIT 20").fetchall()
+    connection.close()
+    assert "games_by_score" in str(top) and "TEMP B-TREE" not in str(top), "top-k should walk the score index"
+    assert "games_by_player" in str(history) and "TEMP B-TREE" not in str(history), "history should use the player index"
+
+def test_cli_shows_leaderboard_and_closes_store(tmp_path, monkeypatch, capsys):
+    """test that the CLI saves a finished game, shows it on the leaderboard and closes the store"""
+    from ui.cli import TriviaGame
+    questions = tmp_path / "questions.json"
+    questions.write_text('[{"question": "q1", "answer": "a1", "isCorrect": true}]')
+    monkeypatch.setattr('builtins.input', lambda prompt: '3')
+    game = TriviaGame(scores_path=str(tmp_path / "scores.db"), player="ann")
+    game.cli_game_loop(str(questions))
+    assert "1. ann: 1" in capsys.readouterr().out, "the leaderboard should include the game just played"
+    assert game.scores.reader is None and not game.scores.thread.is_alive(), "the store should be closed"
+
+def test_failed_batch_is_raised_by_flush(tmp_path):
+    """test that a batch the writer cannot commit is reported by flush instead of hanging it"""
+    path = str(tmp_path / "scores.db")
+    store = ScoreStore(path, flush_interval=0.01).start()
+    connection = sqlite3.connect(path)
+    connection.execute("DROP TABLE games")  # every insert now fails
+    connection.close()
+    store.record("ann", 1, 0)
+    with pytest.raises(sqlite3.OperationalError):
+        store.flush()
+    store.record("ann", 2, 0)
+    with pytest.raises(sqlite3.OperationalError):
+        store.close()  # the writer kept running and reports the next failure too
+    assert not store.thread.is_alive(), "close should still stop the writer"
@@ -0,0 +1,50 @@
+import asyncio
+import json
+from core.shared_bank import SharedBank
+from ui.server import TriviaServer
+
+QUESTIONS = [("q1", "a1", True), ("q2", "a2", False), ("q3", "a3", True)]
+
+async def play(port, commands):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    messages = [json.loads(await reader.readline())]
+    for command in commands:
+        writer.write((command + "\n").encode())
+        await writer.drain()
+        expected = 1 if command in ("show", "quit", "bogus") else 2
+        for _ in range(expected):
+            messages.append(json.loads(await reader.readline()))
+    writer.close()
+    return messages
+
+def run_with_server(client):
+    async def main():
+        server = TriviaServer(SharedBank(QUESTIONS))
+        await server.start("127.0.0.1", 0)
+        port = server.server.sockets[0].getsockname()[1]
+        try:
+            return await client(port)
+        finally:
+            server.server.close()
+            await server.server.wait_closed()
+    return asyncio.run(main())
+
+def test_server_plays_a_game():
+    """test a full game over the line protocol"""
+    messages = run_with_server(lambda port: play(port, ["confirm", "bogus", "delete", "show", "next"]))
+    assert messages[0] == {"type": "question", "question": "q1", "answer": "a1", "score": 0}
+    assert messages[1]["outcome"] == "correct_confirm" and messages[1]["score"] == 1
+    assert messages[3]["type"] == "error", "unknown commands should get an error"
+    assert messages[4]["outcome"] == "correct_delete" and messages[4]["score"] == 2
+    assert messages[6]["question"] == "q3", "show should resend the current question"
+    assert messages[-1] == {"type": "game_over", "score": 2}
+
+def test_server_sessions_are_independent():
+    """test that concurrent clients each get their own list and score"""
+    async def clients(port):
+        return await asyncio.gather(*(play(port, ["delete"] * (i % 3 + 1)) for i in range(50)))
+    results = run_with_server(clients)
+    for i, messages in enumerate(results):
+        deletes = i % 3 + 1
+        expected_score = 1 if deletes >= 2 else 0
+        assert messages[-2]["score"] == expected_score, "each session should score on its own list"
@@ -0,0 +1,65 @@
+import json
+import pytest
+from core.shard_loader import shard_paths, parse_shard, load_shards
+
+def write_shards(directory):
+    """Writes three shards (one NDJSON) plus a file that is not a shard."""
+    (directory / "b.json").write_text(json.dumps([
+        {"question": "b1", "answer": "x", "isCorrect": True},
+        {"question": "b2", "answer": 2, "isCorrect": True},      # answer is not a str
+    ]))
+    (directory / "a.json").write_text(json.dumps([
+        {"question": "a1", "answer": "x", "isCorrect": False},
+        {"question": "a2", "answer": "x", "isCorrect": "yes"},   # isCorrect is not a bool
+        {"question": "a3", "answer": "x", "isCorrect": True},
+    ]))
+    (directory / "c.ndjson").write_text('{"question": "c1", "answer": "x", "isCorrect": false}\n')
+    (directory / "notes.txt").write_text("not a shard")
+
+def questions(linked_list):
+    out = []
+    node = linked_list.head
+    while node:
+        out.append(node.question)
+        node = node.next
+    return out
+
+def test_shard_paths_directory_and_glob(tmp_path):
+    write_shards(tmp_path)
+    assert [p.rsplit("/", 1)[-1] for p in shard_paths(str(tmp_path))] == ["a.json", "b.json", "c.ndjson"]
+    assert [p.rsplit("/", 1)[-1] for p in shard_paths(str(tmp_path / "*.json"))] == ["a.json", "b.json"]
+    with pytest.raises(FileNotFoundError):
+        shard_paths(str(tmp_path / "missing*.json"))
+
+def test_parse_shard_validates_types(tmp_path):
+    write_shards(tmp_path)
+    records, invalid = parse_shard(str(tmp_path / "a.json"))
+    assert records == [("a1", "x", False), ("a3", "x", True)], "only well-typed items should be kept"
+    assert len(invalid) == 1, "the item with a non-bool isCorrect should be reported"
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_load_shards_is_deterministic(tmp_path, max_workers):
+    """test that shards are spliced in sorted order whether parsed inline or in a pool"""
+    write_shards(tmp_path)
+    linked_list = load_shards(str(tmp_path), max_workers=max_workers)
+    assert questions(linked_list) == ["a1", "a3", "b1", "c1"], "questions should follow shard order"
+    assert len(linked_list) == 4, "length should count every valid question"
+    assert linked_list.current == linked_list.head, "current should start at head"
+
+def test_load_shards_reports_bad_json(tmp_path):
+    (tmp_path / "bad.json").write_text("[{\"question\": ")
+    with pytest.raises(ValueError):
+        load_shards(str(tmp_path))
+
+def test_pool_does_not_fork(tmp_path, monkeypatch):
+    """test that the worker pool never uses the fork start method"""
+    import concurrent.futures
+    start_methods = []
+    pool_class = concurrent.futures.ProcessPoolExecutor
+    def spy(*args, mp_context=None, **kwargs):
+        start_methods.append(mp_context.get_start_method() if mp_context is not None else None)
+        return pool_class(*args, mp_context=mp_context, **kwargs)
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", spy)
+    write_shards(tmp_path)
+    load_shards(str(tmp_path), max_workers=2)
+    assert start_methods and start_methods[0] in ("forkserver", "spawn"), "workers should not be forked"
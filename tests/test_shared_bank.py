@@ -0,0 +1,64 @@
+import random
+import pytest
+from core.linked_list import LinkedList
+from core.game import TriviaSession, DELETE, NEXT, CONFIRM
+from core.shared_bank import SharedBank, BankView
+
+QUESTIONS = [("q" + str(i), "a" + str(i), i % 3 == 0) for i in range(40)]
+
+def chain(linked_list):
+    out = []
+    node = linked_list.head
+    while node is not None:
+        out.append(node.question)
+        node = node.next
+    return out
+
+def test_bank_view_matches_linked_list():
+    """test that random moves and deletes leave a BankView in the same state as a LinkedList"""
+    rng = random.Random(3)
+    bank = SharedBank(QUESTIONS)
+    for _ in range(20):
+        view = BankView(bank)
+        linked_list = LinkedList()
+        linked_list.extend(QUESTIONS)
+        while linked_list.current is not None:
+            if rng.random() < 0.6:
+                view.delete_current_node()
+                linked_list.delete_current_node()
+            else:
+                view.move_right()
+                linked_list.move_right()
+            assert (view.current is None) == (linked_list.current is None), "both should end together"
+            if view.current is not None:
+                assert view.current.question == linked_list.current.question, "current should match"
+                assert view.position_of(view.current) == linked_list.position_of(linked_list.current)
+        assert chain(view) == chain(linked_list), "surviving questions should match"
+        assert len(view) == len(linked_list), "length should match"
+        assert view.is_empty() == linked_list.is_empty(), "is_empty should match"
+        if not view.is_empty():
+            assert view.tail.question == linked_list.tail.question, "tail should match"
+            for position in range(len(view)):
+                assert view.node_at(position).question == linked_list.node_at(position).question
+
+def test_views_share_the_bank_but_not_deletions():
+    """test that deleting in one session does not affect another"""
+    bank = SharedBank(QUESTIONS)
+    first = TriviaSession(BankView(bank))
+    second = TriviaSession(BankView(bank))
+    first.apply(DELETE)
+    first.apply(NEXT)
+    assert first.linked_list.head.question == "q1", "q0 should be gone from the first session"
+    assert second.linked_list.head.question == "q0", "q0 should still be in the second session"
+    assert second.apply(CONFIRM) == "correct_confirm", "q0 is correct"
+    assert first.linked_list.current == first.linked_list.head.next, "nodes compare by view and position"
+
+def test_bank_view_current_assignment():
+    """test assigning current like main.py does, and rejecting foreign nodes"""
+    bank = SharedBank(QUESTIONS)
+    view = BankView(bank)
+    view.move_right()
+    view.current = view.head
+    assert view.current.question == "q0", "current should be reset to head"
+    with pytest.raises(ValueError):
+        view.current = BankView(bank).head
@@ -0,0 +1,29 @@
+import subprocess
+import sys
+
+from benchmarks.benchmark import import_time, PROJECT_ROOT, STARTUP_BUDGETS
+
+def imported_modules(module):
+    """Returns the set of module names loaded after importing module in a fresh interpreter."""
+    code = f"import sys, {module}; print(' '.join(sys.modules))"
+    output = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+def test_cli_entry_point_skips_heavy_imports():
+    """test that the CLI entry point never loads pygame, numpy or the process pool"""
+    modules = imported_modules('main')
+    assert 'pygame' not in modules, "main.py should not import pygame"
+    assert 'numpy' not in modules, "main.py should not import numpy"
+    assert 'concurrent.futures' not in modules, "the process pool should only load for sharded banks"
+    assert 'sqlite3' not in modules, "sqlite3 should only load when scores are saved"
+
+def test_cli_import_time_within_budget():
+    """test that importing the CLI entry point stays within its startup budget"""
+    seconds = min(import_time('main') for _ in range(3))
+    assert seconds < STARTUP_BUDGETS['main'], f"main.py took {seconds * 1e3:.1f} ms to import"
+
+def test_gui_module_defers_sqlite():
+    """test that the GUI only loads sqlite3 when scores are saved"""
+    modules = imported_modules('ui.gui')
+    assert 'sqlite3' not in modules, "ui.gui should import the score store lazily"
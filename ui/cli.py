@@ -1,13 +1,37 @@
+import glob
+import os
+
 from core.linked_list import LinkedList
-import json
+from core.game import (replay, DELETE, NEXT, CONFIRM, NO_QUESTION, CORRECT_DELETE,
+                       WRONG_DELETE, SKIPPED, CORRECT_CONFIRM, WRONG_CONFIRM)
+from core.history import ActionHistory
+from core.journal import ActionJournal
+from core.question_bank import is_question_bank, MappedLinkedList
+from core.question_loader import iter_questions
 
 class TriviaGame:
     """
     TriviaGame class manages the trivia game logic and user interaction.
     """
-    def __init__(self):
-        self.linked_list = LinkedList()
+    def __init__(self, journal_path: str = None, scores_path: str = None, player: str = "Player"):
+        """
+        Args:
+            - journal_path (str): If given, every action is journaled to this file and an
+              unfinished game saved there is resumed (see core.journal.ActionJournal).
+            - scores_path (str): If given, finished games are saved to this SQLite database
+              and its leaderboard is shown at the end (see core.score_store.ScoreStore).
+            - player (str): Name the finished games are saved under.
+        """
+        # the journal identifies questions by their PositionIndex slot, so it needs an indexed list
+        self.linked_list = LinkedList(indexed=journal_path is not None)
         self.score = 0
+        self.history = ActionHistory(depth=100)
+        self.journal = ActionJournal(journal_path).start() if journal_path is not None else None
+        self.scores = None
+        if scores_path is not None:
+            from core.score_store import ScoreStore # sqlite3 costs ~20 ms to import, so only when used
+            self.scores = ScoreStore(scores_path).start()
+        self.player = player
 
     def display_current_question(self) -> None:
         """Displays the current trivia questions and answers to the user.
@@ -39,71 +63,173 @@ class TriviaGame:
         print("1. Delete Question (if wrong)")
         print("2. Next Question")
         print("3. Confirm correct answer")
+        print("4. Undo last action")
+        print("5. Redo")
 
         while True:
-            choice = input("Enter your choice (1 - 3): ")
-            if choice in ('1', '2', '3'):
+            choice = input("Enter your choice (1 - 5): ")
+            if choice in ('1', '2', '3', '4', '5'):
                 break
             else:
                 print("Invalid choice.")
 
-        if choice == '1':
-            if self.linked_list.current is None:
-                print("No trivia questions available to delete.")
-                return
-            elif self.linked_list.current.is_correct:
-                print("the question and answer pair was correct, should not have deleted, no points")
-            elif self.linked_list.current.is_correct is not True:
-                print("✅ Correct (+1 point), deleted wrong question answer pair!")
-                self.score += 1
-            self.linked_list.delete_current_node()
-        elif choice == '2':
-            print("⏭️  Moving to next question... no points added")
-            self.linked_list.move_right()
-            if self.linked_list.current is None:
-                print("You've reached the end!")
-        elif choice == '3':
-            if self.linked_list.current is None:
-                print("You've reached the end!")
-            elif self.linked_list.current.is_correct:
-                print("✅ Correct (+1 point), kept correct question and answer pair!")
-                self.score += 1
-                self.linked_list.move_right()
+        if choice in ('4', '5'):
+            score = self.history.undo(self.linked_list) if choice == '4' else self.history.redo(self.linked_list)
+            if score is None:
+                print("Nothing to undo." if choice == '4' else "Nothing to redo.")
             else:
-                print("❌ Incorrect! ", self.linked_list.current.answer, " no points")
-                self.linked_list.move_right()
+                self.score = score
+                print("↩️  Undid last action." if choice == '4' else "↪️  Redid last action.")
+                if self.journal is not None:
+                    self.journal.snapshot(self.linked_list, self.score) # the journal only replays forward
+            return
+
+        action = {'1': DELETE, '2': NEXT, '3': CONFIRM}[choice]
+        answer = self.linked_list.current.answer if self.linked_list.current else None
+        if action == NEXT:
+            print("⏭️  Moving to next question... no points added")
+        outcome, self.score = self.history.apply(self.linked_list, action, self.score)
+        if self.journal is not None:
+            self.journal.record(action, self.linked_list, self.score)
+
+        if outcome == NO_QUESTION and action == DELETE:
+            print("No trivia questions available to delete.")
+        elif outcome == NO_QUESTION:
+            print("You've reached the end!")
+        elif outcome == WRONG_DELETE:
+            print("the question and answer pair was correct, should not have deleted, no points")
+        elif outcome == CORRECT_DELETE:
+            print("✅ Correct (+1 point), deleted wrong question answer pair!")
+        elif outcome == SKIPPED and self.linked_list.current is None:
+            print("You've reached the end!")
+        elif outcome == CORRECT_CONFIRM:
+            print("✅ Correct (+1 point), kept correct question and answer pair!")
+        elif outcome == WRONG_CONFIRM:
+            print("❌ Incorrect! ", answer, " no points")
 
     def display_score(self) -> None:
         """Displays the current game score."""
         print(f"\n⭐ Your Score: {self.score} points")
 
-    def load_questions(self):
-        """Loads a mix of true and false trivia questions"""
-        with open("data/questions.json") as file:
-            dictionary = json.load(file)
-        for trivia in dictionary:
-            self.linked_list.add_question(trivia['question'], trivia['answer'], trivia['isCorrect'])
+    def load_questions(self, source: str = "data/questions.json"):
+        """Loads a mix of true and false trivia questions
+
+        Args:
+            - source (str): A question file, a binary question bank (see core.question_bank),
+              or a directory / glob of shard files that are parsed in parallel (see core.shard_loader).
+        """
+        if os.path.isdir(source) or glob.has_magic(source):
+            from core.shard_loader import load_shards # only needed for sharded banks, keeps CLI startup lean
+            load_shards(source, self.linked_list)
+        elif is_question_bank(source):
+            if self.linked_list.index is None:
+                self.linked_list = MappedLinkedList(source) # opens in O(1) whatever the bank size
+            else:
+                # the journal needs PositionIndex slots, so the bank is copied into the indexed list
+                with MappedLinkedList(source) as bank:
+                    self.linked_list.extend(bank.records())
+        else:
+            with open(source) as file:
+                self.linked_list.extend(
+                    (trivia['question'], trivia['answer'], trivia['isCorrect']) for trivia in iter_questions(file)
+                )
         self.linked_list.current = self.linked_list.head  # Set starting point
+        self.history.clear()
+
+    def play_actions(self, actions, source: str = "data/questions.json") -> int:
+        """Plays a stream of actions headlessly (no input() or print()).
+
+        Loads the questions first if the list is empty, then replays the actions
+        from the current position.
 
-    def cli_game_loop(self):
-        """Main game loop for the CLI trivia game."""
+        Args:
+            - actions (iterable): Action tokens such as 'delete'/'next'/'confirm' or '1'/'2'/'3'.
+            - source (str): Where to load the questions from (see load_questions).
+        Returns:
+            - int: The final score; the surviving questions stay in self.linked_list.
+        """
+        if self.linked_list.is_empty():
+            self.load_questions(source)
+        self.score, self.linked_list = replay(self.linked_list, actions, self.score)
+        self.history.clear() # replay does not log its actions
+        return self.score
+
+    def cli_game_loop(self, source: str = "data/questions.json"):
+        """Main game loop for the CLI trivia game.
+
+        Args:
+            - source (str): Where to load the questions from (see load_questions).
+        """
         print("\n=== Trivia Trek Challenge ===")
         print("Rules:")
         print("- Delete (1) wrong answers (+1 point)")
         print("- Skip (2) to next question")
-        print("- Confirm (3) correct answers (+1 point)\n")
-
-        self.load_questions()
-
-        while self.linked_list.current:
-            self.display_current_question()
-            self.handle_user_choice()
-
-            if self.linked_list.current is None:
-                break
+        print("- Confirm (3) correct answers (+1 point)")
+        print("- Undo (4) / Redo (5) your last actions\n")
+
+        self.load_questions(source)
+        self.resume_journal(source)
+
+        try:
+            while self.linked_list.current:
+                self.display_current_question()
+                self.handle_user_choice()
+
+                if self.linked_list.current is None:
+                    break
+            if self.journal is not None:
+                self.journal.reset() # Finished, so there is nothing to resume next time
+            if self.scores is not None:
+                self.scores.record(self.player, self.score, len(self.linked_list))
+        finally:
+            if self.journal is not None:
+                self.journal.close()
+            if isinstance(self.linked_list, MappedLinkedList):
+                self.linked_list.close()
 
         # Game over summary
         print("\n=== Game Results ===")
         print(f"Final Score: {self.score}")
+        if self.scores is not None:
+            import sqlite3 # already loaded by the score store
+            try:
+                self.scores.flush() # the leaderboard should include the game just recorded
+                self.display_leaderboard()
+            except sqlite3.Error as error:
+                print(f"Could not save your score: {error}")
+            finally:
+                self.scores.close()
+
+    def display_leaderboard(self) -> None:
+        """Displays the best saved games and this player's recent ones."""
+        print("\n=== Leaderboard ===")
+        for rank, (player, score, _) in enumerate(self.scores.top_scores(5), 1):
+            print(f"{rank}. {player}: {score}")
+        history = self.scores.player_history(self.player, 5)
+        if history:
+            print(f"\nYour last games: {', '.join(str(score) for score, _, _ in history)}")
+
+    def resume_journal(self, source: str = "data/questions.json") -> None:
+        """Restores the unfinished game saved in the journal, if there is one.
+
+        Args:
+            - source (str): Where the questions were loaded from, to load them again
+              if the saved game turns out to have ended already.
+        """
+        if self.journal is None:
+            return
+        try:
+            score = self.journal.resume(self.linked_list)
+        except ValueError as error:
+            print(f"Could not resume the saved game: {error}")
+            self.journal.reset()
+            return
+        if score is None and self.linked_list.current is None:
+            # the saved game had already ended and was dropped, but the list was played to its end
+            self.linked_list = LinkedList(indexed=True)
+            self.load_questions(source)
+        elif score is not None:
+            self.score = score
+            print(f"💾 Resumed your saved game (score {self.score}).")
 
 
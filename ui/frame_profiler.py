@@ -0,0 +1,100 @@
+import json
+import time
+from collections import deque
+
+
+class FrameProfiler:
+    """
+    Optional per-phase frame timing for TriviaGameGUI.
+
+    attach() wraps the GUI's phase methods (input handling, each draw step, text
+    drawing and the display update) on the instance, so a GUI without a profiler
+    runs completely untouched code. Per frame it records how long each phase
+    took, keeps the last `window` frames for rolling p50/p95/p99, and keeps a
+    bounded list of trace events that can be written out in Chrome's trace event
+    format (loadable in chrome://tracing or Perfetto).
+
+    Phase times are inclusive: draw_text time is also counted in the draw step
+    that called it.
+    """
+    PHASES = (
+        'handle_input',
+        'poll_background_load',
+        'draw_gradient_background',
+        'draw_list',
+        'draw_header_footer',
+        'draw_buttons',
+        'draw_scroll_indicators',
+        'draw_game_over',
+        'draw_text',
+        'update_display',
+    )
+
+    def __init__(self, window: int = 300, max_trace_events: int = 200000) -> None:
+        self.window = window
+        self.samples = {}                 # phase -> deque of per-frame seconds
+        self.frame_phases = {}            # phase -> seconds spent so far this frame
+        self.trace = deque(maxlen=max_trace_events)
+        self.origin = time.perf_counter()
+        self.frame_start = self.origin
+        self.frame_count = 0
+        self.overlay_visible = False
+
+    def attach(self, gui) -> None:
+        """Wraps gui's phase methods so every call is timed."""
+        for name in self.PHASES:
+            method = getattr(type(gui), name).__get__(gui)  # class method, so re-attaching never double-wraps
+            setattr(gui, name, self.timed(name, method))
+
+    def timed(self, name: str, function):
+        """Returns function wrapped so that its run time counts towards phase name."""
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                self.frame_phases[name] = self.frame_phases.get(name, 0.0) + (end - start)
+                self.add_trace_event(name, start, end)
+        return wrapper
+
+    def add_trace_event(self, name: str, start: float, end: float) -> None:
+        """Records a complete ("X") trace event, timestamps in microseconds."""
+        self.trace.append({
+            'name': name, 'ph': 'X', 'pid': 1, 'tid': 1,
+            'ts': (start - self.origin) * 1e6, 'dur': (end - start) * 1e6,
+        })
+
+    def start_frame(self) -> None:
+        """Marks the start of a frame's work (after any idle wait for events)."""
+        self.frame_start = time.perf_counter()
+        self.frame_phases = {}
+
+    def end_frame(self) -> None:
+        """Closes the frame: stores each phase's time and the whole frame's time."""
+        end = time.perf_counter()
+        self.frame_phases['frame'] = end - self.frame_start
+        self.add_trace_event('frame', self.frame_start, end)
+        for name, seconds in self.frame_phases.items():
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.window)
+            self.samples[name].append(seconds)
+        self.frame_phases = {}
+        self.frame_count += 1
+
+    def percentiles(self, name: str, quantiles=(50, 95, 99)) -> tuple:
+        """Returns the nearest-rank percentiles (in seconds) of phase name over the rolling window."""
+        values = sorted(self.samples.get(name, ()))
+        if not values:
+            return tuple(0.0 for _ in quantiles)
+        return tuple(values[min(len(values) - 1, max(0, -(-q * len(values) // 100) - 1))] for q in quantiles)
+
+    def summary(self) -> dict:
+        """Returns {phase: (p50, p95, p99)} in seconds for every phase seen so far, frame first."""
+        names = ['frame'] + [name for name in self.PHASES if name in self.samples]
+        return {name: self.percentiles(name) for name in names if name in self.samples}
+
+    def dump_trace(self, path: str) -> None:
+        """Writes the recorded trace events as a Chrome trace event JSON file."""
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': list(self.trace), 'displayTimeUnit': 'ms'}, file)
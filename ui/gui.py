@@ -2,19 +2,32 @@
 
 import pygame
 import sys
+import os
+import glob
 import json
+from collections import OrderedDict
 import math # For gradient calculations if needed, or other math functions
 from pygame.locals import *
 from core.linked_list import LinkedList
+from core.game import CORRECT_DELETE, WRONG_DELETE, SKIPPED, CORRECT_CONFIRM, WRONG_CONFIRM
+from core.question_bank import is_question_bank, MappedLinkedList
+from core.question_loader import iter_questions
+from core.shard_loader import iter_shards
+from core.background_loader import BackgroundLoader
+from core.history import ActionHistory
+from core.journal import ActionJournal
+from ui.frame_profiler import FrameProfiler
 from core.node import Node # Although LinkedList handles Node creation, importing helps with type hinting if needed
 
+LEADERBOARD_UPDATED = pygame.USEREVENT + 1 # Posted by the score store's writer thread after the leaderboard changes
+
 class TriviaGameGUI:
     """
     Manages the Pygame GUI for the Trivia Trek game. (Visually Enhanced Version)
     Visualizes the linked list, handles user interaction via buttons,
     and displays game state with improved aesthetics.
     """
-    def __init__(self, screen_width=1000, screen_height=650): # Increased height slightly
+    def __init__(self, screen_width=1000, screen_height=650, profiler=None, trace_path=None, questions_path=None, defer_load=False, journal_path=None, scores_path=None, player="Player"): # Increased height slightly
         # --- Pygame Setup ---
         pygame.init()
         self.screen_width = screen_width
@@ -70,10 +83,11 @@ class TriviaGameGUI:
         self.BUTTON_HEIGHT = 50
         self.BUTTON_ROUNDING = 12
         self.SCROLL_SPEED = 30
+        self.TEXT_CACHE_SIZE = 512 # Max cached (text, font, color, max_width) layouts
         self.NODE_Y_POSITION = self.NODE_AREA_Y + (self.NODE_AREA_HEIGHT - self.NODE_HEIGHT) // 2 # Center vertically
 
         # --- Game State ---
-        self.linked_list = LinkedList()
+        self.linked_list = LinkedList(indexed=True) # indexed so scrolling can look up node positions in O(log n)
         self.score = 0
         self.game_over = False
         self.scroll_offset = 0
@@ -81,60 +95,198 @@ class TriviaGameGUI:
         self.feedback_icon = ""
         self.feedback_color = self.BLACK
         self.feedback_timer = 0
-        self.total_nodes = 0
+        self.history = ActionHistory(depth=100) # U undoes and Y redoes the last actions
+        # journal_path: journal every action there so a crashed game can be resumed (see core.journal)
+        self.journal = ActionJournal(journal_path).start() if journal_path is not None else None
+        # scores_path: save finished games there and show the leaderboard on the game over screen (see core.score_store)
+        self.player = player
+        self.scores = None
+        if scores_path is not None:
+            from core.score_store import ScoreStore # sqlite3 is only imported when scores are saved
+            self.scores = ScoreStore(scores_path, leaderboard_size=5, on_update=self.post_leaderboard_update).start()
+
+        # --- Render Caches ---
+        self.background_surface = None # Pre-rendered gradient, see draw_gradient_background
+        self.text_cache = OrderedDict() # LRU of rendered text lines, see render_text
+
+        # --- Profiling (optional) ---
+        # A FrameProfiler times each phase of run_game; F3 toggles its overlay.
+        # trace_path: where to write a Chrome trace of the session on quit.
+        self.profiler = profiler
+        self.trace_path = trace_path
+        if self.profiler is not None:
+            self.profiler.attach(self)
 
         # --- Load Data & Setup ---
-        self.load_questions()
+        # questions_path: a question file, or a directory / glob of shard files; None = data/questions.json
+        # defer_load: leave the bank to run_game, which loads it in the background while the game is already running
+        self.questions_path = questions_path
+        self.questions_loaded = False
+        self.question_template = None # Pristine copy of the loaded bank, cloned by reset_game
+        self.loader = None # BackgroundLoader while the bank is loading in the background
+        if not defer_load:
+            self.load_questions()
         self.create_buttons()
+        self.create_dirty_regions()
+        if not defer_load:
+            self.resume_journal()
 
     def load_questions(self):
-        """Loads trivia questions from questions.json into the linked list."""
+        """Loads trivia questions from questions.json (or self.questions_path) into the linked list."""
+        self.questions_loaded = True
         try:
-            # Adjust path if running from main.py in root. If running gui.py directly, might need "data/questions.json"
-            file_path = "data/questions.json"
-            # Let's try relative to gui.py first for direct execution case, then fallback
-            try:
-                with open("../data/questions.json") as file:
-                     dictionary = json.load(file)
-            except FileNotFoundError:
-                 # print("Trying path relative to project root...")
-                 with open("data/questions.json") as file:
-                      dictionary = json.load(file)
-
-            if not dictionary:
-                 raise ValueError("JSON file is empty.")
-            for trivia in dictionary:
-                if not all(k in trivia for k in ('question', 'answer', 'isCorrect')):
-                     print(f"Warning: Skipping invalid trivia item: {trivia}")
-                     continue
-                self.linked_list.add_question(trivia['question'], trivia['answer'], trivia['isCorrect'])
+            self.linked_list.extend(self.iter_question_records())
+            if self.linked_list.is_empty():
+                 raise ValueError("JSON file has no trivia questions.")
             self.linked_list.current = self.linked_list.head
-            temp = self.linked_list.head
-            count = 0
-            while temp:
-                count += 1
-                temp = temp.next
-            self.total_nodes = count
+            self.question_template = self.linked_list.copy(indexed=False)
+        except (FileNotFoundError, json.JSONDecodeError, ValueError) as e:
+            self.report_load_error(e)
+
+    def iter_question_records(self):
+        """Yields (question, answer, is_correct) for every valid question in the bank.
+
+        self.questions_path may be a question file, a binary question bank (see
+        core.question_bank) or a directory / glob of shard files (parsed in parallel
+        worker processes); None means data/questions.json.
+        """
+        if self.questions_path is not None and (os.path.isdir(self.questions_path) or glob.has_magic(self.questions_path)):
+            for path, records, invalid in iter_shards(self.questions_path):
+                for item in invalid:
+                    print(f"Warning: Skipping invalid trivia item in {path}: {item}")
+                yield from records
+        elif self.questions_path is not None and is_question_bank(self.questions_path):
+            # Records come straight from the mapped record table, with no parsing
+            with MappedLinkedList(self.questions_path) as bank:
+                yield from bank.records()
+        else:
+            # Stream records straight into the list instead of json.load-ing the whole bank first
+            with (open(self.questions_path) if self.questions_path is not None else self.open_default_questions()) as file:
+                yield from self.valid_trivia(iter_questions(file))
+
+    def start_background_load(self):
+        """Starts reading the bank on a background thread; run_game adds the questions as they arrive.
+
+        The player can start on the first question while the rest is still loading.
+        A pristine template for reset_game is built alongside, on the loader thread.
+        """
+        self.questions_loaded = True
+        template = LinkedList()
+        def produce():
+            for record in self.iter_question_records():
+                template.add_question(*record)
+                yield record
+        self.loading_template = template
+        self.loader = BackgroundLoader(produce, self.linked_list.node_class).start()
+
+    def poll_background_load(self):
+        """Splices in the questions loaded since the last frame, and finishes up once loading is done."""
+        if self.loader.poll(self.linked_list):
+            self.mark_dirty(self.scroll_area_rect)
+            self.mark_dirty(self.score_rect) # loading progress is shown in the header
+        if not self.loader.done:
+            return
+        error = self.loader.error
+        self.loader = None
+        self.mark_dirty(self.score_rect)
+        if error is None and self.loading_template.is_empty():
+            error = ValueError("JSON file has no trivia questions.")
+        if error is not None:
+            if not isinstance(error, (FileNotFoundError, json.JSONDecodeError, ValueError)):
+                raise error
+            self.report_load_error(error)
+            return
+        self.question_template = self.loading_template
+        if self.linked_list.current is None: # The player already got past the last question
+            self.end_game()
 
-        except FileNotFoundError:
-            print(f"Error: data/questions.json not found. Searched relative to gui.py and project root.")
+    def resume_journal(self):
+        """Restores the unfinished game saved in the journal by an earlier run, if there is one."""
+        if self.journal is None or self.linked_list.is_empty():
+            return
+        try:
+            score = self.journal.resume(self.linked_list)
+        except ValueError as e:
+            print(f"Warning: Could not resume the saved game: {e}")
+            self.journal.reset()
+            return
+        if score is None:
+            if self.linked_list.current is None: # The saved game had already ended, so start a fresh one
+                self.reset_game()
+            return
+        self.score = score
+        self.feedback_message = "Resumed saved game."
+        self.feedback_icon = "💾"
+        self.feedback_color = self.BLUE
+        self.feedback_timer = 150
+        self.auto_scroll_to_current()
+        self.mark_dirty()
+
+    def report_load_error(self, error):
+        """Prints a load error, shows it as feedback and leaves the list empty."""
+        if isinstance(error, FileNotFoundError):
+            if self.questions_path is not None:
+                print(f"Error: no question files found at {self.questions_path}.")
+            else:
+                print(f"Error: data/questions.json not found. Searched relative to gui.py and project root.")
             self.feedback_message = "Error: questions.json not found!"
-            self.feedback_icon = "❌"
-            self.feedback_color = self.RED
-            self.feedback_timer = 300
-            self.linked_list.head = None
-            self.linked_list.current = None
-            self.total_nodes = 0
-        except (json.JSONDecodeError, ValueError) as e:
-            print(f"Error: Could not load or parse question data. Check format/content. Error: {e}")
+        else:
+            print(f"Error: Could not load or parse question data. Check format/content. Error: {error}")
             self.feedback_message = "Error: Invalid question data!"
-            self.feedback_icon = "❌"
-            self.feedback_color = self.RED
-            self.feedback_timer = 300
-            self.linked_list.head = None
-            self.linked_list.current = None
-            self.total_nodes = 0
-
+        self.feedback_icon = "❌"
+        self.feedback_color = self.RED
+        self.feedback_timer = 300
+        self.linked_list.clear()
+        self.history.clear() # its entries point into the list just emptied
+        if self.journal is not None:
+            self.journal.reset()
+
+    def reset_game(self):
+        """Starts a new game, keeping the window, fonts and render caches.
+
+        The list is cloned from question_template in O(n) rather than re-reading and
+        re-parsing the bank. If the last load failed, loading is simply retried.
+        """
+        self.record_score() # The game being left, if it was finished
+        self.score = 0
+        self.game_over = False
+        self.scroll_offset = 0
+        self.feedback_message = ""
+        self.feedback_icon = ""
+        self.feedback_color = self.BLACK
+        self.feedback_timer = 0
+        self.history.clear()
+        if self.journal is not None:
+            self.journal.reset()
+        if self.question_template is not None:
+            self.linked_list = self.question_template.copy(indexed=True)
+        else:
+            self.linked_list = LinkedList(indexed=True)
+            self.load_questions()
+        self.mark_dirty()
+
+    def open_default_questions(self):
+        """Opens data/questions.json."""
+        # Adjust path if running from main.py in root. If running gui.py directly, might need "data/questions.json"
+        # Let's try relative to gui.py first for direct execution case, then fallback
+        try:
+            return open("../data/questions.json")
+        except FileNotFoundError:
+             # print("Trying path relative to project root...")
+             return open("data/questions.json")
+
+    def valid_trivia(self, dictionary):
+        """Yields (question, answer, is_correct) for each well-formed trivia item, skipping the rest."""
+        for trivia in dictionary:
+            if not isinstance(trivia, dict) or not all(k in trivia for k in ('question', 'answer', 'isCorrect')):
+                 print(f"Warning: Skipping invalid trivia item: {trivia}")
+                 continue
+            yield trivia['question'], trivia['answer'], trivia['isCorrect']
+
+    @property
+    def total_nodes(self):
+        """Number of nodes currently in the linked list (kept live by LinkedList)."""
+        return len(self.linked_list)
 
     def create_buttons(self):
         """Creates the Rect objects for the UI buttons in the footer."""
@@ -148,26 +300,61 @@ class TriviaGameGUI:
         self.next_button = pygame.Rect(start_x + self.BUTTON_WIDTH + button_spacing, self.button_y, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
         self.confirm_button = pygame.Rect(start_x + 2 * (self.BUTTON_WIDTH + button_spacing), self.button_y, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
 
+    def create_dirty_regions(self):
+        """Creates the screen regions that run_game repaints when their content changes."""
+        feedback_area_top = self.screen_height - self.FOOTER_HEIGHT
+        self.scroll_area_rect = pygame.Rect(0, self.NODE_AREA_Y, self.screen_width, self.NODE_AREA_HEIGHT)
+        self.score_rect = pygame.Rect(0, 0, self.screen_width, self.HEADER_HEIGHT)
+        # the feedback icon pokes slightly above the footer, so start a little higher
+        self.feedback_rect = pygame.Rect(0, feedback_area_top - 10, self.screen_width, self.button_y - feedback_area_top + 10)
+        self.profiler_overlay_rect = pygame.Rect(10, 10, 380, 0) # Height set when drawn
+        self.dirty_rects = [self.screen.get_rect()] # First frame paints everything
+
+    def mark_dirty(self, rect=None):
+        """Queues a region to be repainted on the next frame (the whole screen if rect is None)."""
+        self.dirty_rects.append(rect if rect is not None else self.screen.get_rect())
+
     def draw_gradient_background(self):
-        """Draws a vertical gradient background."""
-        for y in range(self.screen_height):
-            ratio = y / self.screen_height
+        """Draws a vertical gradient background.
+
+        The gradient is rendered once into self.background_surface and blitted every
+        frame; it is rebuilt only when the window size changes.
+        """
+        size = self.screen.get_size()
+        if self.background_surface is None or self.background_surface.get_size() != size:
+            self.background_surface = self.render_gradient(size)
+        self.screen.blit(self.background_surface, (0, 0))
+
+    def render_gradient(self, size):
+        """Renders the vertical background gradient onto a new Surface of the given size."""
+        width, height = size
+        surface = pygame.Surface(size).convert()
+        for y in range(height):
+            ratio = y / height
             color = (
                 int(self.BG_GRADIENT_TOP[0] * (1 - ratio) + self.BG_GRADIENT_BOTTOM[0] * ratio),
                 int(self.BG_GRADIENT_TOP[1] * (1 - ratio) + self.BG_GRADIENT_BOTTOM[1] * ratio),
                 int(self.BG_GRADIENT_TOP[2] * (1 - ratio) + self.BG_GRADIENT_BOTTOM[2] * ratio)
             )
-            pygame.draw.line(self.screen, color, (0, y), (self.screen_width, y))
+            pygame.draw.line(surface, color, (0, y), (width, y))
+        return surface
+
+    def render_text(self, text, font, color, max_width=None):
+        """Returns the rendered line surfaces for text, wrapped to max_width if given.
+
+        Results are kept in a bounded LRU cache keyed on (text, font, color, max_width),
+        so steady-state frames reuse surfaces instead of re-wrapping and re-rendering.
+        """
+        key = (text, font, color, max_width)
+        line_surfaces = self.text_cache.get(key)
+        if line_surfaces is not None:
+            self.text_cache.move_to_end(key)
+            return line_surfaces
 
-    def draw_text(self, text, font, color, surface, x, y, center=False, center_x=False, center_y=False, max_width=None):
-        """Enhanced helper function to draw text with better centering and wrapping."""
         if max_width:
             words = text.split(' ')
             lines = []
             current_line = ""
-            line_surfaces = []
-            total_height = 0
-            line_height = font.get_linesize()
 
             for word in words:
                 test_line = current_line + word + " "
@@ -177,11 +364,21 @@ class TriviaGameGUI:
                     lines.append(current_line.strip())
                     current_line = word + " "
             lines.append(current_line.strip()) # Add the last line
+        else: # No wrapping needed
+            lines = [text]
 
-            for line in lines:
-                 line_surf = font.render(line, True, color)
-                 line_surfaces.append(line_surf)
-                 total_height += line_height
+        line_surfaces = [font.render(line, True, color) for line in lines]
+        self.text_cache[key] = line_surfaces
+        if len(self.text_cache) > self.TEXT_CACHE_SIZE:
+            self.text_cache.popitem(last=False) # Evict least recently used
+        return line_surfaces
+
+    def draw_text(self, text, font, color, surface, x, y, center=False, center_x=False, center_y=False, max_width=None):
+        """Enhanced helper function to draw text with better centering and wrapping."""
+        line_surfaces = self.render_text(text, font, color, max_width)
+        if max_width:
+            line_height = font.get_linesize()
+            total_height = line_height * len(line_surfaces)
 
             start_y = y
             if center_y or center:
@@ -203,7 +400,7 @@ class TriviaGameGUI:
 
 
         else: # No wrapping needed
-             text_surface = font.render(text, True, color)
+             text_surface = line_surfaces[0]
              text_rect = text_surface.get_rect()
              if center:
                  text_rect.center = (x, y)
@@ -301,10 +498,24 @@ class TriviaGameGUI:
 
 
     def draw_list(self):
-        """Draws the entire linked list with nodes and arrows."""
-        current = self.linked_list.head
-        x = 100 # Initial horizontal position off-screen left
-        while current:
+        """Draws the visible part of the linked list with nodes and arrows.
+
+        Only the nodes inside [scroll_offset, scroll_offset + screen_width] (plus the
+        node just left of it, whose arrow may still show) are visited, starting from
+        node_at(first visible index) instead of head, so frame cost does not grow
+        with list length.
+        """
+        if self.linked_list.is_empty():
+            return
+        step = self.NODE_WIDTH + self.ARROW_LENGTH
+        # first index whose right edge is past the left culling buffer used by draw_node, minus one for its arrow
+        first_index = max(0, (self.scroll_offset - 50 - 100 - self.NODE_WIDTH) // step)
+        if first_index >= self.total_nodes:
+            return
+        current = self.linked_list.node_at(first_index)
+        x = 100 + first_index * step # Initial horizontal position off-screen left
+        right_edge = self.scroll_offset + self.screen_width + 50
+        while current and x < right_edge:
             adjusted_x = self.draw_node(current, x, self.NODE_Y_POSITION)
             if current.next:
                 next_node_x = x + self.NODE_WIDTH + self.ARROW_LENGTH
@@ -347,6 +558,8 @@ class TriviaGameGUI:
          self.draw_text("Trivia Trek Challenge", self.FONT_LARGE, self.DARK_GRAY, self.screen, self.screen_width // 2, 30, center_x=True)
          # Score
          self.draw_text(f"Score: {self.score}", self.FONT_LARGE, self.BLUE, self.screen, self.screen_width - 100, 30, center=True)
+         if self.loader is not None:
+             self.draw_text(f"Loading... {self.total_nodes} questions", self.FONT_SMALL, self.DARK_GRAY, self.screen, 20, 30)
 
 
          # --- FEEDBACK POSITION ADJUSTMENT ---
@@ -356,7 +569,7 @@ class TriviaGameGUI:
          feedback_y = feedback_area_top + (self.button_y - feedback_area_top) // 2 - 10 # Move up slightly more
 
          if self.feedback_timer > 0:
-             icon_surf = self.FONT_ICON.render(self.feedback_icon, True, self.feedback_color)
+             icon_surf = self.render_text(self.feedback_icon, self.FONT_ICON, self.feedback_color)[0]
              icon_rect = icon_surf.get_rect(centerx=self.screen_width // 2, centery=feedback_y - 10) # Icon above text
 
              # Draw text centered below the icon
@@ -364,10 +577,15 @@ class TriviaGameGUI:
                             self.screen_width // 2, feedback_y + 10, center_x=True)
 
              self.screen.blit(icon_surf, icon_rect)
-             self.feedback_timer -= 1
-         else:
-             self.feedback_message = ""
-             self.feedback_icon = ""
+
+    def tick_feedback(self):
+        """Counts the feedback timer down one frame, clearing the message when it runs out."""
+        if self.feedback_timer > 0:
+            self.feedback_timer -= 1
+            if self.feedback_timer == 0:
+                self.feedback_message = ""
+                self.feedback_icon = ""
+                self.mark_dirty(self.feedback_rect)
 
     def draw_scroll_indicators(self):
         """Draws fixed scroll indicators at the screen edges."""
@@ -401,16 +619,31 @@ class TriviaGameGUI:
 
         self.draw_text("Game Over!", self.FONT_XLARGE, self.YELLOW, self.screen, self.screen_width // 2, self.screen_height // 2 - 60, center=True)
         self.draw_text(f"Final Score: {self.score}", self.FONT_LARGE, self.WHITE, self.screen, self.screen_width // 2, self.screen_height // 2 + 10, center=True)
-        self.draw_text("Press 'R' to Restart or 'Q' to Quit", self.FONT_MEDIUM, self.LIGHT_GRAY, self.screen, self.screen_width // 2, self.screen_height // 2 + 70, center=True)
+        self.draw_text("Press 'R' to Restart, 'U' to Undo or 'Q' to Quit", self.FONT_MEDIUM, self.LIGHT_GRAY, self.screen, self.screen_width // 2, self.screen_height // 2 + 70, center=True)
+        if self.scores is not None:
+            self.draw_leaderboard(self.screen_height // 2 + 110)
+
+    def draw_leaderboard(self, top):
+        """Draws the score store's cached top scores (no database query) as a panel starting at y = top."""
+        rows = self.scores.leaderboard()
+        self.draw_text("Top Scores", self.FONT_LARGE, self.YELLOW, self.screen, self.screen_width // 2, top, center=True)
+        if not rows:
+            self.draw_text("No games saved yet.", self.FONT_MEDIUM, self.LIGHT_GRAY, self.screen, self.screen_width // 2, top + 30, center=True)
+        for rank, (player, score, _) in enumerate(rows, 1):
+            color = self.YELLOW if player == self.player else self.WHITE
+            self.draw_text(f"{rank}. {player}  {score}", self.FONT_MEDIUM, color, self.screen, self.screen_width // 2, top + 6 + rank * 24, center=True)
 
 
     def scroll_view(self, direction):
         """Scrolls the view left or right, respecting boundaries."""
+        previous_offset = self.scroll_offset
         self.scroll_offset += direction * self.SCROLL_SPEED
         self.scroll_offset = max(0, self.scroll_offset)
         list_width = self.total_nodes * (self.NODE_WIDTH + self.ARROW_LENGTH) - self.ARROW_LENGTH if self.total_nodes > 0 else 0
         max_scroll = max(0, list_width - self.screen_width + 100)
         self.scroll_offset = min(self.scroll_offset, max_scroll)
+        if self.scroll_offset != previous_offset:
+            self.mark_dirty(self.scroll_area_rect)
 
 
     def handle_action(self, action_type):
@@ -419,56 +652,112 @@ class TriviaGameGUI:
             return
 
         current_node = self.linked_list.current
-        correctness = current_node.is_correct
         nodes_before_action = self.total_nodes
 
         # --- Perform Action & Update State ---
-        if action_type == 'delete':
-            if not correctness:
-                self.score += 1
-                self.feedback_message = "Correct! Deleted wrong answer."
-                self.feedback_icon = "✅"
-                self.feedback_color = self.GREEN
-            else:
-                self.feedback_message = "Oops! Deleted correct answer."
-                self.feedback_icon = "❌"
-                self.feedback_color = self.RED
-            self.linked_list.delete_current_node()
-            self.total_nodes -= 1 # Update node count
-
-        elif action_type == 'next':
+        outcome, self.score = self.history.apply(self.linked_list, action_type, self.score) # logged for undo
+        if self.journal is not None:
+            self.journal.record(action_type, self.linked_list, self.score)
+
+        if outcome == CORRECT_DELETE:
+            self.feedback_message = "Correct! Deleted wrong answer."
+            self.feedback_icon = "✅"
+            self.feedback_color = self.GREEN
+        elif outcome == WRONG_DELETE:
+            self.feedback_message = "Oops! Deleted correct answer."
+            self.feedback_icon = "❌"
+            self.feedback_color = self.RED
+        elif outcome == SKIPPED:
             self.feedback_message = "Skipped to next question."
             self.feedback_icon = "⏭️"
             self.feedback_color = self.DARK_GRAY
-            self.linked_list.move_right()
-
-        elif action_type == 'confirm':
-            if correctness:
-                self.score += 1
-                self.feedback_message = "Correct! Confirmed right answer."
-                self.feedback_icon = "✅"
-                self.feedback_color = self.GREEN
-                self.linked_list.move_right()
-            else:
-                self.feedback_message = f"Incorrect! Answer was '{current_node.answer}'."
-                self.feedback_icon = "❌"
-                self.feedback_color = self.RED
-                self.linked_list.move_right()
+        elif outcome == CORRECT_CONFIRM:
+            self.feedback_message = "Correct! Confirmed right answer."
+            self.feedback_icon = "✅"
+            self.feedback_color = self.GREEN
+        elif outcome == WRONG_CONFIRM:
+            self.feedback_message = f"Incorrect! Answer was '{current_node.answer}'."
+            self.feedback_icon = "❌"
+            self.feedback_color = self.RED
 
         self.feedback_timer = 150 # Show feedback
+        self.mark_dirty(self.scroll_area_rect)
+        self.mark_dirty(self.score_rect)
+        self.mark_dirty(self.feedback_rect)
 
         # --- Post-Action Updates ---
         # Auto-scroll if the current node changed or if a node was deleted
         if self.linked_list.current != current_node or self.total_nodes < nodes_before_action:
              self.auto_scroll_to_current()
 
-        # --- Check for Game Over Condition ---
+        self.check_game_over(action_type)
+
+    def check_game_over(self, action_type):
+        """Ends the game once action_type has emptied the list or moved past its last question."""
         # Game ends if the list head becomes None (empty list)
-        if self.linked_list.head is None:
-            self.game_over = True
+        # (while the bank is still loading in the background, more questions may yet arrive)
+        if self.linked_list.head is None and self.loader is None:
+            self.end_game()
         # Or if the current pointer becomes None *after* a move action (meaning we moved off the end)
-        elif self.linked_list.current is None and self.linked_list.head is not None and action_type != 'delete':
-            self.game_over = True
+        elif self.linked_list.current is None and self.linked_list.head is not None and action_type != 'delete' and self.loader is None:
+            self.end_game()
+
+    def end_game(self):
+        """Switches to the game over screen; a finished game is no longer kept in the journal.
+
+        Undo from the game over screen snapshots the reopened game back into the journal.
+        """
+        self.game_over = True
+        if self.journal is not None:
+            self.journal.reset()
+        self.mark_dirty()
+
+    def record_score(self):
+        """Queues the game for the score store if it is finished (never waits on the disk).
+
+        Called when the game is left (restart or quit) rather than when it ends, since
+        undo can reopen a finished game and end it again with another score.
+        """
+        if self.scores is None or not self.game_over or self.question_template is None: # No bank, no game
+            return
+        self.scores.record(self.player, self.score, self.total_nodes)
+
+    def post_leaderboard_update(self):
+        """Called on the score store's writer thread: wakes the game loop to redraw the leaderboard."""
+        if pygame.display.get_init():
+            pygame.event.post(pygame.event.Event(LEADERBOARD_UPDATED))
+
+    def undo_action(self):
+        """Takes back the last action (also from the game over screen), restoring current and the score."""
+        score = self.history.undo(self.linked_list)
+        if score is None:
+            return
+        self.score = score
+        self.game_over = False
+        if self.journal is not None:
+            self.journal.snapshot(self.linked_list, self.score) # the journal only replays forward
+        self.feedback_message = "Undid last action."
+        self.feedback_icon = "↩️"
+        self.feedback_color = self.DARK_GRAY
+        self.feedback_timer = 150
+        self.auto_scroll_to_current()
+        self.mark_dirty()
+
+    def redo_action(self):
+        """Plays the last undone action again."""
+        score = self.history.redo(self.linked_list)
+        if score is None:
+            return
+        self.score = score
+        if self.journal is not None:
+            self.journal.snapshot(self.linked_list, self.score)
+        self.feedback_message = "Redid last action."
+        self.feedback_icon = "↪️"
+        self.feedback_color = self.DARK_GRAY
+        self.feedback_timer = 150
+        self.auto_scroll_to_current()
+        self.mark_dirty()
+        self.check_game_over(self.history.last_action())
 
 
     def auto_scroll_to_current(self):
@@ -478,12 +767,7 @@ class TriviaGameGUI:
                  self.scroll_offset = 0
              return
 
-        node_index = 0
-        temp = self.linked_list.head
-        while temp and temp != self.linked_list.current:
-            node_index += 1
-            temp = temp.next
-        if temp is None: return
+        node_index = self.linked_list.position_of(self.linked_list.current)
 
         target_center_x_on_screen = self.screen_width // 2
         node_center_x_abs = 100 + node_index * (self.NODE_WIDTH + self.ARROW_LENGTH) + self.NODE_WIDTH // 2
@@ -495,16 +779,30 @@ class TriviaGameGUI:
         self.scroll_offset = target_scroll_offset
 
 
-    def handle_input(self):
-        """Processes Pygame events."""
-        for event in pygame.event.get():
+    def handle_input(self, events=None):
+        """Processes Pygame events (the pending queue unless a list of events is given)."""
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == QUIT:
                 return False # Signal to exit game loop
 
+            if event.type == VIDEOEXPOSE or event.type == WINDOWEXPOSED:
+                self.mark_dirty() # Window contents were lost, repaint everything
+
+            if event.type == KEYDOWN and event.key == K_F3 and self.profiler is not None:
+                self.profiler.overlay_visible = not self.profiler.overlay_visible
+                self.mark_dirty()
+
+            if event.type == LEADERBOARD_UPDATED and self.game_over:
+                self.mark_dirty() # The game just saved has made it into the cached leaderboard
+
             if self.game_over:
                 if event.type == KEYDOWN:
                     if event.key == K_r:
-                        self.__init__(self.screen_width, self.screen_height) # Restart
+                        self.reset_game() # Restart
+                    elif event.key == K_u:
+                        self.undo_action() # Take back the move that ended the game
                     elif event.key == K_q:
                         return False # Quit
             else: # Input only handled if game is not over
@@ -525,45 +823,117 @@ class TriviaGameGUI:
                     elif event.key == K_1 or event.key == K_KP1: self.handle_action('delete')
                     elif event.key == K_2 or event.key == K_KP2: self.handle_action('next')
                     elif event.key == K_3 or event.key == K_KP3: self.handle_action('confirm')
+                    elif event.key == K_u: self.undo_action()
+                    elif event.key == K_y: self.redo_action()
         return True # Signal to continue game loop
 
 
     def run_game(self):
-        """Main game loop."""
+        """Main game loop.
+
+        Frames are only drawn when something marked a region dirty, and only those
+        regions are pushed with pygame.display.update. While the feedback message is
+        counting down the loop ticks at 60 FPS; otherwise it blocks in
+        pygame.event.wait so an idle game uses next to no CPU.
+        """
+        pygame.event.set_blocked(MOUSEMOTION) # Not used, and would wake the idle loop constantly
+        if not self.questions_loaded:
+            if self.journal is not None and self.journal.has_saved_game():
+                self.load_questions() # Resuming needs the whole bank before the first move
+                self.resume_journal()
+            else:
+                self.start_background_load()
         running = True
         while running:
-            running = self.handle_input()
+            overlay_visible = self.profiler is not None and self.profiler.overlay_visible
+            if self.dirty_rects or self.feedback_timer > 0 or overlay_visible or self.loader is not None:
+                events = pygame.event.get()
+            else:
+                events = [pygame.event.wait()] + pygame.event.get()
+            if self.profiler is not None:
+                self.profiler.start_frame()
+            running = self.handle_input(events)
             if not running: break
 
+            if self.loader is not None:
+                self.poll_background_load()
+
             # Check for game over if list started empty (or became empty outside handle_action)
-            if self.total_nodes == 0 and not self.game_over and self.linked_list.head is None:
+            if self.total_nodes == 0 and not self.game_over and self.linked_list.head is None and self.loader is None:
                  self.game_over = True
+                 self.mark_dirty()
                  if not self.feedback_message: # Avoid overwriting load error messages
                       self.feedback_message = "No questions available."
                       self.feedback_icon = "🤷"
                       self.feedback_color = self.DARK_GRAY
                       self.feedback_timer = 300
 
-            # Draw frame
-            self.draw_gradient_background()
-            if not self.game_over:
-                 self.draw_list()
-                 self.draw_header_footer() # Draws feedback in correct spot now
-                 self.draw_buttons()
-                 self.draw_scroll_indicators()
-            else:
-                 self.draw_game_over()
+            self.tick_feedback()
+            if overlay_visible:
+                self.mark_dirty(self.profiler_overlay_rect)
 
-            pygame.display.flip()
+            if self.dirty_rects:
+                self.draw_frame()
+                self.update_display(self.dirty_rects)
+                self.dirty_rects = []
+            if self.profiler is not None:
+                self.profiler.end_frame()
             self.clock.tick(60)
 
+        if self.profiler is not None and self.trace_path:
+            self.profiler.dump_trace(self.trace_path)
+        if self.journal is not None:
+            self.journal.close()
+        if self.scores is not None:
+            self.record_score()
+            import sqlite3 # already loaded by the score store
+            try:
+                self.scores.close() # Commits the games still queued
+            except sqlite3.Error as e:
+                print(f"Warning: Could not save scores: {e}")
         pygame.quit()
         sys.exit()
 
+    def update_display(self, rects):
+        """Pushes the given screen regions to the display."""
+        pygame.display.update(rects)
+
+    def draw_frame(self):
+        """Draws one complete frame to the screen surface."""
+        self.draw_gradient_background()
+        if not self.game_over:
+             self.draw_list()
+             self.draw_header_footer() # Draws feedback in correct spot now
+             self.draw_buttons()
+             self.draw_scroll_indicators()
+        else:
+             self.draw_game_over()
+        if self.profiler is not None and self.profiler.overlay_visible:
+             self.draw_profiler_overlay()
+
+    def draw_profiler_overlay(self):
+        """Draws the profiler's rolling p50/p95/p99 per phase in the top-left corner."""
+        summary = self.profiler.summary()
+        line_height = self.FONT_SMALL.get_linesize()
+        self.profiler_overlay_rect.height = line_height * (len(summary) + 1) + 2 * self.NODE_PADDING
+        overlay = pygame.Surface(self.profiler_overlay_rect.size, pygame.SRCALPHA)
+        overlay.fill((*self.BLACK, 180))
+        self.screen.blit(overlay, self.profiler_overlay_rect.topleft)
+
+        x = self.profiler_overlay_rect.left + self.NODE_PADDING
+        y = self.profiler_overlay_rect.top + self.NODE_PADDING
+        self.draw_text(f"{'phase (ms)':26}{'p50':>8}{'p95':>8}{'p99':>8}", self.FONT_SMALL, self.YELLOW, self.screen, x, y)
+        for name, (p50, p95, p99) in summary.items():
+            y += line_height
+            self.draw_text(f"{name:26}{p50 * 1000:8.2f}{p95 * 1000:8.2f}{p99 * 1000:8.2f}", self.FONT_SMALL, self.WHITE, self.screen, x, y)
+
 # --- Main Execution ---
 if __name__ == '__main__':
     print("Running Trivia Trek GUI directly (Final Version)...")
-    game_gui = TriviaGameGUI()
+    if '--profile' in sys.argv: # F3 shows the frame profiler, trace.json is written on quit
+        game_gui = TriviaGameGUI(profiler=FrameProfiler(), trace_path="trace.json", defer_load=True)
+    else:
+        game_gui = TriviaGameGUI(defer_load=True)
     game_gui.run_game()
 
 # --- END OF FILE ui/gui.py ---
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""Asyncio trivia server: many concurrent TriviaSession games over TCP or a Unix socket.
+
+Protocol (one line per message, UTF-8):
+    client -> server : a command word
+        delete | next | confirm   play an action (1 / 2 / 3 also work, as in the CLI)
+        show                      resend the current question
+        quit                      end the session
+    server -> client : one JSON object per line
+        {"type": "question", "question": ..., "answer": ..., "score": ...}
+        {"type": "result", "outcome": ..., "points": ..., "score": ...}
+        {"type": "game_over", "score": ...}
+        {"type": "error", "message": ...}
+
+After every action the server sends a "result" line followed by either the next
+"question" or "game_over".
+"""
+import argparse
+import asyncio
+import json
+
+from core.game import TriviaSession, POINTS, ACTION_TOKENS
+from core.shared_bank import SharedBank, BankView
+
+
+class TriviaServer:
+    """
+    Hosts one TriviaSession per connected client on a single event loop.
+
+    The question file is parsed once into a SharedBank; each session plays
+    through its own BankView (a cursor plus a deletion bitset), so sessions do
+    not copy the bank. Game rules live in core.game, so this class only
+    translates protocol lines to actions and outcomes to JSON lines.
+    """
+    def __init__(self, bank: SharedBank) -> None:
+        self.bank = bank
+        self.sessions = set()
+        self.server = None
+
+    def new_session(self) -> TriviaSession:
+        """Creates a fresh game over the shared question bank."""
+        return TriviaSession(BankView(self.bank))
+
+    def question_message(self, session: TriviaSession) -> dict:
+        """Returns the message describing the session's current state."""
+        current = session.linked_list.current
+        if current is None:
+            return {'type': 'game_over', 'score': session.score}
+        return {'type': 'question', 'question': current.question, 'answer': current.answer, 'score': session.score}
+
+    def handle_line(self, session: TriviaSession, line: str) -> list:
+        """Turns one client command into the messages to send back.
+
+        Returns:
+            - list: Messages (dicts) to send; None in the list means close the connection.
+        """
+        command = line.strip().lower()
+        if command == 'quit':
+            return [{'type': 'game_over', 'score': session.score}, None]
+        if command == 'show':
+            return [self.question_message(session)]
+        action = ACTION_TOKENS.get(command)
+        if action is None:
+            return [{'type': 'error', 'message': f"unknown command: {command}"}]
+        if session.is_over():
+            return [{'type': 'game_over', 'score': session.score}]
+        outcome = session.apply(action)
+        result = {'type': 'result', 'outcome': outcome, 'points': POINTS[outcome], 'score': session.score}
+        return [result, self.question_message(session)]
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Runs one client's session until it quits or disconnects."""
+        session = self.new_session()
+        self.sessions.add(session)
+        try:
+            writer.write(self.encode(self.question_message(session)))
+            await writer.drain()
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                messages = self.handle_line(session, line.decode('utf-8', errors='replace'))
+                closing = None in messages
+                writer.write(b''.join(self.encode(message) for message in messages if message is not None))
+                await writer.drain()
+                if closing:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions.discard(session)
+            writer.close()
+
+    @staticmethod
+    def encode(message: dict) -> bytes:
+        return (json.dumps(message, ensure_ascii=False) + '\n').encode('utf-8')
+
+    async def start(self, host: str = '127.0.0.1', port: int = 8765, unix_path: str = None) -> None:
+        """Starts listening on a Unix socket if unix_path is given, otherwise on host:port."""
+        if unix_path:
+            self.server = await asyncio.start_unix_server(self.handle_client, path=unix_path)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, host, port, backlog=4096)
+
+    async def serve_forever(self) -> None:
+        async with self.server:
+            await self.server.serve_forever()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Serve trivia games to many players over a socket.")
+    parser.add_argument('--questions', default='data/questions.json', help="question file (JSON array or NDJSON)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="listen on this Unix socket path instead of TCP")
+    args = parser.parse_args(argv)
+
+    server = TriviaServer(SharedBank.from_file(args.questions))
+
+    async def run():
+        await server.start(args.host, args.port, args.unix)
+        print(f"Trivia server listening on {args.unix or f'{args.host}:{args.port}'}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()